@@ -0,0 +1,3 @@
+# Benchmarks for the ETL pipeline and the dashboard.
+# Run them from the repository root, e.g. `python -m benchmarks.bench_fetch`.
+# `python -m benchmarks.suite --output results.json` runs every stage and records the results as JSON.
@@ -0,0 +1,85 @@
+"""
+Checks the conditional-request cache over repeated refreshes.
+
+Runs the ETL several times against a local stand-in server. The first run
+downloads every source in full; later runs send conditional GETs and should be
+answered with 304s, reusing the cached parsed payloads. Before the last run one
+source is changed upstream, which must show up as exactly one miss. Every run's
+request, 304, cache hit and download counts and its rows are checked, and the
+run exits non-zero if one of them is off.
+
+Usage:
+    python -m benchmarks.bench_cache [--sources 20] [--models-per-source 50]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.standin_server import StandInServer
+from benchmarks.synthetic import BENCHMARK_NAMES, model_names, openvlm_payload, write_models_csv
+from fetcher import FetchPolicy
+from process_benchmarks import fetch_and_process_benchmarks
+
+
+# Every source lives on one local host, so the per-host rate limit would dominate the timings
+UNTHROTTLED = FetchPolicy(requests_per_second=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sources', type=int, default=20)
+    parser.add_argument('--models-per-source', type=int, default=50)
+    args = parser.parse_args()
+
+    names = model_names(args.sources * args.models_per_source)
+    groups = [names[i::args.sources] for i in range(args.sources)]
+    routes = {f"/source-{i}.json": (openvlm_payload(group, seed=i), 'application/json')
+              for i, group in enumerate(groups)}
+
+    with StandInServer(routes) as server, tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_models_csv(tmp / 'models.csv', [(name, server.url(f"/source-{i % args.sources}.json"))
+                                              for i, name in enumerate(names)])
+
+        print(f"sources={args.sources} models={len(names)}")
+        failed = []
+        for run in range(1, 4):
+            if run == 3:
+                # Change one source upstream; only that one should be downloaded again
+                routes['/source-0.json'] = (openvlm_payload(groups[0], seed=1000), 'application/json')
+
+            requests_before = server.request_count
+            bytes_before, not_modified_before = server.bytes_sent, server.not_modified_count
+            start = time.perf_counter()
+            report = fetch_and_process_benchmarks(str(tmp / 'models.csv'), str(tmp / 'scores.csv'),
+                                                  cache_dir=str(tmp / 'cache'), fetch_policy=UNTHROTTLED)
+            elapsed = time.perf_counter() - start
+            counts = {
+                'requests': server.request_count - requests_before,
+                'not modified': server.not_modified_count - not_modified_before,
+                'hits': report.counters.get('cache_hits', 0),
+                'downloads': report.counters.get('downloads', 0),
+                'rows': report.counters.get('rows_emitted', 0),
+            }
+            downloads = {1: args.sources, 2: 0, 3: 1}[run]
+            # Every run emits every model's scores, whether they came from the cache or a download
+            expected = {'requests': args.sources, 'not modified': args.sources - downloads,
+                        'hits': args.sources - downloads, 'downloads': downloads,
+                        'rows': len(names) * len(BENCHMARK_NAMES)}
+            mismatches = [f"{name} {counts[name]} != {expected[name]}" for name in counts
+                          if counts[name] != expected[name]]
+            print(f"  run {run}: {elapsed:.2f}s, {server.bytes_sent - bytes_before:,} bytes downloaded, "
+                  f"{counts['not modified']} not modified -- "
+                  f"response cache: {counts['hits']} hits, {counts['downloads']} downloads, {counts['rows']:,} rows  "
+                  f"[{'; '.join(mismatches) or 'ok'}]")
+            if mismatches:
+                failed.append(f"run {run}")
+
+    if failed:
+        sys.exit(f"The response cache did not behave as expected in {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Measures the Metric Visualiser over a long session: per-rerun pyplot figures versus cached charts.
+
+Replays `--reruns` dashboard reruns, each picking a filter view and a metric,
+in a fresh process per path. The legacy path is what dashboard.py did: a new
+pyplot figure per rerun, saved to PNG as st.pyplot does, and never closed. The
+cached path goes through leaderboard_chart.render_metric_chart. Reports the run
+time and how much the process's peak RSS grew.
+
+Usage:
+    python -m benchmarks.bench_chart [--reruns 20] [--rows 1000]
+"""
+import argparse
+
+from benchmarks.measure import run_isolated
+
+SETUP = '''
+import io, random
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import seaborn as sns
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_chart import CHART_LABELS, PNG_OPTIONS, chart_cache_info, render_metric_chart
+from leaderboard_index import LeaderboardIndex
+
+df = leaderboard_frame({rows})
+index = LeaderboardIndex(df)
+rng = random.Random(0)
+filters = [(origin, model_type) for origin in [None] + index.values('origin') for model_type in (None, 'Open Source')]
+views = [(rng.choice(filters), rng.choice(list(CHART_LABELS))) for _ in range({reruns})]
+tops = [(df.iloc[index.rows(view, metric)[:12]], metric) for view, metric in views]
+
+def legacy(top_df, metric):
+    sns.set(style="darkgrid")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    sns.barplot(data=top_df, x="model_name", y=metric, hue="model_name",
+                palette=sns.color_palette("Blues_r", len(top_df)), legend=False, ax=ax)
+    ax.tick_params(axis='x', labelsize=10, labelrotation=40)
+    for i, value in enumerate(top_df[metric]):
+        ax.text(i, value + 0.5, f"{{value:.2f}}", color='black', va='center', fontsize=9)
+    ax.set_title(f"{{CHART_LABELS[metric]}} – Top 12 Models", fontsize=16, fontweight='bold')
+    fig.savefig(io.BytesIO(), **PNG_OPTIONS)
+'''
+
+LEGACY = '''
+for top_df, metric in tops:
+    legacy(top_df, metric)
+print("open figures:", len(plt.get_fignums()))
+'''
+
+CACHED = '''
+for top_df, metric in tops:
+    render_metric_chart(top_df, metric)
+print("open figures:", len(plt.get_fignums()), "|", chart_cache_info()["Matplotlib"])
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--reruns', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=1000, help="Models in the leaderboard.")
+    args = parser.parse_args()
+
+    setup = SETUP.format(rows=args.rows, reruns=args.reruns)
+    print(f"reruns={args.reruns} rows={args.rows}")
+    for label, stmt in (('pyplot per rerun', LEGACY), ('cached chart', CACHED)):
+        result = run_isolated(setup, stmt)
+        print(f"  {label:<17} {result['seconds']:7.2f}s  "
+              f"({result['seconds'] / args.reruns * 1000:6.1f} ms/rerun)  "
+              f"peak RSS +{result['delta_rss_mb']:.0f} MB  {result['output'].strip()}")
+
+
+if __name__ == '__main__':
+    main()
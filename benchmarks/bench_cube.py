@@ -0,0 +1,66 @@
+"""
+Compares the KPI cards and group-by summaries computed from the frame with the aggregate cube.
+
+For leaderboards of growing size, times the three KPI values the dashboard
+shows and a per-origin breakdown, first over the full frame as before and then
+rolled up from the cube (bypassing its LRU cache, so every call does the
+roll-up). The cube's build time, paid once per version of the data, is shown
+too, and its answers are checked against the frame.
+
+Usage:
+    python -m benchmarks.bench_cube [--rows 1000 10000 100000 1000000] [--repeat 20]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_cube import AggregateCube
+from leaderboard_data import as_snapshot
+
+
+def _per_call(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def _frame_kpis(df):
+    return df['model_name'].nunique(), df['performance_score'].max(), df['updated_at'].max()
+
+
+def _cube_kpis(cube):
+    totals = cube._summary().iloc[0]
+    return totals['models'], totals['performance_score_max'], totals['updated_at']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    pd.options.mode.copy_on_write = True
+    print(f"{'rows':>10} {'build':>9} {'KPIs: frame':>12} {'cube':>9} {'by origin: frame':>17} {'cube':>9}  same")
+    for rows in args.rows:
+        df = as_snapshot(leaderboard_frame(rows))
+        start = time.perf_counter()
+        cube = AggregateCube(df)
+        build = time.perf_counter() - start
+
+        frame_kpis, expected = _per_call(lambda: _frame_kpis(df), args.repeat)
+        cube_kpis, actual = _per_call(lambda: _cube_kpis(cube), args.repeat)
+        frame_origin, expected_origin = _per_call(
+            lambda: df.groupby(df['origin'].astype(object))[['blended_price', 'speed_tokens_s']].mean(), args.repeat)
+        cube_origin, actual_origin = _per_call(lambda: cube._summary(('origin',)), args.repeat)
+        same = (tuple(expected) == tuple(actual) and np.allclose(
+            expected_origin.to_numpy(), actual_origin[['blended_price_mean', 'speed_tokens_s_mean']].to_numpy()))
+        print(f"{rows:>10,} {build * 1000:7.1f}ms {frame_kpis * 1000:10.2f}ms {cube_kpis * 1000:7.2f}ms "
+              f"{frame_origin * 1000:15.2f}ms {cube_origin * 1000:7.2f}ms  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Times the headless static export: a cold render, a re-run on unchanged data and a re-run after one model changed.
+
+Exports a synthetic leaderboard into a temporary directory, first with every
+view and chart rendered in this process and then on a process pool, and
+shows how many views the two re-runs render again. On a machine with a
+single CPU the pool can't be faster than the in-process render.
+
+Usage:
+    python -m benchmarks.bench_export [--rows 10000] [--workers 4] [--html-rows 250]
+"""
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_data import as_snapshot
+from static_export import DEFAULT_EXPORT_WORKERS, DEFAULT_HTML_ROWS, export_leaderboard
+
+
+def _timed_export(df, out_dir, **kwargs):
+    start = time.perf_counter()
+    report = export_leaderboard(df, out_dir, **kwargs)
+    return time.perf_counter() - start, report.counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--workers', type=int, default=max(DEFAULT_EXPORT_WORKERS, 2))
+    parser.add_argument('--html-rows', type=int, default=DEFAULT_HTML_ROWS)
+    args = parser.parse_args()
+
+    pd.options.mode.copy_on_write = True
+    df = as_snapshot(leaderboard_frame(args.rows))
+    changed = df.copy()
+    changed.loc[changed.index[0], 'performance_score'] += 0.1
+
+    print(f"{'run':<28} {'seconds':>8} {'views':>6} {'skipped':>8} {'charts':>7}")
+    with tempfile.TemporaryDirectory() as in_process_dir, tempfile.TemporaryDirectory() as pool_dir:
+        # The pool goes first: workers forked after the in-process run would find its charts cached
+        runs = [
+            (f"cold, {args.workers} workers", df, pool_dir, args.workers),
+            ("cold, in process", df, in_process_dir, 1),
+            ("unchanged data", df, pool_dir, args.workers),
+            ("one model changed", changed, pool_dir, args.workers),
+        ]
+        for label, frame, out_dir, workers in runs:
+            seconds, counters = _timed_export(frame, out_dir, workers=workers, html_rows=args.html_rows)
+            print(f"{label:<28} {seconds:8.2f} {counters.get('views_rendered', 0):>6} "
+                  f"{counters['views_skipped']:>8} {counters.get('charts_rendered', 0):>7}")
+
+
+if __name__ == '__main__':
+    main()
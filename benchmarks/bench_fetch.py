@@ -0,0 +1,76 @@
+"""
+Compares the serial fetch loop with the concurrent fetch stage.
+
+Models are spread over `--sources` slow endpoints on a local stand-in server, so
+the serial run takes roughly (sources × delay) while the concurrent run is
+bounded by the worker count. Both runs must write the same score rows, and each
+distinct source must be requested once per run however many models share it.
+
+Usage:
+    python -m benchmarks.bench_fetch [--models 40] [--sources 40] [--delay 0.1] [--workers 8]
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.standin_server import StandInServer
+from benchmarks.synthetic import model_names, openvlm_payload, write_models_csv
+from fetcher import FetchPolicy
+from process_benchmarks import fetch_and_process_benchmarks
+
+
+# Every source lives on one local host, so the per-host rate limit would dominate the timings
+UNTHROTTLED = FetchPolicy(requests_per_second=None)
+
+
+def _timed_run(models_csv, scores_csv, **kwargs) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fetch_and_process_benchmarks(str(models_csv), str(scores_csv), cache_dir=None, incremental=False,
+                                     fetch_policy=UNTHROTTLED, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--models', type=int, default=40)
+    parser.add_argument('--sources', type=int, default=None, help="Distinct URLs shared by the models (default: one per model).")
+    parser.add_argument('--delay', type=float, default=0.1, help="Seconds each response is delayed by.")
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    names = model_names(args.models)
+    n_sources = min(args.sources or args.models, args.models)
+    groups = [names[i::n_sources] for i in range(n_sources)]
+    routes = {f"/source-{i}.json": (openvlm_payload(group, seed=i), 'application/json')
+              for i, group in enumerate(groups)}
+
+    with StandInServer(routes, delay=args.delay) as server, tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_models_csv(tmp / 'models.csv', [(name, server.url(f"/source-{i % n_sources}.json"))
+                                              for i, name in enumerate(names)])
+
+        serial = _timed_run(tmp / 'models.csv', tmp / 'serial.csv', max_workers=1, per_host_limit=1)
+        requests_per_run = server.request_count
+        concurrent = _timed_run(tmp / 'models.csv', tmp / 'concurrent.csv',
+                                max_workers=args.workers, per_host_limit=args.workers)
+
+        columns = ['model_name', 'benchmark_name', 'score', 'param_B', 'country']
+        serial_rows = pd.read_csv(tmp / 'serial.csv')[columns]
+        concurrent_rows = pd.read_csv(tmp / 'concurrent.csv')[columns]
+        same_rows = serial_rows.equals(concurrent_rows)
+
+    print(f"models={args.models} sources={n_sources} delay={args.delay}s workers={args.workers}")
+    print(f"  requests per run: {requests_per_run}")
+    print(f"  serial:     {serial:.2f}s")
+    print(f"  concurrent: {concurrent:.2f}s  ({serial / concurrent:.1f}x faster)")
+    print(f"  identical score rows: {same_rows}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Micro-benchmark: indexed filter/sort lookups versus copying, masking and sorting the frame.
+
+Replays a session of dashboard reruns over a synthetic leaderboard, each picking
+an (origin, type, sort_by) view. The original path copies the frame, masks it
+and sorts it on every rerun; the indexed path answers from LeaderboardIndex,
+whose LRU cache makes a repeated view a lookup. Both must select the same rows
+in the same order.
+
+Usage:
+    python -m benchmarks.bench_filter [--rows 100000] [--reruns 500]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_index import SORT_ASCENDING, LeaderboardIndex
+
+
+def naive_view(df, origin, model_type, sort_by):
+    """The filter and sort dashboard.py ran on every rerun before the index."""
+    filtered_df = df.copy()
+    if origin is not None:
+        filtered_df = filtered_df[filtered_df['origin'] == origin]
+    if model_type is not None:
+        filtered_df = filtered_df[filtered_df['type'] == model_type]
+    return filtered_df.sort_values(by=sort_by, ascending=SORT_ASCENDING[sort_by], kind='stable')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000, help="Models in the leaderboard.")
+    parser.add_argument('--reruns', type=int, default=500, help="Reruns in the replayed session.")
+    args = parser.parse_args()
+
+    df = leaderboard_frame(args.rows)
+    rng = random.Random(0)
+    origins = [None] + list(df['origin'].unique())
+    types = [None, 'Open Source', 'Proprietary']
+    views = [(rng.choice(origins), rng.choice(types), rng.choice(list(SORT_ASCENDING))) for _ in range(args.reruns)]
+
+    start = time.perf_counter()
+    expected = [naive_view(df, *view).index for view in views]
+    naive_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = LeaderboardIndex(df)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [df.index[index.rows(view[:2], view[2])] for view in views]
+    indexed_s = time.perf_counter() - start
+
+    info = index.rows.cache_info()
+    print(f"rows={args.rows:,} reruns={args.reruns} distinct views={len(set(views))}")
+    print(f"  copy + mask + sort: {naive_s * 1000:8.1f} ms  ({naive_s / args.reruns * 1000:.2f} ms/rerun)")
+    print(f"  index build:        {build_s * 1000:8.1f} ms  (once per loaded frame)")
+    print(f"  indexed lookups:    {indexed_s * 1000:8.1f} ms  ({indexed_s / args.reruns * 1000:.3f} ms/rerun, "
+          f"{info.hits} cache hits, {info.misses} misses)")
+    print(f"  identical views: {all(a.equals(b) for a, b in zip(expected, actual))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Times Pareto frontiers and budget-constrained queries over the leaderboard.
+
+For leaderboards of growing size, times pareto_mask on two to four objectives,
+the frontier of the full view through FrontierIndex, and a "best score under
+$X per 1M tokens" query, uncached and then from the index's LRU cache. For the
+smaller sizes the frontier is checked against the pairwise definition.
+
+As in the real data, some models have no price or speed, including the top
+scorer, whose missing price must not drop it from the frontier.
+
+Usage:
+    python -m benchmarks.bench_frontier [--rows 1000 10000 100000 1000000] [--check-rows 2000] [--missing 0.1]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_data import as_snapshot
+from leaderboard_frontier import FRONTIER_OBJECTIVES, FrontierIndex, pareto_mask
+from leaderboard_index import LeaderboardIndex
+
+
+def _naive_mask(values: np.ndarray) -> np.ndarray:
+    """Pairwise definition, O(n^2): a row is kept unless some row is >= everywhere and > somewhere."""
+    at_least = (values[:, None, :] >= values[None, :, :]).all(axis=2)
+    better = (values[:, None, :] > values[None, :, :]).any(axis=2)
+    return ~(at_least & better).any(axis=0)
+
+
+def _with_missing_metrics(df, share: float, seed: int = 0):
+    """Blanks the price and speed of a random `share` of models, and the price of the top scorer."""
+    rng = np.random.default_rng(seed)
+    df = df.astype({'speed_tokens_s': float})
+    for column in ('blended_price', 'speed_tokens_s'):
+        df.loc[rng.random(len(df)) < share, column] = np.nan
+    df.loc[df['performance_score'].idxmax(), 'blended_price'] = np.nan
+    return df
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--check-rows', type=int, default=2_000,
+                        help="Largest size checked against the O(n^2) definition")
+    parser.add_argument('--missing', type=float, default=0.1, help="Share of models without a price, and without a speed")
+    args = parser.parse_args()
+
+    pd.options.mode.copy_on_write = True
+    budget = (('blended_price', 1.0),)
+    print(f"{'rows':>10} {'2 obj':>9} {'3 obj':>9} {'4 obj':>9} {'frontier':>9} {'size':>6} "
+          f"{'best under $1':>14} {'cached':>9}  same")
+    for rows in args.rows:
+        df = _with_missing_metrics(as_snapshot(leaderboard_frame(rows)), args.missing)
+        start = time.perf_counter()
+        frontier = FrontierIndex(LeaderboardIndex(df))
+        build = time.perf_counter() - start
+
+        sweeps, same = [], True
+        for n_objectives in (2, 3, 4):
+            values = frontier._values[:, :n_objectives]
+            elapsed, mask = _timed(lambda: pareto_mask(values))
+            sweeps.append(elapsed)
+            if rows <= args.check_rows:
+                same &= bool((mask == _naive_mask(values)).all())
+
+        full, mask = _timed(lambda: frontier.frontier_mask((None, None)))
+        uncached, top = _timed(lambda: frontier.best_under((None, None), budget))
+        cached, again = _timed(lambda: frontier.best_under((None, None), budget))
+        expected = df[df['blended_price'] <= 1.0].nlargest(len(top), 'performance_score')['performance_score']
+        same &= (np.array_equal(df['performance_score'].to_numpy()[top], expected.to_numpy())
+                 and np.array_equal(again, top))
+        print(f"{rows:>10,} " + " ".join(f"{elapsed * 1000:7.1f}ms" for elapsed in sweeps) +
+              f" {full * 1000:7.1f}ms {int(mask.sum()):>6} {uncached * 1000:12.2f}ms {cached * 1e6:7.1f}us"
+              f"  {same if rows <= args.check_rows else '-'}")
+    print(f"Objectives: {', '.join(FRONTIER_OBJECTIVES)}; last index build took {build * 1000:.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures the score history over a simulated stretch of nightly runs.
+
+Appends one synthetic run per night, in which a small share of the scores
+change, and compares the size on disk with keeping a full copy of scores.csv
+per night. It then times "leaderboard as of" queries at random dates and
+"score trend" queries for random models, each checked against a replay of the
+nightly tables in memory.
+
+Usage:
+    python -m benchmarks.bench_history [--nights 365] [--rows 20000] [--change-rate 0.01]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import score_table
+from score_history import ScoreHistory
+from score_store import KEY_COLUMNS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--nights', type=int, default=365)
+    parser.add_argument('--rows', type=int, default=20_000, help="Scores per run.")
+    parser.add_argument('--benchmarks', type=int, default=10)
+    parser.add_argument('--change-rate', type=float, default=0.01, help="Share of the scores that change per night.")
+    parser.add_argument('--queries', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scores = score_table(args.rows, n_benchmarks=args.benchmarks)
+    nights = pd.date_range('2025-01-01T02:00:00Z', periods=args.nights, freq='D')
+    snapshots = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = ScoreHistory(Path(tmp) / 'history')
+        csv_bytes = 0
+        append_seconds = []
+        for night in nights:
+            changed = rng.random(len(scores)) < args.change_rate
+            scores.loc[changed, 'score'] = rng.uniform(20, 90, int(changed.sum())).round(1)
+            snapshots[night] = scores['score'].to_numpy().copy()
+            csv_bytes += len(scores.to_csv(index=False).encode())
+            start = time.perf_counter()
+            history.append(scores, night)
+            append_seconds.append(time.perf_counter() - start)
+        history_bytes = sum(path.stat().st_size for path in (Path(tmp) / 'history').iterdir())
+
+        print(f"nights={args.nights} scores per run={args.rows:,} change rate={args.change_rate:.1%}")
+        print(f"  append: median {statistics.median(append_seconds) * 1000:.0f} ms, "
+              f"max {max(append_seconds) * 1000:.0f} ms per night")
+        print(f"  on disk: {history_bytes / 1e6:.1f} MB history vs {csv_bytes / 1e6:.1f} MB of nightly CSV copies "
+              f"({csv_bytes / history_bytes:.0f}x smaller)")
+
+        reopened = ScoreHistory(Path(tmp) / 'history')
+        keys = scores[KEY_COLUMNS]
+        as_of_seconds, correct = [], True
+        for night in rng.choice(nights, args.queries):
+            when = night + pd.Timedelta(hours=12)
+            start = time.perf_counter()
+            state = reopened.as_of(when)
+            as_of_seconds.append(time.perf_counter() - start)
+            expected = keys.assign(score=snapshots[night]).sort_values(KEY_COLUMNS, ignore_index=True)
+            correct &= np.array_equal(state['score'].to_numpy(), expected['score'].to_numpy())
+        print(f"  as_of: median {statistics.median(as_of_seconds) * 1000:.0f} ms, matches the replay: {correct}")
+
+        trend_seconds, correct = [], True
+        for model in rng.choice(scores['model_name'].unique(), args.queries):
+            start = time.perf_counter()
+            trend = reopened.trend(model)
+            trend_seconds.append(time.perf_counter() - start)
+            rows = np.flatnonzero((scores['model_name'] == model).to_numpy())
+            series = np.array([snapshots[night][rows] for night in nights])
+            changes = int((series[1:] != series[:-1]).sum()) + len(rows)
+            correct &= len(trend) == changes
+        print(f"  trend: median {statistics.median(trend_seconds) * 1000:.0f} ms, matches the replay: {correct}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares streaming JSON extraction with decoding the whole leaderboard document.
+
+Writes an OpenVLM.json-style document of tens of megabytes, then extracts every
+(model_key, benchmark_name, Overall) tuple twice: with json.load over the whole
+file, and with json_stream.iter_overall_scores over 64 KiB chunks. Reports time
+and the peak Python heap of each, and checks both produce the same tuples.
+
+Usage:
+    python -m benchmarks.bench_json_stream [--models 3000] [--benchmarks 30] [--extra-fields 20]
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.synthetic import model_names, openvlm_payload
+from fetcher import CHUNK_SIZE
+from json_stream import iter_overall_scores
+
+
+def full_decode(path: Path) -> list:
+    """Extraction the way the ETL did it before streaming: decode everything, then walk it."""
+    with open(path, 'rb') as f:
+        data = json.load(f)
+    return [(model_key, benchmark_name, scores['Overall'])
+            for model_key, benchmarks in data['results'].items()
+            for benchmark_name, scores in benchmarks.items()
+            if isinstance(scores, dict) and 'Overall' in scores]
+
+
+def streamed(path: Path) -> list:
+    def chunks():
+        with open(path, 'rb') as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield chunk
+
+    return list(iter_overall_scores(chunks()))
+
+
+def _measure(func, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = func(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--models', type=int, default=3000)
+    parser.add_argument('--benchmarks', type=int, default=30)
+    parser.add_argument('--extra-fields', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'OpenVLM.json'
+        path.write_bytes(openvlm_payload(model_names(args.models), n_benchmarks=args.benchmarks,
+                                         extra_fields=args.extra_fields))
+        print(f"document: {path.stat().st_size / 1e6:.1f} MB, {args.models} models x {args.benchmarks} benchmarks")
+
+        expected, full_s, full_peak = _measure(full_decode, path)
+        actual, stream_s, stream_peak = _measure(streamed, path)
+
+    print(f"  json.load:  {full_s:.2f}s, peak heap {full_peak / 1e6:7.1f} MB")
+    print(f"  streaming:  {stream_s:.2f}s, peak heap {stream_peak / 1e6:7.1f} MB  (incl. {len(actual):,} output tuples)")
+    print(f"  identical tuples: {expected == actual}")
+
+
+if __name__ == '__main__':
+    main()
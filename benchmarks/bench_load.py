@@ -0,0 +1,82 @@
+"""
+Measures loading the dashboard's leaderboard from the score store.
+
+Writes a synthetic long-format scores.csv, then times in fresh processes: a
+plain pandas loader (read_csv with parsed dates, then pivot_table), the first
+load_leaderboard call, repeated calls on the unchanged file, and the call
+after the ETL appended to the file. Each case reports wall time and the growth
+of peak RSS. The pivoted scores are checked against pivot_table first.
+
+Usage:
+    python -m benchmarks.bench_load [--rows 1000000] [--benchmarks 50] [--calls 1000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.measure import run_isolated
+from benchmarks.synthetic import score_table
+from leaderboard_data import read_leaderboard
+
+PANDAS_LOADER = '''
+scores = pd.read_csv({path!r}, parse_dates=['updated_at'])
+wide = scores.pivot_table(index='model_name', columns='benchmark_name', values='score', aggfunc='last')
+'''
+
+
+def check_matches_pivot_table(path: Path):
+    scores = pd.read_csv(path)
+    expected = scores.pivot_table(index='model_name', columns='benchmark_name', values='score', aggfunc='last')
+    df = read_leaderboard(path)
+    # Model names are Arrow strings in the snapshot, so the expected frames are aligned on plain labels
+    models = df['model_name'].astype(object).to_numpy()
+    assert np.allclose(df[expected.columns].to_numpy(), expected.reindex(models).to_numpy(), equal_nan=True)
+    latest = pd.to_datetime(scores.groupby('model_name')['updated_at'].max()).dt.tz_convert(None)
+    assert (df['updated_at'].to_numpy() == latest.reindex(models).to_numpy()).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--benchmarks', type=int, default=50)
+    parser.add_argument('--calls', type=int, default=1000, help="Calls timed on the unchanged file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'scores.csv'
+        score_table(10_000, n_benchmarks=args.benchmarks, seed=1).to_csv(path, index=False)
+        check_matches_pivot_table(path)
+
+        scores = score_table(args.rows, n_benchmarks=args.benchmarks)
+        start = time.perf_counter()
+        scores.to_csv(path, index=False)
+        print(f"rows={args.rows:,} benchmarks={args.benchmarks} "
+              f"({path.stat().st_size / 1e6:.0f} MB, written in {time.perf_counter() - start:.2f}s)")
+        appended = scores.tail(1).assign(model_name='Appended-Model')
+        del scores
+
+        loader_setup = "from leaderboard_data import load_leaderboard; import pandas as pd"
+        first_call = f"df = load_leaderboard({str(path)!r}, None)"
+        cases = [
+            ("pandas pivot_table", "import pandas as pd", PANDAS_LOADER.format(path=str(path)), 1),
+            ("first call", loader_setup, first_call, 1),
+            ("unchanged file", loader_setup + "\n" + first_call,
+             f"for _ in range({args.calls}):\n    assert load_leaderboard({str(path)!r}, None) is df", args.calls),
+            ("after ETL append", loader_setup + "\n" + first_call + "\n" +
+             f"pd.DataFrame({appended.to_dict('list')!r}).to_csv({str(path)!r}, mode='a', header=False, index=False)",
+             f"new = load_leaderboard({str(path)!r}, None)\n"
+             f"assert len(new) == len(df) + 1 and 'Appended-Model' in set(new['model_name'])", 1),
+        ]
+        for label, setup, stmt, calls in cases:
+            result = run_isolated(setup, stmt)
+            per_call = result['seconds'] / calls
+            timing = f"{per_call * 1e6:8.1f} us/call" if calls > 1 else f"{per_call:8.2f}s"
+            print(f"  {label:<20} {timing}  +{result['delta_rss_mb']:6.1f} MB peak RSS")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures the per-rerun cost of the leaderboard logos.
+
+Compares re-reading and base64-encoding every logo (what each rerun used to do)
+with looking the thumbnails up in logo_cache, and reports the bytes each approach
+adds to the page.
+
+Usage:
+    python -m benchmarks.bench_logos [--reruns 20]
+"""
+import argparse
+import base64
+import time
+from pathlib import Path
+
+from logo_cache import logo_data_uri
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+
+
+def uncached(paths) -> list:
+    return ["data:image/png;base64," + base64.b64encode(path.read_bytes()).decode() for path in paths]
+
+
+def cached(paths) -> list:
+    return [logo_data_uri(path) for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--reruns', type=int, default=20)
+    args = parser.parse_args()
+
+    paths = sorted(ASSETS_DIR.glob('*.png'))
+    print(f"{len(paths)} logos, {args.reruns} reruns")
+    for label, render in (("read + base64 every rerun", uncached), ("logo_cache", cached)):
+        start = time.perf_counter()
+        first = render(paths)
+        first_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.reruns):
+            render(paths)
+        per_rerun = (time.perf_counter() - start) / args.reruns
+        print(f"  {label:<26} first {first_s * 1000:7.1f} ms, then {per_rerun * 1000:7.2f} ms/rerun, "
+              f"{sum(map(len, first)) / 1e6:.2f} MB of data URIs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Micro-benchmark: indexed model-key matching versus the nested substring scan.
+
+Builds an OpenVLM.json-sized `results` mapping and looks up every model name
+with both the original loop and matching.ModelKeyIndex, checking that they
+return the same keys.
+
+Usage:
+    python -m benchmarks.bench_matching [--keys 800] [--lookups 2000]
+"""
+import argparse
+import json
+import random
+import time
+
+from benchmarks.synthetic import model_names, openvlm_payload
+from matching import ModelKeyIndex
+
+
+def naive_find(results: dict, model_name: str) -> list:
+    """The matching loop fetch_and_process_benchmarks used before the index."""
+    return [model_key for model_key in results if model_name.lower() in model_key.lower()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--keys', type=int, default=800, help="Model keys in the document.")
+    parser.add_argument('--lookups', type=int, default=2000, help="Model names to look up.")
+    args = parser.parse_args()
+
+    keys = model_names(args.keys)
+    results = json.loads(openvlm_payload(keys, n_benchmarks=1))['results']
+    rng = random.Random(0)
+    # Half the lookups hit a key, half miss
+    names = [rng.choice(keys) if i % 2 else f"Unknown-Model-{i}" for i in range(args.lookups)]
+
+    start = time.perf_counter()
+    expected = [naive_find(results, name) for name in names]
+    naive_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = ModelKeyIndex(results)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [index.find(name) for name in names]
+    indexed_s = time.perf_counter() - start
+
+    print(f"keys={args.keys} lookups={args.lookups}")
+    print(f"  substring scan: {naive_s * 1000:.1f} ms")
+    print(f"  index build:    {build_s * 1000:.1f} ms")
+    print(f"  indexed lookup: {indexed_s * 1000:.1f} ms  ({naive_s / (build_s + indexed_s):.1f}x faster incl. build)")
+    print(f"  identical matches: {expected == actual}")
+
+
+if __name__ == '__main__':
+    main()
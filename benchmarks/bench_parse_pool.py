@@ -0,0 +1,80 @@
+"""
+Compares decoding and matching in-process with the parse worker pool.
+
+Serves `--sources` large JSON leaderboards from a local stand-in server without
+delay, so the runs are bound by decoding and matching rather than the network.
+Each run fetches everything with the same settings and only `parse_workers`
+changes. The in-process and pooled runs must write the same score rows, and a
+second pooled run over the response cache must too. The pool can only be faster
+than the in-process run when the machine has more than one core.
+
+Usage:
+    python -m benchmarks.bench_parse_pool [--sources 16] [--models-per-source 400] [--extra-fields 20]
+                                          [--workers N]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.standin_server import StandInServer
+from benchmarks.synthetic import model_names, openvlm_payload, write_models_csv
+from fetcher import FetchPolicy
+from process_benchmarks import fetch_and_process_benchmarks
+
+
+# Every source lives on one local host, so the per-host rate limit would dominate the timings
+UNTHROTTLED = FetchPolicy(requests_per_second=None)
+COLUMNS = ['model_name', 'benchmark_name', 'score', 'param_B', 'country']
+
+
+def _timed_run(models_csv, scores_csv, **kwargs) -> tuple:
+    start = time.perf_counter()
+    report = fetch_and_process_benchmarks(str(models_csv), str(scores_csv), incremental=False,
+                                          fetch_policy=UNTHROTTLED, **kwargs)
+    return time.perf_counter() - start, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sources', type=int, default=16)
+    parser.add_argument('--models-per-source', type=int, default=400)
+    parser.add_argument('--extra-fields', type=int, default=20, help="Unused fields per model, to make sources larger.")
+    parser.add_argument('--workers', type=int, default=max(2, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    names = model_names(args.sources * args.models_per_source)
+    groups = [names[i::args.sources] for i in range(args.sources)]
+    routes = {f"/source-{i}.json": (openvlm_payload(group, seed=i, extra_fields=args.extra_fields), 'application/json')
+              for i, group in enumerate(groups)}
+    total_mb = sum(len(body) for body, _ in routes.values()) / 1e6
+
+    with StandInServer(routes) as server, tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_models_csv(tmp / 'models.csv', [(name, server.url(f"/source-{i % args.sources}.json"))
+                                              for i, name in enumerate(names)])
+
+        runs = {
+            'in-process': _timed_run(tmp / 'models.csv', tmp / 'serial.csv', cache_dir=None, parse_workers=1),
+            f"{args.workers} workers": _timed_run(tmp / 'models.csv', tmp / 'pool.csv', cache_dir=str(tmp / 'cache'),
+                                                  parse_workers=args.workers),
+            f"{args.workers} workers, cached": _timed_run(tmp / 'models.csv', tmp / 'cached.csv',
+                                                          cache_dir=str(tmp / 'cache'), parse_workers=args.workers),
+        }
+        outputs = [pd.read_csv(tmp / name)[COLUMNS] for name in ('serial.csv', 'pool.csv', 'cached.csv')]
+
+    print(f"sources={args.sources} models={len(names)} payload={total_mb:.1f} MB cpus={os.cpu_count()}")
+    baseline = runs['in-process'][0]
+    for label, (seconds, report) in runs.items():
+        decode = report.stages.get('decode', {}).get('seconds', 0.0)
+        match = report.stages.get('match', {}).get('seconds', 0.0)
+        print(f"  {label:<22} {seconds:6.2f}s ({baseline / seconds:4.1f}x)  decode {decode:6.2f}s  match {match:6.2f}s"
+              f"  cache hits {report.counters.get('cache_hits', 0)}")
+    print(f"  identical score rows: {all(output.equals(outputs[0]) for output in outputs[1:])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Times the ranking engine on a large model x benchmark matrix.
+
+Builds a sparse synthetic matrix (benchmarks on percentage and ~2000-point
+scales, with a share of the cells missing) and times the full build, an
+incremental update of a few cells, an update spread over many benchmarks and
+a change of weights. Each incremental result is checked against a full
+rebuild, and the build is compared with the same normalization written as a
+pandas loop over the benchmark columns.
+
+Usage:
+    python -m benchmarks.bench_ranking [--models 10000] [--benchmarks 500] [--missing 0.3] [--method zscore]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from leaderboard_ranking import NORMALIZATIONS, RankingEngine
+
+
+def _loop_composite(matrix: np.ndarray, benchmarks: list, method: str) -> pd.Series:
+    """The per-benchmark loop the engine replaces."""
+    wide = pd.DataFrame(matrix, columns=benchmarks)
+    normalized = {}
+    for benchmark in wide.columns:
+        column = wide[benchmark]
+        if method == 'zscore':
+            std = column.std(ddof=0)
+            normalized[benchmark] = (column - column.mean()) / std if std > 0 else column * 0
+        else:
+            spread = column.max() - column.min()
+            normalized[benchmark] = (column - column.min()) / spread if spread > 0 else column * 0 + 0.5
+    return pd.DataFrame(normalized).mean(axis=1)
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def _changes(rng, engine, n_cells: int, n_benchmarks: int) -> pd.DataFrame:
+    benchmarks = rng.choice(engine.benchmarks, n_benchmarks, replace=False)
+    return pd.DataFrame({'model_name': rng.choice(engine.models, n_cells),
+                         'benchmark_name': rng.choice(benchmarks, n_cells),
+                         'score': rng.uniform(20, 90, n_cells)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--models', type=int, default=10_000)
+    parser.add_argument('--benchmarks', type=int, default=500)
+    parser.add_argument('--missing', type=float, default=0.3, help="Share of cells without a score.")
+    parser.add_argument('--method', choices=NORMALIZATIONS, default='zscore')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scales = np.where(np.arange(args.benchmarks) % 10 == 0, 2000.0, 100.0)
+    matrix = rng.uniform(0.2, 0.9, (args.models, args.benchmarks)) * scales
+    matrix[rng.random(matrix.shape) < args.missing] = np.nan
+    models = [f"Model-{i:06d}" for i in range(args.models)]
+    benchmarks = [f"Bench_{j:04d}" for j in range(args.benchmarks)]
+
+    print(f"models={args.models:,} benchmarks={args.benchmarks} missing={args.missing:.0%} method={args.method}")
+    loop_seconds, expected = _timed(_loop_composite, matrix, benchmarks, args.method)
+    build_seconds, engine = _timed(RankingEngine, matrix, models, benchmarks, args.method)
+    same = np.allclose(engine.composite, expected.to_numpy(), equal_nan=True)
+    print(f"  pandas loop:  {loop_seconds * 1000:8.1f} ms")
+    print(f"  engine build: {build_seconds * 1000:8.1f} ms  ({loop_seconds / build_seconds:.1f}x faster, "
+          f"same composites: {same})")
+
+    cases = [
+        ("update 10 cells in 1 benchmark", lambda: engine.update(_changes(rng, engine, 10, 1))),
+        ("update 100 cells in 10 benchmarks", lambda: engine.update(_changes(rng, engine, 100, 10))),
+        ("update 5,000 cells in 250 benchmarks",
+         lambda: engine.update(_changes(rng, engine, 5_000, args.benchmarks // 2))),
+        ("set weights", lambda: engine.set_weights({benchmark: rng.uniform(0, 2) for benchmark in benchmarks})),
+    ]
+    for label, step in cases:
+        seconds, _ = _timed(step)
+        rebuilt = RankingEngine(engine.matrix, engine.models, engine.benchmarks, args.method,
+                                dict(zip(engine.benchmarks, engine._weights)))
+        same = (np.allclose(engine.composite, rebuilt.composite, equal_nan=True)
+                and np.array_equal(engine.ranks, rebuilt.ranks, equal_nan=True))
+        print(f"  {label:<38} {seconds * 1000:8.1f} ms  (matches a rebuild: {same})")
+
+
+if __name__ == '__main__':
+    main()
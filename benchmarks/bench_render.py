@@ -0,0 +1,104 @@
+"""
+Times the leaderboard table: per-row st.columns, one vectorized HTML block, and one page.
+
+For each size, a synthetic leaderboard is sorted and rendered inside Streamlit's
+AppTest harness each way. The legacy renderer is the loop dashboard.py used
+before: one st.columns([3, 2, 2, 2, 2]) and five markdown calls per model. The
+paged renderer builds the filter and sort index over the whole frame but
+renders only the first page, which is what the dashboard does now. Reports the
+script run time, the number of elements sent, and the size of the markup.
+
+Usage:
+    python -m benchmarks.bench_render [--sizes 10 1000 10000 100000] [--legacy-max-rows 10000]
+                                      [--block-max-rows 10000] [--page-size 50]
+"""
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from streamlit import logger as streamlit_logger
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synthetic import leaderboard_frame
+
+SCRIPT = '''
+import sys
+sys.path.insert(0, {repo!r})
+import pandas as pd
+import streamlit as st
+from leaderboard_index import LeaderboardIndex
+from leaderboard_table import ASSETS_DIR, leaderboard_page, render_leaderboard_html
+from logo_cache import logo_data_uri
+
+df = pd.read_pickle({frame!r})
+
+if {renderer!r} == 'paged':
+    index = LeaderboardIndex(df)
+    page_df = leaderboard_page(df, index.rows((None, None), 'performance_score'), 1, {page_size!r})
+    st.markdown(render_leaderboard_html(page_df, ASSETS_DIR), unsafe_allow_html=True)
+elif {renderer!r} == 'per-row':
+    sorted_df = df.sort_values('performance_score', ascending=False)
+    header_cols = st.columns([3, 2, 2, 2, 2])
+    for col, label in zip(header_cols, ["MODEL", "PERFORMANCE", "PRICE (blended)", "SPEED", "CONTEXT"]):
+        col.markdown(f"<div class='table-header'>{{label}}</div>", unsafe_allow_html=True)
+    for _, row in sorted_df.iterrows():
+        row_cols = st.columns([3, 2, 2, 2, 2])
+        logo_uri = logo_data_uri(ASSETS_DIR / row.get('logo', ''))
+        logo_html = f"<img src='{{logo_uri}}' class='logo-img'>"
+        row_cols[0].markdown(f"<div class='table-row model-cell'>{{logo_html}}<div>"
+                             f"<div class='model-name'>{{row['model_name']}}</div>"
+                             f"<div class='creator-name'>{{row['creator']}}</div></div></div>", unsafe_allow_html=True)
+        row_cols[1].markdown(f"<div class='metric-value'>{{row['performance_score']:.1f}}</div>", unsafe_allow_html=True)
+        row_cols[2].markdown(f"<div class='metric-value'>${{row['blended_price']:.4f}}</div>", unsafe_allow_html=True)
+        row_cols[3].markdown(f"<div class='metric-value'>{{int(row['speed_tokens_s'])}}</div>", unsafe_allow_html=True)
+        row_cols[4].markdown(f"<div class='metric-value'>{{int(row['context_window_k'])}}k</div>", unsafe_allow_html=True)
+else:
+    sorted_df = df.sort_values('performance_score', ascending=False)
+    st.markdown(render_leaderboard_html(sorted_df, ASSETS_DIR), unsafe_allow_html=True)
+'''
+
+
+def _run(script_path: Path) -> tuple:
+    app = AppTest.from_file(str(script_path), default_timeout=600)
+    start = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    markdown = app.markdown
+    return elapsed, len(markdown) + len(app.columns), sum(len(element.value) for element in markdown)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 10000, 100000])
+    parser.add_argument('--legacy-max-rows', type=int, default=10000,
+                        help="Skip the legacy renderer above this many rows.")
+    parser.add_argument('--block-max-rows', type=int, default=10000,
+                        help="Skip the single-block renderer above this many rows.")
+    parser.add_argument('--page-size', type=int, default=50)
+    args = parser.parse_args()
+    streamlit_logger.set_log_level(logging.ERROR)  # AppTest warns about running without a server
+
+    repo = str(Path(__file__).resolve().parent.parent)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        print(f"{'rows':>6}  {'renderer':<10} {'run time':>9} {'elements':>9} {'markup':>10}")
+        for size in args.sizes:
+            frame_path = tmp / f"frame-{size}.pkl"
+            leaderboard_frame(size).to_pickle(frame_path)
+            for renderer, max_rows in (('per-row', args.legacy_max_rows), ('one block', args.block_max_rows),
+                                       ('paged', None)):
+                if max_rows is not None and size > max_rows:
+                    continue
+                script_path = tmp / f"render-{size}-{renderer.replace(' ', '-')}.py"
+                script_path.write_text(SCRIPT.format(repo=repo, frame=str(frame_path), renderer=renderer,
+                                                     page_size=args.page_size))
+                elapsed, elements, markup = _run(script_path)
+                print(f"{size:>6}  {renderer:<10} {elapsed:8.2f}s {elements:>9,} {markup / 1e6:8.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
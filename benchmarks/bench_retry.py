@@ -0,0 +1,90 @@
+"""
+Exercises the retry, rate-limit and circuit-breaker layer against injected faults.
+
+Each scenario queues faults on a local stand-in server, fetches through
+fetcher.fetch_all and reports what happened: how many requests the server saw,
+how long it took, and whether the fetch ended in a response or an error. Each
+is checked against what should have happened, and the run exits non-zero if
+any scenario did not behave as expected.
+
+Usage:
+    python -m benchmarks.bench_retry
+"""
+import sys
+import time
+
+from benchmarks.standin_server import StandInServer
+from benchmarks.synthetic import model_names, openvlm_payload
+from fetcher import FetchPolicy, fetch_all
+
+PAYLOAD = (openvlm_payload(model_names(3)), 'application/json')
+FAST_BACKOFF = dict(backoff_base=0.05, backoff_max=0.5, requests_per_second=None)
+
+
+def _run(label: str, server: StandInServer, paths, policy: FetchPolicy, timeout: float = 2.0,
+         requests: int = 1, outcome: str = 'HTTP 200', min_seconds: float = 0.0, max_seconds: float = None) -> bool:
+    """Fetches `paths` and checks the server's request count, the outcome and the time taken; True if all match."""
+    hits_before = {path: server.hits.get(path, 0) for path in set(paths)}
+    start = time.perf_counter()
+    results = fetch_all([server.url(path) for path in paths], max_workers=4, per_host_limit=4,
+                        timeout=timeout, policy=policy)
+    elapsed = time.perf_counter() - start
+    hits = sum(server.hits.get(path, 0) - before for path, before in hits_before.items())
+    outcomes = sorted({type(result).__name__ if isinstance(result, Exception) else f"HTTP {result.status_code}"
+                       for result in results})
+    ok = (hits == requests and outcomes == [outcome] and elapsed >= min_seconds
+          and (max_seconds is None or elapsed < max_seconds))
+    expect = f"{requests} requests, {outcome}"
+    if min_seconds:
+        expect += f", >= {min_seconds:g}s"
+    if max_seconds is not None:
+        expect += f", < {max_seconds:g}s"
+    print(f"  {label:<46} {hits:3d} requests  {elapsed:5.2f}s  -> {', '.join(outcomes)}  "
+          f"[{'ok' if ok else 'expected ' + expect}]")
+    return ok
+
+
+def main():
+    failed = []
+    with StandInServer({f"/source-{i}.json": PAYLOAD for i in range(10)}) as server:
+        print("scenario                                        server hits   time    outcome  [check]")
+
+        def check(label, *args, **kwargs):
+            if not _run(label, server, *args, **kwargs):
+                failed.append(label)
+
+        server.inject('/source-0.json', 503, 502)
+        check("two 5xx, then success", ['/source-0.json'], FetchPolicy(**FAST_BACKOFF), requests=3)
+
+        server.inject('/source-1.json', (429, 1))
+        check("429 with Retry-After: 1", ['/source-1.json'], FetchPolicy(**FAST_BACKOFF),
+              requests=2, min_seconds=1.0)
+
+        server.inject('/source-2.json', 404)
+        check("404 is not retried", ['/source-2.json'], FetchPolicy(**FAST_BACKOFF), outcome='HTTPError')
+
+        server.hang_seconds = 1.0
+        server.inject('/source-3.json', 'hang')
+        check("timeout, then success", ['/source-3.json'], FetchPolicy(**FAST_BACKOFF), timeout=0.3, requests=2)
+
+        paths = [f"/source-{i}.json" for i in range(4, 10)]
+        for path in paths:
+            server.inject(path, *([500] * 10))
+        check("host keeps failing: circuit opens", paths,
+              FetchPolicy(max_attempts=3, failure_threshold=4, reset_timeout=60, **FAST_BACKOFF),
+              requests=4, outcome='CircuitOpenError')
+
+        server.inject('/source-0.json', *([(503, 30)] * 3))
+        check("Retry-After beyond the refresh deadline", ['/source-0.json'],
+              FetchPolicy(deadline=2.0, **FAST_BACKOFF), outcome='HTTPError', max_seconds=2.0)
+
+        check("rate limit: 2 req/s, burst 1", ['/source-1.json'] * 5,
+              FetchPolicy(requests_per_second=2, burst=1, backoff_base=0.05),
+              requests=5, min_seconds=1.9, max_seconds=3.0)
+
+    if failed:
+        sys.exit(f"{len(failed)} scenario(s) did not behave as expected: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares loading the score store from CSV and from the partitioned Parquet dataset.
+
+Writes a synthetic long-format score table with millions of rows both ways,
+then loads it in fresh processes: the whole table, one benchmark, one country
+and one model. Each load reports wall time and the growth of peak RSS. Some
+rows have no country, as in the ETL's output, and the Parquet round trip is
+checked against the table that was written.
+
+Usage:
+    python -m benchmarks.bench_score_store [--rows 2000000] [--benchmarks 50]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.measure import run_isolated
+from benchmarks.synthetic import score_table
+from score_store import SCORE_COLUMNS, load_scores, write_scores_parquet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--benchmarks', type=int, default=50)
+    args = parser.parse_args()
+
+    scores = score_table(args.rows, n_benchmarks=args.benchmarks)
+    # Sources without a country land in the null (__HIVE_DEFAULT_PARTITION__) partition
+    scores.loc[scores.index[::97], 'country'] = None
+    benchmark, country, model = scores['benchmark_name'].iloc[0], scores['country'].iloc[0], scores['model_name'].iloc[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, parquet_dir = Path(tmp) / 'scores.csv', Path(tmp) / 'scores_parquet'
+        start = time.perf_counter()
+        scores.to_csv(csv_path, index=False)
+        csv_write = time.perf_counter() - start
+        start = time.perf_counter()
+        write_scores_parquet(scores, str(parquet_dir))
+        parquet_write = time.perf_counter() - start
+        parquet_bytes = sum(path.stat().st_size for path in parquet_dir.rglob('*.parquet'))
+        loaded = load_scores(str(parquet_dir)).astype(object).sort_values(['model_name', 'benchmark_name'])
+        expected = scores.astype(object).sort_values(['model_name', 'benchmark_name'])
+        round_trip = loaded[SCORE_COLUMNS].reset_index(drop=True).equals(expected[SCORE_COLUMNS].reset_index(drop=True))
+        del scores, loaded, expected
+
+        print(f"rows={args.rows:,} benchmarks={args.benchmarks}")
+        print(f"  write: csv {csv_write:.2f}s ({csv_path.stat().st_size / 1e6:.0f} MB), "
+              f"parquet {parquet_write:.2f}s ({parquet_bytes / 1e6:.0f} MB), round trip identical: {round_trip}")
+
+        csv_setup = "import pandas as pd"
+        parquet_setup = "from score_store import load_scores"
+        cases = [
+            ("csv, all rows", csv_setup,
+             f"df = pd.read_csv({str(csv_path)!r}, parse_dates=['updated_at'])"),
+            ("csv, one benchmark", csv_setup,
+             f"df = pd.read_csv({str(csv_path)!r}, parse_dates=['updated_at']); "
+             f"df = df[df['benchmark_name'] == {benchmark!r}]"),
+            ("parquet, all rows", parquet_setup, f"df = load_scores({str(parquet_dir)!r})"),
+            ("parquet, one benchmark", parquet_setup, f"df = load_scores({str(parquet_dir)!r}, benchmarks={benchmark!r})"),
+            ("parquet, one country", parquet_setup, f"df = load_scores({str(parquet_dir)!r}, countries={country!r})"),
+            ("parquet, one model", parquet_setup, f"df = load_scores({str(parquet_dir)!r}, models={model!r})"),
+        ]
+        for label, setup, stmt in cases:
+            result = run_isolated(setup, stmt + "; assert len(df)")
+            print(f"  {label:<24} {result['seconds']:6.2f}s  +{result['delta_rss_mb']:7.1f} MB peak RSS")
+
+
+if __name__ == '__main__':
+    main()
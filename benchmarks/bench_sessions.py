@@ -0,0 +1,92 @@
+"""
+Load-tests the dashboard's data path with N concurrent sessions: per-session copies versus one shared snapshot.
+
+Each session is a thread that does one rerun's worth of data work for a random
+filter view and then waits until every session has done the same, so all of
+their state is alive at once, as under concurrent viewers. The copying path is
+what dashboard.py did before the snapshot: unpickle its own st.cache_data copy,
+then df.copy(), filter, sort and copy again for the chart. The snapshot path
+reads one shared Arrow-backed frame through LeaderboardIndex under pandas
+copy-on-write. Each run is in a fresh process and reports the growth of peak
+RSS over the loaded data.
+
+Usage:
+    python -m benchmarks.bench_sessions [--sessions 1 10 50] [--rows 100000]
+"""
+import argparse
+
+from benchmarks.measure import run_isolated
+
+COMMON = '''
+import pickle, random, threading
+import pandas as pd
+from benchmarks.synthetic import leaderboard_frame
+from leaderboard_index import SORT_ASCENDING
+
+rng = random.Random(0)
+origins = [None, 'China', 'USA', 'France', 'Canada', 'Community']
+views = [((rng.choice(origins), rng.choice([None, 'Open Source', 'Proprietary'])), rng.choice(list(SORT_ASCENDING)),
+          rng.choice(['performance_score', 'blended_price', 'speed_tokens_s'])) for _ in range({sessions})]
+barrier = threading.Barrier({sessions})
+held = []
+
+def run_sessions(session):
+    threads = [threading.Thread(target=lambda view=view: held.append(session(*view))) for view in views]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+'''
+
+COPYING_SETUP = COMMON + '''
+# st.cache_data keeps the pickled return value and unpickles a fresh copy for every call
+cached = pickle.dumps(leaderboard_frame({rows}))
+
+def session(filters, sort_by, metric):
+    df = pickle.loads(cached)
+    filtered_df = df.copy()
+    for column, value in zip(('origin', 'type'), filters):
+        if value is not None:
+            filtered_df = filtered_df[filtered_df[column] == value]
+    sorted_df = filtered_df.sort_values(by=sort_by, ascending=SORT_ASCENDING[sort_by])
+    df_chart = sorted_df.copy()
+    top_df = df_chart.sort_values(by=metric, ascending=SORT_ASCENDING[metric]).head(12)
+    barrier.wait()
+    return df, filtered_df, sorted_df, df_chart, top_df
+'''
+
+SNAPSHOT_SETUP = COMMON + '''
+from leaderboard_data import as_snapshot
+from leaderboard_index import LeaderboardIndex
+from leaderboard_table import leaderboard_page
+
+pd.options.mode.copy_on_write = True
+index = LeaderboardIndex(as_snapshot(leaderboard_frame({rows})))
+
+def session(filters, sort_by, metric):
+    df = index.df
+    page_df = leaderboard_page(df, index.rows(filters, sort_by))
+    top_df = df.iloc[index.rows(filters, metric)[:12]]
+    barrier.wait()
+    return df, page_df, top_df
+'''
+
+STMT = "run_sessions(session)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--rows', type=int, default=100_000, help="Models in the leaderboard.")
+    args = parser.parse_args()
+
+    print(f"rows={args.rows:,}")
+    for sessions in args.sessions:
+        for label, setup in (('per-session copies', COPYING_SETUP), ('shared snapshot', SNAPSHOT_SETUP)):
+            result = run_isolated(setup.format(rows=args.rows, sessions=sessions), STMT)
+            print(f"  {sessions:>3} sessions, {label:<19} {result['seconds']:6.2f}s  "
+                  f"peak RSS {result['peak_rss_mb']:7.1f} MB  (+{result['delta_rss_mb']:7.1f} MB for the sessions)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Measures ingesting large remote CSV and Parquet leaderboards.
+
+Writes a long-format leaderboard and a wide one (a column per benchmark), both
+with extra metadata columns, as CSV and as Parquet, then ingests each in a fresh
+process two ways: loading the whole file with pandas, and with the chunked,
+column-projected readers in source_readers. Reports wall time and the growth of
+peak RSS, and checks that both readers agree on the two layouts.
+
+Usage:
+    python -m benchmarks.bench_source_readers [--rows 1000000]
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+from benchmarks.measure import run_isolated
+from benchmarks.synthetic import score_table
+from source_readers import read_csv_source, read_parquet_source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    long_table = score_table(args.rows)
+    wide_table = long_table.pivot(index='model_name', columns='benchmark_name', values='score').reset_index()
+    # Remote leaderboards carry plenty of columns the ETL never looks at
+    for table in (long_table, wide_table):
+        for i in range(8):
+            table[f"notes_{i}"] = 'free-text metadata that the ETL does not need ' * 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"rows={args.rows:,}")
+        for layout, table in (('long', long_table), ('wide', wide_table)):
+            csv_path, parquet_path = Path(tmp) / f"{layout}.csv", Path(tmp) / f"{layout}.parquet"
+            table.to_csv(csv_path, index=False)
+            table.to_parquet(parquet_path, row_group_size=100_000)
+            with open(csv_path, 'rb') as f:
+                from_csv = read_csv_source(f)
+            with open(parquet_path, 'rb') as f:
+                from_parquet = read_parquet_source(f)
+
+            print(f"{layout}: csv {csv_path.stat().st_size / 1e6:.0f} MB, "
+                  f"parquet {parquet_path.stat().st_size / 1e6:.0f} MB, "
+                  f"readers agree: {from_csv == from_parquet and len(from_csv) > 0}")
+            del from_csv, from_parquet
+            cases = [
+                ("csv, pd.read_csv", "import pandas as pd", f"df = pd.read_csv({str(csv_path)!r})"),
+                ("csv, read_csv_source", "from source_readers import read_csv_source",
+                 f"with open({str(csv_path)!r}, 'rb') as f: results = read_csv_source(f)"),
+                ("parquet, pd.read_parquet", "import pandas as pd", f"df = pd.read_parquet({str(parquet_path)!r})"),
+                ("parquet, read_parquet_source", "from source_readers import read_parquet_source",
+                 f"with open({str(parquet_path)!r}, 'rb') as f: results = read_parquet_source(f)"),
+            ]
+            for label, setup, stmt in cases:
+                result = run_isolated(setup, stmt)
+                print(f"  {label:<30} {result['seconds']:6.2f}s  +{result['delta_rss_mb']:7.1f} MB peak RSS")
+
+
+if __name__ == '__main__':
+    main()
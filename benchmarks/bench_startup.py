@@ -0,0 +1,106 @@
+"""
+Measures dashboard cold start: module import time and time to first paint.
+
+Import time is taken in fresh processes, for the dashboard's own modules and
+for the plotting stack they used to import at start-up. Time to first paint
+starts launch.py on a free port, connects to it the way a browser does (the
+/_stcore/stream websocket) and requests a run. It reports when the server was
+healthy, when the first element arrived and when the script finished, all
+from process start.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 3]
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks.measure import REPO_ROOT, run_isolated
+
+IMPORTS = [
+    ("dashboard modules", "import leaderboard_chart, leaderboard_data, leaderboard_index, leaderboard_table"),
+    ("plotting stack", "import matplotlib.pyplot, seaborn, altair"),
+    ("streamlit", "import streamlit"),
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def _first_paint(port: int) -> tuple:
+    """Requests a run over the app's websocket; returns the times of the first delta and of script_finished."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from tornado.websocket import websocket_connect
+
+    ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+    request = BackMsg()
+    request.rerun_script.query_string = ""
+    request.rerun_script.page_script_hash = ""
+    ws.write_message(request.SerializeToString(), binary=True)
+
+    first_delta = None
+    while True:
+        message = await ws.read_message()
+        if message is None:
+            raise RuntimeError("The server closed the connection before the script finished")
+        forward = ForwardMsg()
+        forward.ParseFromString(message)
+        if first_delta is None and forward.HasField('delta'):
+            first_delta = time.perf_counter()
+        if forward.HasField('script_finished'):
+            ws.close()
+            return first_delta, time.perf_counter()
+
+
+def time_launch(launch_args: list) -> dict:
+    """Starts launch.py and measures health, first paint and the end of the first run, in seconds from start."""
+    port = _free_port()
+    command = [sys.executable, 'launch.py', *launch_args, '--server.port', str(port), '--server.headless', 'true',
+               '--browser.gatherUsageStats', 'false']
+    start = time.perf_counter()
+    server = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                    break
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError(f"launch.py exited with {server.returncode}")
+                time.sleep(0.01)
+        healthy = time.perf_counter()
+        first_delta, finished = asyncio.run(_first_paint(port))
+    finally:
+        server.terminate()
+        server.wait()
+    return {'healthy': healthy - start, 'first paint': first_delta - start, 'finished': finished - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=3, help="Runs per case; the median is reported.")
+    args = parser.parse_args()
+
+    print("import time (fresh process, median):")
+    for label, stmt in IMPORTS:
+        seconds = statistics.median(run_isolated("", stmt)['seconds'] for _ in range(args.runs))
+        print(f"  {label:<18} {seconds * 1000:7.0f} ms")
+
+    print("launch.py, seconds from process start (median):")
+    for label, launch_args in (("prewarmed", []), ("--no-prewarm", ['--no-prewarm'])):
+        runs = [time_launch(launch_args) for _ in range(args.runs)]
+        print(f"  {label:<14} " + "  ".join(f"{key} {statistics.median(run[key] for run in runs):5.2f}s"
+                                           for key in runs[0]))
+
+
+if __name__ == '__main__':
+    main()
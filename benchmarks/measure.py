@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs `setup`, then times `stmt` and reports the process's peak RSS (Linux/macOS only)
+_RUNNER = """
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[3])
+def _rss_mb():
+    # ru_maxrss survives exec on Linux and would report the parent's peak, so prefer VmHWM
+    try:
+        with open('/proc/self/status') as f:
+            return next(int(line.split()[1]) for line in f if line.startswith('VmHWM:')) / 1024
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+exec(sys.argv[1])
+_base = _rss_mb()
+_start = time.perf_counter()
+exec(sys.argv[2])
+_elapsed = time.perf_counter() - _start
+print(json.dumps({'seconds': _elapsed, 'peak_rss_mb': _rss_mb(), 'delta_rss_mb': _rss_mb() - _base}))
+"""
+
+
+def run_isolated(setup: str, stmt: str) -> dict:
+    """
+    Times a statement in a fresh Python process so its memory use can be measured on its own.
+
+    Args:
+        setup (str): Code run first and excluded from the timing (imports etc.).
+        stmt (str): Code to time.
+
+    Returns:
+        dict: 'seconds' taken by `stmt`, the process's 'peak_rss_mb', the growth of
+            the peak during `stmt` as 'delta_rss_mb', and anything the code printed as 'output'.
+    """
+    result = subprocess.run([sys.executable, '-c', _RUNNER, setup, stmt, str(REPO_ROOT)],
+                            capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+    *output, report = result.stdout.strip().splitlines()
+    return dict(json.loads(report), output='\n'.join(output))
@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInServer:
+    """
+    A local HTTP server that stands in for the remote benchmark sources.
+
+    Routes map a path (e.g. "/OpenVLM.json") to a (body, content_type) pair.
+    Every response is delayed by `delay` seconds to mimic a slow endpoint, and
+    carries an ETag so conditional GETs can be answered with 304 Not Modified.
+
+    Faults can be queued per path with `inject`: an int status code (optionally as
+    a (status, retry_after) pair) or 'hang' to stall for `hang_seconds`. Each
+    request to the path consumes one fault before the route is served normally.
+    """
+
+    def __init__(self, routes: dict, delay: float = 0.0):
+        self.routes = routes
+        self.delay = delay
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.bytes_sent = 0
+        self.hits = {}
+        self.faults = {}
+        self.hang_seconds = 5.0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def inject(self, path: str, *faults):
+        """Queues faults to answer the next requests for `path` with."""
+        with self._lock:
+            self.faults.setdefault(path, []).extend(faults)
+
+    def _next_fault(self, path: str):
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            queued = self.faults.get(path)
+            return queued.pop(0) if queued else None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                if server.delay:
+                    time.sleep(server.delay)
+                path = self.path.split('?', 1)[0]
+                fault = server._next_fault(path)
+                if fault == 'hang':
+                    time.sleep(server.hang_seconds)
+                elif fault is not None:
+                    status, retry_after = fault if isinstance(fault, tuple) else (fault, None)
+                    self.send_response(status)
+                    if retry_after is not None:
+                        self.send_header('Retry-After', str(retry_after))
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if path not in server.routes:
+                    self.send_error(404)
+                    return
+                body, content_type = server.routes[path]
+                etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    with server._lock:
+                        server.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    return  # The client gave up, e.g. after a timeout
+                with server._lock:
+                    server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output readable
+
+        return Handler
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
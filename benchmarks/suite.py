@@ -0,0 +1,279 @@
+"""
+Runs the benchmark suite over the ETL and dashboard hot paths and writes the results as JSON.
+
+Every stage runs in a fresh process on synthetic inputs built from --scale:
+fetch (from a local stand-in server), parse, normalize (model matching), write
+(scores.csv upsert), load (leaderboard from scores.csv), filter/sort, render
+(table pages) and chart. Each reports wall time, throughput in items and MB per
+second, and the growth of peak RSS. With --compare, the stage times are checked
+against an earlier results file and the run fails if one got slower than
+--tolerance allows.
+
+Usage:
+    python -m benchmarks.suite [--scale 1] [--stages fetch parse ...] [--output results.json]
+                               [--compare baseline.json] [--tolerance 0.2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.measure import run_isolated
+from benchmarks.standin_server import StandInServer
+from benchmarks.synthetic import leaderboard_frame, model_names, openvlm_payload, score_table
+from fetcher import FetchPolicy, SpooledResponse, fetch_all
+from leaderboard_chart import render_metric_chart
+from leaderboard_data import as_snapshot, read_leaderboard
+from leaderboard_index import LeaderboardIndex
+from leaderboard_table import leaderboard_page, render_leaderboard_html
+from matching import ModelKeyIndex
+from process_benchmarks import match_model_rows, parse_benchmark_file
+from score_store import upsert_scores
+
+# Input sizes at --scale 1; every size is multiplied by the scale
+BASE_PARAMS = {
+    'models': 2_000,          # models.csv rows, spread over the sources
+    'sources': 20,            # distinct JSON leaderboard payloads
+    'benchmarks': 6,          # benchmarks reported per model in each payload
+    'score_rows': 1_000_000,  # rows of the long-format score table
+    'leaderboard_rows': 100_000,
+}
+# Stand-in server latency per response, in seconds
+FETCH_DELAY = 0.05
+
+
+def scaled_params(scale: float) -> dict:
+    params = {name: max(1, int(value * scale)) for name, value in BASE_PARAMS.items()}
+    params['benchmarks'] = BASE_PARAMS['benchmarks']
+    params['sources'] = min(params['sources'], params['models'])
+    return params
+
+
+def _payloads(params: dict) -> dict:
+    """Path -> JSON payload of every source, with the models spread evenly over them."""
+    names = model_names(params['models'])
+    return {f"/source-{i}.json": openvlm_payload(names[i::params['sources']], n_benchmarks=params['benchmarks'], seed=i)
+            for i in range(params['sources'])}
+
+
+def _responses(params: dict) -> list:
+    return [(path, SpooledResponse(path, 200, {'Content-Type': 'application/json'}, io.BytesIO(body)))
+            for path, body in _payloads(params).items()]
+
+
+def _leaderboard_index(params: dict):
+    pd.options.mode.copy_on_write = True
+    return LeaderboardIndex(as_snapshot(leaderboard_frame(params['leaderboard_rows'])))
+
+
+def _views(index) -> list:
+    """Every (filters, sort_by) view the dashboard can show."""
+    origins = [None] + index.values('origin')
+    types = [None] + index.values('type')
+    return [((origin, model_type), sort_by) for origin in origins for model_type in types for sort_by in index.sort_keys]
+
+
+# --- Stages: setup(params, tmp_dir) builds the inputs untimed, run(state) is timed and returns
+# the 'items' it processed and optionally the 'bytes' it read or wrote ---
+
+def _setup_fetch(params, tmp):
+    server = StandInServer({path: (body, 'application/json') for path, body in _payloads(params).items()},
+                           delay=FETCH_DELAY)
+    server.__enter__()  # Serves until the benchmark process exits
+    return [server.url(path) for path in server.routes]
+
+
+def _run_fetch(urls):
+    # One local host serves every source, so the per-host rate limit would dominate the timing
+    responses = fetch_all(urls, policy=FetchPolicy(requests_per_second=None))
+    num_bytes = sum(response.num_bytes for response in responses)
+    for response in responses:
+        response.close()
+    return {'items': len(responses), 'bytes': num_bytes}
+
+
+def _run_parse(responses):
+    models = sum(len(parse_benchmark_file(response, url)) for url, response in responses)
+    return {'items': models, 'bytes': sum(response.num_bytes for _, response in responses)}
+
+
+def _setup_normalize(params, tmp):
+    indexes = [ModelKeyIndex(parse_benchmark_file(response, url)) for url, response in _responses(params)]
+    return [(indexes[i % params['sources']], name) for i, name in enumerate(model_names(params['models']))]
+
+
+def _run_normalize(jobs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = sum(len(match_model_rows(index, name, 7.0, 'CN', '2025-01-01T00:00:00Z')) for index, name in jobs)
+    return {'items': rows}
+
+
+def _setup_write(params, tmp):
+    return score_table(params['score_rows']), Path(tmp) / 'scores.csv'
+
+
+def _run_write(state):
+    scores, path = state
+    upsert_scores(str(path), scores)
+    return {'items': len(scores), 'bytes': path.stat().st_size}
+
+
+def _setup_load(params, tmp):
+    path = Path(tmp) / 'scores.csv'
+    score_table(params['score_rows']).to_csv(path, index=False)
+    return path, params['score_rows']
+
+
+def _run_load(state):
+    path, rows = state
+    read_leaderboard(path)
+    return {'items': rows, 'bytes': path.stat().st_size}
+
+
+def _setup_filter_sort(params, tmp):
+    pd.options.mode.copy_on_write = True
+    return as_snapshot(leaderboard_frame(params['leaderboard_rows']))
+
+
+def _run_filter_sort(df):
+    # Building the index is part of the cost: it is paid once per version of the data
+    index = LeaderboardIndex(df)
+    views = _views(index)
+    for filters, sort_by in views:
+        index.rows(filters, sort_by)
+    return {'items': len(views)}
+
+
+def _setup_render(params, tmp):
+    index = _leaderboard_index(params)
+    return index, [index.rows(filters, sort_by) for filters, sort_by in _views(index)]
+
+
+def _run_render(state):
+    index, views = state
+    markup = sum(len(render_leaderboard_html(leaderboard_page(index.df, rows))) for rows in views)
+    return {'items': len(views), 'bytes': markup}
+
+
+def _setup_chart(params, tmp):
+    import matplotlib
+    matplotlib.use("Agg")
+    # leaderboard_chart imports the plotting stack on first use; import it here so the timing leaves it out
+    import matplotlib.figure, seaborn  # noqa: F401
+
+    index = _leaderboard_index(params)
+    # One distinct chart per origin and metric, so every one is a cache miss
+    return [(index.df.iloc[index.rows((origin, None), metric)[:12]], metric)
+            for origin in [None] + index.values('origin') for metric in ('performance_score', 'speed_tokens_s')]
+
+
+def _run_chart(charts):
+    return {'items': len(charts), 'bytes': sum(len(render_metric_chart(top_df, metric)) for top_df, metric in charts)}
+
+
+STAGES = {
+    'fetch': (_setup_fetch, _run_fetch),
+    'parse': (lambda params, tmp: _responses(params), _run_parse),
+    'normalize': (_setup_normalize, _run_normalize),
+    'write': (_setup_write, _run_write),
+    'load': (_setup_load, _run_load),
+    'filter_sort': (_setup_filter_sort, _run_filter_sort),
+    'render': (_setup_render, _run_render),
+    'chart': (_setup_chart, _run_chart),
+}
+
+_SETUP = '''
+import json
+from benchmarks.suite import STAGES
+_setup, _run = STAGES[{stage!r}]
+_state = _setup({params!r}, {tmp!r})
+'''
+_STMT = "print(json.dumps(_run(_state)))"
+
+
+def run_stage(stage: str, params: dict) -> dict:
+    """
+    Runs one stage in a fresh process.
+
+    Returns:
+        dict: 'seconds', 'items', 'items_per_s', 'mb_per_s' (when the stage reports bytes),
+            'peak_rss_mb' and 'delta_rss_mb'.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        result = run_isolated(_SETUP.format(stage=stage, params=params, tmp=tmp), _STMT)
+    counts = json.loads(result['output'].splitlines()[-1])
+    seconds = result['seconds']
+    report = {'seconds': seconds, 'items': counts['items'], 'items_per_s': counts['items'] / seconds}
+    if 'bytes' in counts:
+        report['mb_per_s'] = counts['bytes'] / 1e6 / seconds
+    report.update(peak_rss_mb=result['peak_rss_mb'], delta_rss_mb=result['delta_rss_mb'])
+    return report
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Prints each stage's time against the baseline; returns the stages slower than `tolerance` allows."""
+    if baseline.get('params') != results['params']:
+        print("  note: the baseline was run with different input sizes")
+    regressions = []
+    for stage, report in results['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if before is None:
+            continue
+        change = report['seconds'] / before['seconds'] - 1
+        slower = change > tolerance
+        if slower:
+            regressions.append(stage)
+        print(f"  {stage:<12} {before['seconds']:8.3f}s -> {report['seconds']:8.3f}s  {change:+7.1%}"
+              + ("  REGRESSION" if slower else ""))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for every input size.")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--output', help="Where to write the results JSON (default: stdout only).")
+    parser.add_argument('--compare', help="Results JSON of an earlier run to compare against.")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown per stage, as a fraction.")
+    args = parser.parse_args()
+
+    params = scaled_params(args.scale)
+    results = {
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': args.scale,
+        'params': params,
+        'stages': {},
+    }
+    print(f"scale={args.scale} " + " ".join(f"{name}={value:,}" for name, value in params.items()), file=sys.stderr)
+    for stage in args.stages:
+        report = results['stages'][stage] = run_stage(stage, params)
+        throughput = f"{report['items_per_s']:12,.0f} items/s"
+        if 'mb_per_s' in report:
+            throughput += f" {report['mb_per_s']:8.1f} MB/s"
+        print(f"  {stage:<12} {report['seconds']:8.3f}s {throughput:<34} +{report['delta_rss_mb']:7.1f} MB peak RSS",
+              file=sys.stderr)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        print(f"compared with {args.compare}:", file=sys.stderr)
+        with contextlib.redirect_stdout(sys.stderr):
+            regressions = compare(results, json.loads(Path(args.compare).read_text()), args.tolerance)
+        if regressions:
+            sys.exit(f"slower than {args.compare} by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import json
+import random
+
+BENCHMARK_NAMES = ['SEEDBench_IMG', 'CCBench', 'MMBench_TEST_EN', 'MMBench_TEST_CN', 'MME', 'MMVet']
+
+
+def model_names(n_models: int) -> list:
+    """Returns `n_models` distinct synthetic model names."""
+    return [f"Synth-Model-{i:05d}" for i in range(n_models)]
+
+
+def openvlm_payload(names, n_benchmarks: int = len(BENCHMARK_NAMES), seed: int = 0, extra_fields: int = 0) -> bytes:
+    """
+    Builds a JSON document with the same structure as OpenVLM.json.
+
+    Args:
+        names (list[str]): Model names; each becomes a key under "results".
+        n_benchmarks (int): Number of benchmarks reported per model.
+        extra_fields (int): Sub-scores reported next to 'Overall', to bulk documents up like the real one.
+        seed (int): Random seed, so payloads are reproducible between runs.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    rng = random.Random(seed)
+    benchmarks = [BENCHMARK_NAMES[i] if i < len(BENCHMARK_NAMES) else f"Bench_{i:03d}" for i in range(n_benchmarks)]
+    results = {}
+    for name in names:
+        block = {}
+        for bench in benchmarks:
+            scores = {'Overall': round(rng.uniform(20, 90), 1)}
+            for field in range(extra_fields):
+                scores[f"Category_{field:02d}"] = round(rng.uniform(0, 100), 2)
+            block[bench] = scores
+        results[f"{name}-Chat"] = block
+    return json.dumps({'time': {'str': 'synthetic'}, 'results': results}).encode('utf-8')
+
+
+def write_models_csv(path, rows):
+    """
+    Writes a models.csv with the same columns as the real one.
+
+    Args:
+        path: Where to write the file.
+        rows (list[tuple]): (model_name, primary_benchmark_url) pairs.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('model_name,organisation,param_B,release_date,license,primary_benchmark_url,country\n')
+        for i, (name, url) in enumerate(rows):
+            f.write(f"{name},Synthetic Lab,{(i % 70) + 1},2024/01/01,MIT License,{url},CN\n")
+
+
+def score_table(n_rows: int, n_benchmarks: int = 50, seed: int = 0):
+    """
+    Builds a long-format score table in the scores.csv schema.
+
+    Args:
+        n_rows (int): Number of score rows.
+        n_benchmarks (int): Number of distinct benchmarks the rows are spread over.
+        seed (int): Random seed, so tables are reproducible between runs.
+
+    Returns:
+        pd.DataFrame: Rows with the columns of scores.csv.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    n_models = max(1, n_rows // n_benchmarks)
+    model_ids = np.arange(n_rows) // n_benchmarks
+    benchmark_ids = np.arange(n_rows) % n_benchmarks
+    countries = np.array(['CN', 'JP', 'KR', 'IN', 'SG', 'US', 'FR', 'CA'])
+    names = np.array(model_names(n_models + 1))
+    benchmarks = np.array([BENCHMARK_NAMES[i] if i < len(BENCHMARK_NAMES) else f"Bench_{i:03d}"
+                           for i in range(n_benchmarks)])
+    days = pd.date_range('2024-01-01', periods=365, freq='D').strftime('%Y-%m-%dT00:00:00Z').to_numpy()
+    return pd.DataFrame({
+        'model_name': names[model_ids],
+        'benchmark_name': benchmarks[benchmark_ids],
+        'score': rng.uniform(20, 90, n_rows).round(1),
+        'param_B': ((model_ids % 70) + 1).astype(float),
+        'country': countries[model_ids % len(countries)],
+        'updated_at': days[rng.integers(0, len(days), n_rows)],
+    })
+
+
+CREATORS = ['ZhipuAI', 'Alibaba', 'DeepSeek', '01.AI', 'Google', 'OpenAI', 'Meta', 'Mistral AI',
+            'Microsoft', 'TinyLlama', 'OpenChat', 'Cohere']
+ORIGINS = {'ZhipuAI': 'China', 'Alibaba': 'China', 'DeepSeek': 'China', '01.AI': 'China', 'Google': 'USA',
+           'OpenAI': 'USA', 'Meta': 'USA', 'Mistral AI': 'France', 'Microsoft': 'USA', 'TinyLlama': 'Community',
+           'OpenChat': 'Community', 'Cohere': 'Canada'}
+
+
+def leaderboard_frame(n_rows: int, seed: int = 0):
+    """
+    Builds a wide leaderboard in the schema dashboard.py renders.
+
+    Args:
+        n_rows (int): Number of models.
+        seed (int): Random seed, so frames are reproducible between runs.
+
+    Returns:
+        pd.DataFrame: One row per model, including the derived `logo` and `blended_price` columns.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from leaderboard_table import creator_logos
+
+    rng = np.random.default_rng(seed)
+    creators = np.array(CREATORS)[rng.integers(0, len(CREATORS), n_rows)]
+    df = pd.DataFrame({
+        'model_name': model_names(n_rows),
+        'creator': creators,
+        'origin': [ORIGINS[creator] for creator in creators],
+        'performance_score': rng.uniform(50, 90, n_rows).round(1),
+        'composite_score': rng.normal(0, 1, n_rows),
+        'price_input_usd_per_1m': rng.lognormal(-3, 2, n_rows).round(4),
+        'price_output_usd_per_1m': rng.lognormal(-2, 2, n_rows).round(4),
+        'speed_tokens_s': rng.integers(50, 400, n_rows),
+        'context_window_k': rng.choice([8, 32, 128, 200, 1000], n_rows),
+        'type': np.where(rng.random(n_rows) < 0.7, 'Open Source', 'Proprietary'),
+        'updated_at': pd.Timestamp('2025-06-28') - pd.to_timedelta(rng.integers(0, 365, n_rows), unit='D'),
+    })
+    df['logo'] = creator_logos(df['creator'])
+    df['blended_price'] = (df['price_input_usd_per_1m'] * 0.75) + (df['price_output_usd_per_1m'] * 0.25)
+    return df
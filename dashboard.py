@@ -1,7 +1,21 @@
 import streamlit as st
 import pandas as pd
 from pathlib import Path
-import base64
+
+from leaderboard_data import (LOAD_CACHE_SIZE, MODELS_PATH, SCORES_PATH, benchmark_columns, file_signature,
+                              load_leaderboard)
+from leaderboard_chart import CHART_BACKENDS, CHART_LABELS, CHART_TOP_N, render_metric_chart
+from leaderboard_cube import AggregateCube
+from leaderboard_frontier import FrontierIndex
+from leaderboard_index import SORT_ASCENDING, SORT_LABELS, LeaderboardIndex
+from leaderboard_table import (DEFAULT_PAGE_SIZE, PAGE_SIZE_OPTIONS, leaderboard_page, page_count,
+                               render_leaderboard_html)
+from logo_cache import LOGO_DISPLAY_SIZE
+
+# Every session reads the same leaderboard snapshot. Sessions take their rows by position (a page,
+# the charted models), which copies just those rows; columns read from the snapshot itself are
+# shared, and copy-on-write makes sure nothing a session writes to them can change the snapshot.
+pd.options.mode.copy_on_write = True
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -14,99 +28,23 @@ st.set_page_config(
 # --- PATHS & DATA LOADING ---
 ASSETS_DIR = Path(__file__).parent / "assets"
 
-# It's better to manage logos in code for this custom table
-# We'll create a mapping from creator name to logo filename.
-LOGO_MAP = {
-    "ZhipuAI": "zhipuai.png",
-    "Alibaba": "alibaba.png",
-    "DeepSeek": "deepseek.png",
-    "01.AI": "01ai.png",
-    "Google": "google.png",
-    "OpenAI": "openai.png",
-    "Meta": "meta.png",
-    "Mistral AI": "mistralai.png",
-    "Microsoft": "microsoft.png",
-    "TinyLlama":   "tinyllama.png",
-    "OpenChat":    "openchat.png",
-    "Cohere":      "cohere.png"
-}
-
-# Load your data
-# For this example, I'm creating a sample DataFrame that matches the new structure.
-# You should adapt your 'scores.csv' to have these columns.
-@st.cache_data
-def load_data():
-    # ----> REPLACE THIS WITH YOUR DF LOADING (pd.read_csv("scores.csv"))
-    data = {
-       "model_name": [
-           "GLM-4-9B-Chat",
-           "Qwen2-72B-Instruct",
-           "DeepSeek-V2",
-           "Yi-Large",
-           "Gemini 1.5 Pro",
-           "GPT-4o-mini",
-           "Llama-3-70B-Instruct",
-           "Mistral-7B-v0.2",
-           "Phi-3-Mini-3.8B-Instruct",
-           "TinyLlama-1.1B-Chat",
-           "OpenChat-3.5",
-           "Command R+"
-      ],
-      
-      "creator": [
-          "ZhipuAI",
-          "Alibaba",
-          "DeepSeek",
-          "01.AI",
-          "Google",
-          "OpenAI",
-          "Meta",
-          "Mistral AI",
-          "Microsoft",
-          "TinyLlama",
-          "OpenChat",
-          "Cohere"
-      ],
-      
-      "origin": [
-          "China", "China", "China", "China",
-          "USA", "USA", "USA",
-          "France", "USA",
-          "Community", "Community", "Canada"
-      ],
-      
-      "performance_score": [75.1, 78.5, 77.2, 76.8, 72.5, 73.0, 82.1, 79.4, 75.6, 68.0, 74.3, 71.0],
-  
-      "price_input_usd_per_1m":  [0.0017, 0.0112, 0.0014, 0.0028, 3.50, 0.15, 0.0008, 0.0004, 0.0002, 0.0001, 0.0003, 0.0004],
-      "price_output_usd_per_1m": [0.0017, 0.0336, 0.0028, 0.0084, 10.50, 0.60, 0.0024, 0.0012, 0.0006, 0.0003, 0.0009, 0.0010],
-      
-      "speed_tokens_s":  [205, 95, 150, 110, 146, 163, 160, 210, 300, 320, 280, 250],
-      "context_window_k": [128, 128, 128, 200, 1000, 128, 128, 32, 128, 128, 128, 128],
-
-      "type": [
-          "Open Source", "Open Source", "Open Source", "Open Source",
-          "Proprietary", "Proprietary",
-          "Open Source", "Open Source", "Open Source",
-          "Open Source", "Open Source", "Open Source"
-      ],
-       
-      "updated_at": pd.to_datetime([
-          "2025-06-28", "2025-06-20", "2025-06-18", "2025-06-15",
-          "2025-06-13", "2025-06-13", "2025-06-10", "2025-06-08",
-          "2025-06-05", "2025-05-30", "2025-05-28", "2025-05-25"
-      
-      ])      
-
-    }
-    df = pd.DataFrame(data)
-    # <---- END OF REPLACEMENT SECTION
-
-    df["logo"] = df["creator"].map(LOGO_MAP)
-    # Create a blended price for sorting. You can adjust the weights.
-    df['blended_price'] = (df['price_input_usd_per_1m'] * 0.75) + (df['price_output_usd_per_1m'] * 0.25)
-    return df
-
-df = load_data()
+# Filter groups, sort orders and the aggregate cube are built once per version of the data and
+# shared by every rerun; filtering, sorting or a KPI is then a lookup instead of a pass over the frame.
+# Keyed on the files' path, mtime and size, so scores written by the ETL show up on the next
+# rerun, and unchanged files are never parsed again. A rerun takes the index, the cube, the frontier
+# index and their frame together once, so it sees either the old snapshot or the new one, never a mix.
+@st.cache_resource(max_entries=LOAD_CACHE_SIZE)
+def load_leaderboard_views(scores_signature, models_signature):
+    df = load_leaderboard(scores_signature[0], models_signature[0])
+    index = LeaderboardIndex(df)
+    return index, AggregateCube(df, benchmarks=benchmark_columns(df)), FrontierIndex(index)
+
+scores_signature = file_signature(SCORES_PATH)
+if scores_signature[1] is None:
+    st.error(f"No scores found at {SCORES_PATH}. Run process_benchmarks.py to collect them.")
+    st.stop()
+leaderboard_index, leaderboard_cube, frontier_index = load_leaderboard_views(scores_signature, file_signature(MODELS_PATH))
+df = leaderboard_index.df
 
 
 # --- CUSTOM CSS ---
@@ -203,6 +141,11 @@ def load_css():
             background-color: rgba(100, 100, 100, 0.05);
         }
 
+        .logo-img {
+            max-width: %dpx;
+            max-height: %dpx;
+        }
+
         .model-name {
             font-weight: 600;
             font-size: 1.1rem;
@@ -227,7 +170,7 @@ def load_css():
             text-align: right;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """ % LOGO_DISPLAY_SIZE, unsafe_allow_html=True)
 
 
 load_css()
@@ -239,10 +182,11 @@ st.markdown("<p class='subtitle'>Live, side-by-side metrics for open-source and
 
 # --- KPI CARDS ---
 c1, c2, c3 = st.columns(3)
+totals = leaderboard_cube.totals()
 kpi_cfg = [
-    (c1, "🧠 Models Tracked", f"{df['model_name'].nunique():,}"),
-    (c2, "🏆 Top Performance", f"{df['performance_score'].max():.1f}"),
-    (c3, "📅 Last Update", f"{df['updated_at'].max().date()}"),
+    (c1, "🧠 Models Tracked", f"{totals['models']:,}"),
+    (c2, "🏆 Top Performance", f"{totals['performance_score_max']:.1f}"),
+    (c3, "📅 Last Update", f"{totals['updated_at'].date()}"),
 ]
 for col, title, val in kpi_cfg:
     with col:
@@ -258,151 +202,78 @@ st.write("---")
 st.subheader("Explore the Leaderboard")
 filter_cols = st.columns([1, 1, 2])
 with filter_cols[0]:
-    origin_filter = st.selectbox('**Origin**', ['All'] + list(df['origin'].unique()))
+    origin_filter = st.selectbox('**Origin**', ['All'] + leaderboard_index.values('origin'))
 with filter_cols[1]:
     type_filter = st.selectbox('**Model Type**', ['All', 'Open Source', 'Proprietary'])
 
 sort_by = st.selectbox(
     '**Sort By**',
-    options=['performance_score', 'blended_price', 'speed_tokens_s', 'context_window_k'],
-    format_func=lambda x: {
-        'performance_score': 'Performance (High to Low)', 'blended_price': 'Price (Low to High)',
-        'speed_tokens_s': 'Speed (High to Low)', 'context_window_k': 'Context (High to Low)'
-    }[x]
+    options=list(SORT_ASCENDING),
+    format_func=SORT_LABELS.get
 )
 
-# --- FILTERING & SORTING LOGIC ---
-filtered_df = df.copy()
-if origin_filter != 'All':
-    filtered_df = filtered_df[filtered_df['origin'] == origin_filter]
-if type_filter != 'All':
-    filtered_df = filtered_df[filtered_df['type'] == type_filter]
+frontier_cols = st.columns([1, 1, 2])
+with frontier_cols[0]:
+    max_price = st.number_input('**Max price** (USD/1M tokens)', min_value=0.0, value=None, step=0.5,
+                                placeholder="No limit")
+with frontier_cols[1]:
+    st.write("")
+    frontier_only = st.checkbox("Pareto frontier only",
+                                help="Models no other model in the view beats on score, price, speed and "
+                                     "context at once (◆)")
 
-ascending = True if sort_by == 'blended_price' else False
-sorted_df = filtered_df.sort_values(by=sort_by, ascending=ascending)
+# --- FILTERING & SORTING LOGIC ---
+filter_values = tuple(None if value == 'All' else value for value in (origin_filter, type_filter))
+budget = (('blended_price', max_price),) if max_price is not None else ()
+view_rows = frontier_index.rows(filter_values, sort_by, frontier_only, budget)
 
 # --- CUSTOM LEADERBOARD TABLE ---
-st.markdown("<div class='table-container'>", unsafe_allow_html=True)
-
-# Table Header
-header_cols = st.columns([3, 2, 2, 2, 2])
-header_cols[0].markdown("<div class='table-header model-col'>MODEL</div>", unsafe_allow_html=True)
-header_cols[1].markdown("<div class='table-header'>PERFORMANCE</div>", unsafe_allow_html=True)
-header_cols[2].markdown("<div class='table-header'>PRICE (blended)</div>", unsafe_allow_html=True)
-header_cols[3].markdown("<div class='table-header'>SPEED</div>", unsafe_allow_html=True)
-header_cols[4].markdown("<div class='table-header'>CONTEXT</div>", unsafe_allow_html=True)
-
-# Table Rows
-for _, row in sorted_df.iterrows():
-    row_cols = st.columns([3, 2, 2, 2, 2])
-    
-    # Column 1: Model, Creator, Logo
-    logo_path = ASSETS_DIR / row.get('logo', '')
-    if logo_path.is_file():
-        img_bytes = logo_path.read_bytes()
-        encoded = base64.b64encode(img_bytes).decode()
-        logo_html = f"<img src='data:image/png;base64,{encoded}' class='logo-img'>"
-    else:
-        logo_html = "<div class='logo-img' style='background-color:#333;'></div>" # Placeholder
-
-    row_cols[0].markdown(f"""
-        <div class='table-row model-cell'>
-            {logo_html}
-            <div>
-                <div class='model-name'>{row['model_name']}</div>
-                <div class='creator-name'>{row['creator']}</div>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
-
-    # Metric columns
-    #Performance
-    row_cols[1].markdown(
-        f"<div class='table-row'>"
-        f"<div class='metric-value'>{row['performance_score']:.1f}</div>"
-        f"<div class='metric-unit'>C-Eval Score</div>"
-        f"</div>",
-        unsafe_allow_html=True
-    )
-    # Blended price
-    row_cols[2].markdown(
-        f"<div class='table-row'>"
-        f"<div class='metric-value'>${row['blended_price']:.4f}</div>"
-        f"<div class='metric-unit'>USD/1M Tokens</div>"
-        f"</div>",
-        unsafe_allow_html=True
-    )
-    # Speed
-    row_cols[3].markdown(
-        f"<div class='table-row'>"
-        f"<div class='metric-value'>{int(row['speed_tokens_s'])}</div>"
-        f"<div class='metric-unit'>Tokens/s</div>"
-        f"</div>",
-        unsafe_allow_html=True
-    )
-    # Context window
-    row_cols[4].markdown(
-        f"<div class='table-row'>"
-        f"<div class='metric-value'>{int(row['context_window_k'])}k</div>"
-        f"<div class='metric-unit'>Tokens</div>"
-        f"</div>",
-        unsafe_allow_html=True
-    )
+# Sorting covers every filtered model, but only the visible page is turned into HTML
+page_cols = st.columns([1, 1, 2])
+with page_cols[0]:
+    page_size = st.selectbox('**Rows per page**', PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE))
+n_pages = page_count(len(view_rows), page_size)
+with page_cols[1]:
+    # Keyed on the view, so changing a filter, the sort, the budget or the page size goes back to page 1
+    page = st.number_input('**Page**', min_value=1, max_value=n_pages, value=1, step=1,
+                           key=f"page-{origin_filter}-{type_filter}-{sort_by}-{frontier_only}-{max_price}-{page_size}")
+page_df = leaderboard_page(df, view_rows, page, page_size)
+first_row = (page - 1) * page_size
+with page_cols[2]:
+    st.caption(f"Showing {min(first_row + 1, len(view_rows)):,}–{first_row + len(page_df):,} "
+               f"of {len(view_rows):,} models")
+
+# The whole page is rendered as a single HTML block rather than a row of st.columns per model
+# The frontier is the one of the filtered view, whatever the budget leaves on the page
+on_frontier = frontier_index.frontier_mask(filter_values)[view_rows[first_row:first_row + len(page_df)]]
+st.markdown(render_leaderboard_html(page_df, ASSETS_DIR, on_frontier), unsafe_allow_html=True)
 
 # --- VISUALIZATION ---
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-
 st.subheader("📊 Metric Visualiser")
 
-metric = st.radio(
-    "Select metric to visualize:",
-    ["performance_score", "blended_price", "speed_tokens_s"],
-    format_func=lambda x: {
-        "performance_score": "C-Eval Score",
-        "blended_price": "Price (USD/1M tokens)",
-        "speed_tokens_s": "Tokens per second"
-    }[x],
-    horizontal=True
-)
-
-df_chart = sorted_df.copy()
-
-sns.set(style="darkgrid")
-
-ascending = True if metric == "blended_price" else False
-top_df = df_chart.sort_values(by=metric, ascending=ascending).head(12)
-
-palette = sns.color_palette("Blues_r", len(top_df))
-
-
-fig, ax = plt.subplots(figsize=(10, 6))
-sns.barplot(
-    data=top_df,
-    x="model_name",
-    y=metric,
-    palette=palette,
-    ax=ax
-)
-
-ax.set_xticklabels(ax.get_xticklabels(), rotation=40, ha="right")
-ax.tick_params(axis='x', labelsize=10)
-
-for i, value in enumerate(top_df[metric]):
-    ax.text(i, value + 0.5, f"{value:.2f}", color='black', va='center', fontsize=9)
-
-label = {
-    "performance_score": "C-Eval Score",
-    "blended_price": "Price (USD/1M tokens)",
-    "speed_tokens_s": "Tokens per second"
-}[metric]
+chart_cols = st.columns([3, 1])
+with chart_cols[0]:
+    metric = st.radio(
+        "Select metric to visualize:",
+        list(CHART_LABELS),
+        format_func=CHART_LABELS.get,
+        horizontal=True
+    )
+with chart_cols[1]:
+    chart_backend = st.radio("Chart backend:", CHART_BACKENDS, horizontal=True)
 
-ax.set_title(f"{label} – Top 12 Models", fontsize=16, fontweight='bold')
-ax.set_xlabel(label, fontsize=12)
-ax.set_ylabel("")
+# Same filters, frontier and budget, ordered by the chosen metric; only the plotted rows are taken
+# from the frame. Missing values sort last, so models without the metric are only dropped from the tail.
+top_df = df.iloc[frontier_index.rows(filter_values, metric, frontier_only, budget)[:CHART_TOP_N]]
+top_df = top_df[top_df[metric].notna()]
 
-st.pyplot(fig)
+# Charts are cached by the plotted data, so a rerun that shows the same chart does no plotting
+if top_df.empty:
+    st.info(f"No {CHART_LABELS[metric]} data for the selected models.")
+elif chart_backend == "Altair":
+    st.altair_chart(render_metric_chart(top_df, metric, chart_backend), use_container_width=True)
+else:
+    st.image(render_metric_chart(top_df, metric, chart_backend), use_container_width=True)
 
 
 
@@ -416,8 +287,10 @@ with st.expander("Methodology & About this Project"):
         This is an open-source project dedicated to benchmarking Large Language Models, with a special focus on models from Asia and beyond.
      </p>
 <ul>
- <li><b>Performance Score:</b> We use the <b>C-Eval</b> score as a 
- primary metric, a comprehensive Chinese evaluation suite for foundation models.</li>
+ <li><b>Performance Score:</b> The mean of a model's scores on every benchmark reported 
+ on a 0–100 scale. Benchmarks on their own scale, such as MME's ~2000 points, are left out of it.</li>
+ <li><b>Composite z-score:</b> Every benchmark, whatever its scale, is normalized over the models 
+ that report it, and a model's composite is the mean of its normalized scores.</li>
 <li><b>Price:</b> A blended price is calculated (75% input, 25% 
 output) from public data, in USD per 1 million tokens.</li>
  <li><b>Speed:</b> Measured in tokens per second on standardized 
@@ -0,0 +1,373 @@
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import RetryCallState, Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+from tenacity.stop import stop_base
+from tenacity.wait import wait_base
+
+# Defaults for the concurrent fetch stage used by process_benchmarks.py
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+DEFAULT_TIMEOUT = 10
+# Bodies larger than this are spooled to a temporary file instead of being kept in memory
+SPOOL_MAX_BYTES = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def make_session(pool_maxsize: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """
+    Creates a requests Session whose connection pools can hold one connection per worker.
+
+    Args:
+        pool_maxsize (int): Maximum number of pooled connections kept per host.
+
+    Returns:
+        requests.Session: A session that can be shared between fetch threads.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class FetchPolicy:
+    """
+    Retry, rate-limit and circuit-breaker settings for the fetch layer.
+
+    Args:
+        max_attempts (int): Attempts per URL, including the first one.
+        backoff_base (float): Base of the jittered exponential backoff, in seconds.
+        backoff_max (float): Longest backoff between two attempts, in seconds.
+        requests_per_second (float): Sustained request rate allowed per host; None for no limit.
+        burst (int): Number of requests a host may receive back to back before the rate applies.
+        failure_threshold (int): Consecutive failures after which a host's circuit opens.
+        reset_timeout (float): Seconds an open circuit waits before letting a trial request through.
+        deadline (float): Seconds the whole refresh may take; no attempt or backoff runs past it.
+    """
+
+    def __init__(self, max_attempts: int = 4, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 requests_per_second: float = 5.0, burst: int = 5, failure_threshold: int = 5,
+                 reset_timeout: float = 60.0, deadline: float = 600.0):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.deadline = deadline
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of contacting a host whose circuit breaker is open."""
+
+
+class DeadlineExceededError(requests.exceptions.RequestException):
+    """Raised when a request could not be made before the refresh deadline."""
+
+
+class TokenBucket:
+    """Lets `rate` requests per second through, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: float = None):
+        """Blocks until a token is available. Raises DeadlineExceededError if that would pass `deadline`."""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                raise DeadlineExceededError("Refresh deadline reached while waiting for the host's rate limit")
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a host after `failure_threshold` consecutive failures.
+
+    After `reset_timeout` seconds a single trial request is let through; its success
+    closes the circuit again, and its failure keeps it open for another period. Only
+    transport errors and retryable statuses (429, 5xx) count as failures; any other
+    answer from the host, even an error status, counts as a success.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._opened_at = time.monotonic()  # Keep others out while the trial runs
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class HostState:
+    """The per-host concurrency slots, rate limiter and circuit breaker."""
+
+    def __init__(self, host: str, per_host_limit: int, policy: FetchPolicy):
+        self.host = host
+        self.slots = threading.BoundedSemaphore(per_host_limit)
+        self.bucket = TokenBucket(policy.requests_per_second, policy.burst)
+        self.breaker = CircuitBreaker(policy.failure_threshold, policy.reset_timeout)
+
+
+class HostLimiter:
+    """Keeps one HostState per host, capping in-flight requests and request rate per host."""
+
+    def __init__(self, per_host_limit: int = DEFAULT_PER_HOST_LIMIT, policy: FetchPolicy = None):
+        self.per_host_limit = per_host_limit
+        self.policy = policy or FetchPolicy()
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def for_url(self, url: str) -> HostState:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostState(host, self.per_host_limit, self.policy)
+            return self._hosts[host]
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Timeouts, dropped connections, 429 and 5xx responses are worth retrying; other errors are not."""
+    if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+        return False
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                              requests.exceptions.ChunkedEncodingError))
+
+
+def _retry_after_seconds(error: BaseException) -> float:
+    """Returns the delay requested by a Retry-After header on an HTTP error, or 0."""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _WaitBackoffOrRetryAfter(wait_base):
+    """Jittered exponential backoff, stretched to whatever Retry-After asked for."""
+
+    def __init__(self, policy: FetchPolicy):
+        self.backoff = wait_random_exponential(multiplier=policy.backoff_base, max=policy.backoff_max)
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        return max(self.backoff(retry_state), _retry_after_seconds(retry_state.outcome.exception()))
+
+
+class _StopAtDeadline(stop_base):
+    """Stops retrying when the next backoff would end past the refresh deadline."""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        return time.monotonic() + (retry_state.upcoming_sleep or 0) >= self.deadline
+
+
+class SpooledResponse:
+    """
+    A fetched response whose body was streamed into a spooled temporary file.
+
+    Small bodies stay in memory and large ones go to disk, so the downloads held
+    between the fetch and parse stages don't pin whole documents in memory.
+    """
+
+    def __init__(self, url: str, status_code: int, headers, body):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.num_bytes = body.seek(0, 2)
+
+    @classmethod
+    def from_response(cls, response: requests.Response, chunk_size: int = CHUNK_SIZE):
+        body = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            body.write(chunk)
+        return cls(response.url, response.status_code, response.headers, body)
+
+    def iter_content(self, chunk_size: int = CHUNK_SIZE):
+        """Yields the body in chunks of `chunk_size` bytes."""
+        self.body.seek(0)
+        while True:
+            chunk = self.body.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def file(self):
+        """Returns the body as a seekable binary file object, rewound to the start."""
+        self.body.seek(0)
+        return self.body
+
+    def json(self):
+        self.body.seek(0)
+        return json.load(self.body)
+
+    def close(self):
+        self.body.close()
+
+
+def _attempt(session: requests.Session, host: HostState, url: str, timeout: float, headers: dict,
+             deadline: float) -> SpooledResponse:
+    """Makes one request for `url`, subject to the host's circuit breaker, rate limit and slots."""
+    if not host.breaker.allow():
+        raise CircuitOpenError(f"Circuit breaker open for {host.host} after repeated failures")
+    host.bucket.acquire(deadline)
+    try:
+        with host.slots:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError("Refresh deadline reached before the request could be sent")
+            with session.get(url, timeout=min(timeout, remaining), headers=headers, stream=True) as response:
+                response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+                result = SpooledResponse.from_response(response)
+    except requests.exceptions.RequestException as e:
+        if _is_retryable(e):
+            host.breaker.record_failure()
+        elif isinstance(e, requests.exceptions.HTTPError):
+            # The host answered, e.g. with a 404, so it is up; this also closes a circuit after its trial request
+            host.breaker.record_success()
+        raise
+    host.breaker.record_success()
+    return result
+
+
+def fetch_url(session: requests.Session, limiter: HostLimiter, url: str, timeout: float = DEFAULT_TIMEOUT,
+              headers: dict = None, deadline: float = None, report=None):
+    """
+    Fetches a single URL, retrying transient failures with jittered exponential backoff.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried up to the policy's
+    `max_attempts`, waiting at least as long as any Retry-After header asks. Every
+    attempt goes through the host's circuit breaker, rate limiter and in-flight slots,
+    and no attempt or backoff runs past `deadline`.
+
+    Args:
+        deadline (float): time.monotonic() value by which fetching must end. Defaults to
+            the policy's deadline from now.
+        report (run_report.RunReport): Optional report that counts the retries against `url`.
+
+    Returns:
+        SpooledResponse | Exception: The response, or the exception of the last attempt.
+            A conditional request answered with 304 Not Modified is returned as-is.
+    """
+    policy = limiter.policy
+    if deadline is None:
+        deadline = time.monotonic() + policy.deadline
+    host = limiter.for_url(url)
+    retrying = Retrying(
+        stop=stop_after_attempt(policy.max_attempts) | _StopAtDeadline(deadline),
+        wait=_WaitBackoffOrRetryAfter(policy),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=(lambda retry_state: report.count('retries', source=url)) if report is not None else None,
+        reraise=True,
+    )
+    try:
+        return retrying(_attempt, session, host, url, timeout, headers, deadline)
+    except requests.exceptions.RequestException as e:
+        return e
+
+
+def fetch_all(urls, max_workers: int = DEFAULT_MAX_WORKERS, per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+              timeout: float = DEFAULT_TIMEOUT, session: requests.Session = None, cache=None,
+              policy: FetchPolicy = None, report=None):
+    """
+    Fetches URLs concurrently on a bounded thread pool with a shared session.
+
+    Args:
+        urls (list[str]): URLs to fetch. Duplicates are fetched once per occurrence.
+        max_workers (int): Maximum number of requests in flight overall.
+        per_host_limit (int): Maximum number of requests in flight against one host.
+        timeout (float): Per-request timeout in seconds.
+        session (requests.Session): Optional session to reuse; one is created if omitted.
+        cache (http_cache.ResponseCache): Optional cache whose validators turn the requests into conditional GETs.
+        policy (FetchPolicy): Retry, rate-limit and circuit-breaker settings. Its deadline
+            covers the whole call.
+        report (run_report.RunReport): Optional report that gets a 'fetch' span, the bytes
+            downloaded, 304 responses and retries of every URL.
+
+    Returns:
+        list: One SpooledResponse or exception per URL, in the same order as `urls`.
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    policy = policy or FetchPolicy()
+    deadline = time.monotonic() + policy.deadline
+    own_session = session is None
+    if own_session:
+        session = make_session(pool_maxsize=max(max_workers, per_host_limit))
+    limiter = HostLimiter(per_host_limit, policy)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            def fetch(url):
+                headers = cache.conditional_headers(url) if cache is not None else None
+                if report is None:
+                    return fetch_url(session, limiter, url, timeout, headers=headers, deadline=deadline)
+                with report.span('fetch', url):
+                    response = fetch_url(session, limiter, url, timeout, headers=headers, deadline=deadline,
+                                         report=report)
+                if isinstance(response, SpooledResponse):
+                    report.count('not_modified' if response.status_code == 304 else 'downloads', source=url)
+                    report.count('bytes_downloaded', response.num_bytes, source=url)
+                return response
+
+            return list(pool.map(fetch, urls))
+    finally:
+        if own_session:
+            session.close()
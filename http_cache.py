@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+# Where fetch_and_process_benchmarks keeps cached benchmark payloads by default
+DEFAULT_CACHE_DIR = '.benchmark_cache'
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    A persistent, size-bounded cache of parsed benchmark payloads keyed by URL.
+
+    For every URL the cache keeps the ETag and Last-Modified validators sent by the
+    server together with the parsed payload. The fetch layer sends them back as
+    If-None-Match / If-Modified-Since, and a 304 reply is answered from disk
+    instead of downloading and parsing the file again. When the payloads grow past
+    `max_bytes`, the least recently used entries are evicted.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'invalidations': 0}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entries = self._read_index()
+        self._dirty = False
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.cache_dir / self.INDEX_FILE, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self):
+        tmp_path = self.cache_dir / (self.INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.cache_dir / self.INDEX_FILE)
+        self._dirty = False
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _payload_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def conditional_headers(self, url: str) -> dict:
+        """
+        Returns the validator headers to send with a GET for `url`.
+
+        Returns:
+            dict: If-None-Match and/or If-Modified-Since, or {} when nothing usable is cached.
+        """
+        key = self._key(url)
+        entry = self._entries.get(key)
+        if entry is None or not self._payload_path(key).is_file():
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_bytes(self, url: str):
+        """
+        Returns the cached payload for `url` after a 304 reply, still JSON-encoded, or None if it is gone.
+
+        Lets the payload be decoded somewhere else, e.g. in a parse worker process.
+        The entry's last use is only updated in memory; `flush` writes it out.
+        """
+        key = self._key(url)
+        try:
+            data = self._payload_path(key).read_bytes()
+        except FileNotFoundError:
+            if self._entries.pop(key, None) is not None:
+                self._write_index()
+            self.stats['misses'] += 1
+            return None
+        if key in self._entries:
+            self._entries[key]['last_used'] = time.time()
+            self._dirty = True
+        self.stats['hits'] += 1
+        return data
+
+    def flush(self):
+        """Writes the last-use times of this run's hits to the index, if there were any."""
+        if self._dirty:
+            self._write_index()
+
+    def invalidate(self, url: str):
+        """
+        Forgets the cached payload for `url`, e.g. because it no longer decodes.
+
+        Without its validators the next GET is unconditional, so the server can't
+        keep answering 304 to a payload that is unusable.
+        """
+        key = self._key(url)
+        self._payload_path(key).unlink(missing_ok=True)
+        if self._entries.pop(key, None) is not None:
+            self._write_index()
+        self.stats['invalidations'] += 1
+
+    def record_miss(self):
+        """Counts a source that had to be downloaded in full, whether or not its payload ends up cached."""
+        self.stats['misses'] += 1
+
+    def store(self, url: str, response, payload):
+        """
+        Caches the parsed payload of a full (200) response, if the server sent validators.
+
+        Args:
+            url (str): The URL that was fetched.
+            response (requests.Response): The response the payload was parsed from.
+            payload: The parsed, JSON-serializable payload.
+        """
+        if self.wants(response):
+            self.store_bytes(url, response, json.dumps(payload).encode('utf-8'))
+
+    def store_bytes(self, url: str, response, data: bytes):
+        """Like `store`, for a payload that was already JSON-encoded, e.g. by a parse worker process."""
+        if not self.wants(response):
+            return  # Nothing to revalidate with, so a cached copy could never be reused
+
+        key = self._key(url)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        self._payload_path(key).write_bytes(data)
+        self._entries[key] = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': len(data),
+            'last_used': time.time(),
+        }
+        self.stats['stores'] += 1
+        self._evict()
+        self._write_index()
+
+    @staticmethod
+    def wants(response) -> bool:
+        """Whether a response carries the validators needed for its payload to be cached."""
+        return bool(response.headers.get('ETag') or response.headers.get('Last-Modified'))
+
+    def _evict(self):
+        total = sum(entry['size'] for entry in self._entries.values())
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            self._payload_path(key).unlink(missing_ok=True)
+            del self._entries[key]
+            total -= entry['size']
+            self.stats['evictions'] += 1
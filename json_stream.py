@@ -0,0 +1,138 @@
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+_DECODER = json.JSONDecoder()
+# Minimum amount of text read ahead when a value does not fit in the buffer yet
+_READ_AHEAD = 64 * 1024
+
+
+class _StreamReader:
+    """A text buffer over a stream of byte chunks that JSON values are decoded from one at a time."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_chars: int = 1) -> bool:
+        """Appends at least `min_chars` of text to the buffer. Returns False once the stream is exhausted."""
+        if self.eof:
+            return False
+        parts = [self.buffer[self.pos:]]  # Drop everything that has been consumed
+        size = len(parts[0])
+        target = size + min_chars
+        while size < target:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                parts.append(self._decoder.decode(b'', final=True))
+                self.eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            size += len(text)
+        self.buffer = ''.join(parts)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or '' at the end of the stream."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self):
+        """Decodes the next complete JSON value, reading more of the stream as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buffer, self.pos)
+                # A number that ends exactly at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Grow the buffer geometrically so a large value is not re-scanned once per chunk
+            self._fill(max(len(self.buffer) - self.pos, _READ_AHEAD))
+
+
+def _iter_members(reader: _StreamReader):
+    """Yields the (key, value) pairs of the object starting at the reader's position."""
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+        return
+    while True:
+        if reader.peek() != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", reader.buffer, reader.pos)
+        key = reader.value()
+        reader.expect(':')
+        yield key, reader
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+
+def iter_results(chunks):
+    """
+    Streams the members of the top-level "results" object of an OpenVLM.json-style document.
+
+    Only one model's block is decoded at a time; everything outside "results" is
+    decoded and dropped as it is passed.
+
+    Args:
+        chunks (Iterable[bytes]): The document as a stream of byte chunks, e.g. response.iter_content().
+
+    Yields:
+        tuple: (model_key, benchmarks) for every model in "results", in document order.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    reader = _StreamReader(chunks)
+    if reader.peek() != '{':
+        reader.value()  # Anything but an object has no "results"; just validate it
+    else:
+        for key, _ in _iter_members(reader):
+            if key == 'results' and reader.peek() == '{':
+                for model_key, _ in _iter_members(reader):
+                    yield model_key, reader.value()
+            else:
+                reader.value()
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
+
+
+def iter_overall_scores(chunks):
+    """
+    Streams the "Overall" score of every benchmark of every model in the document.
+
+    Args:
+        chunks (Iterable[bytes]): The document as a stream of byte chunks.
+
+    Yields:
+        tuple: (model_key, benchmark_name, overall) in document order.
+    """
+    for model_key, benchmarks in iter_results(chunks):
+        if not isinstance(benchmarks, dict):
+            continue
+        for benchmark_name, scores in benchmarks.items():
+            if isinstance(scores, dict) and 'Overall' in scores:
+                yield model_key, benchmark_name, scores['Overall']
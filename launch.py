@@ -1,4 +1,43 @@
-import os
+import argparse
+import sys
+from pathlib import Path
 
-# Launch your Streamlit app
-os.system("streamlit run dashboard.py")
+DASHBOARD_PATH = Path(__file__).parent / "dashboard.py"
+
+
+def prewarm():
+    """
+    Loads the leaderboard before the server starts.
+
+    Streamlit runs dashboard.py in this process, so its first rerun finds the
+    parsed snapshot in load_leaderboard's cache instead of reading scores.csv
+    while the first viewer waits.
+    """
+    from leaderboard_data import SCORES_PATH, load_leaderboard
+
+    if SCORES_PATH.is_file():
+        load_leaderboard()
+
+
+def main(argv=None):
+    """
+    Launches the dashboard in this process.
+
+    Arguments this launcher does not know are passed on to `streamlit run`,
+    e.g. `python launch.py --server.port 8502 --server.headless true`.
+    """
+    parser = argparse.ArgumentParser(description="Launch the LLM Benchmark Visualizer.")
+    parser.add_argument('--no-prewarm', action='store_true', help="Don't load the leaderboard before the server starts.")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    if not args.no_prewarm:
+        prewarm()
+
+    from streamlit.web import cli
+
+    sys.argv = ['streamlit', 'run', str(DASHBOARD_PATH), *streamlit_args]
+    return cli.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import io
+from functools import lru_cache
+
+import pandas as pd
+
+CHART_LABELS = {
+    "performance_score": "Mean benchmark score (%)",
+    "blended_price": "Price (USD/1M tokens)",
+    "speed_tokens_s": "Tokens per second",
+}
+CHART_BACKENDS = ("Matplotlib", "Altair")
+CHART_TOP_N = 12
+# Number of rendered charts kept; a PNG is ~100 KB
+CHART_CACHE_SIZE = 64
+# Same output st.pyplot produces
+PNG_OPTIONS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+
+def chart_key(top_df: pd.DataFrame, metric: str) -> tuple:
+    """
+    Fingerprint of a chart: the plotted model names and metric values.
+
+    Two views that plot the same bars share a key, whatever filters produced
+    them, and a data reload that changes a plotted value gets a new one.
+    """
+    return (metric, tuple(top_df["model_name"].astype(str)), tuple(top_df[metric].astype(float)))
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _matplotlib_png(metric: str, names: tuple, values: tuple) -> bytes:
+    # The plotting stack is imported on the first chart, not when the dashboard starts
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    # A bare Figure is not registered with pyplot, so it is freed as soon as it goes out of scope
+    fig = Figure(figsize=(10, 6))
+    with sns.axes_style("darkgrid"):
+        ax = fig.subplots()
+        data = pd.DataFrame({"model_name": names, metric: values})
+        palette = sns.color_palette("Blues_r", len(data))
+        sns.barplot(data=data, x="model_name", y=metric, hue="model_name", palette=palette, legend=False, ax=ax)
+
+    ax.tick_params(axis='x', labelsize=10, labelrotation=40)
+    for tick in ax.get_xticklabels():
+        tick.set_horizontalalignment("right")
+
+    # Labels sit a few points above each bar; a data-unit offset stretched the axis for sub-dollar prices
+    for bars in ax.containers:
+        ax.bar_label(bars, fmt="%.2f", color='black', fontsize=9, padding=2)
+
+    label = CHART_LABELS[metric]
+    ax.set_title(f"{label} – Top {CHART_TOP_N} Models", fontsize=16, fontweight='bold')
+    ax.set_xlabel(label, fontsize=12)
+    ax.set_ylabel("")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **PNG_OPTIONS)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _altair_chart(metric: str, names: tuple, values: tuple):
+    import altair as alt
+
+    label = CHART_LABELS[metric]
+    data = pd.DataFrame({"model_name": names, metric: values, "rank": range(len(names))})
+    base = alt.Chart(data).encode(
+        x=alt.X("model_name:N", sort=None, title=label, axis=alt.Axis(labelAngle=-40)),
+        y=alt.Y(f"{metric}:Q", title=None),
+    )
+    bars = base.mark_bar().encode(
+        color=alt.Color("rank:O", scale=alt.Scale(scheme="blues", reverse=True), legend=None),
+        tooltip=["model_name", alt.Tooltip(f"{metric}:Q", format=".2f", title=label)],
+    )
+    text = base.mark_text(dy=-6, fontSize=9).encode(text=alt.Text(f"{metric}:Q", format=".2f"))
+    return (bars + text).properties(title=f"{label} – Top {CHART_TOP_N} Models", height=400)
+
+
+def render_metric_chart(top_df: pd.DataFrame, metric: str, backend: str = "Matplotlib"):
+    """
+    Renders the Metric Visualiser bar chart, reusing a cached rendering when one exists.
+
+    Charts are cached per chart_key, so switching back to a metric or view
+    that was already drawn does no plotting. The Matplotlib backend renders to
+    PNG bytes and keeps no figure alive afterwards; the Altair backend returns
+    a chart spec the browser draws.
+
+    Args:
+        top_df (pd.DataFrame): The rows to plot, in bar order.
+        metric (str): One of CHART_LABELS.
+        backend (str): One of CHART_BACKENDS.
+
+    Returns:
+        bytes | alt.LayerChart: PNG bytes for st.image, or a chart for st.altair_chart.
+    """
+    key = chart_key(top_df, metric)
+    if backend == "Altair":
+        return _altair_chart(*key)
+    return _matplotlib_png(*key)
+
+
+def chart_cache_info() -> dict:
+    """Hit/miss counts of both chart caches."""
+    return {"Matplotlib": _matplotlib_png.cache_info(), "Altair": _altair_chart.cache_info()}
@@ -0,0 +1,166 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Columns the cube groups by, and the columns it keeps statistics of
+CUBE_DIMENSIONS = ('origin', 'type', 'creator')
+CUBE_MEASURES = ('performance_score', 'composite_score', 'blended_price', 'speed_tokens_s')
+# Number of (by, filters) summaries kept
+SUMMARY_CACHE_SIZE = 64
+
+_STATS = ('count', 'sum', 'min', 'max')
+
+
+class _Groups:
+    """
+    Statistics of the finest groups, as flat arrays, and their roll-up into coarser groups.
+
+    Each dimension is factorized once, so rolling up is a bincount or an
+    ufunc.at over group codes, without building any pandas index on the way.
+    """
+
+    def __init__(self, keys: pd.DataFrame, stats: dict):
+        self.dimensions = list(keys.columns)
+        self.codes, self.levels = {}, {}
+        for dimension in self.dimensions:
+            codes, levels = pd.factorize(keys[dimension], sort=True, use_na_sentinel=False)
+            self.codes[dimension], self.levels[dimension] = codes, np.asarray(levels, dtype=object)
+        self.stats = stats  # name -> (stat, values per group)
+
+    def rollup(self, by: tuple, filters: tuple) -> pd.DataFrame:
+        selected = np.ones(len(next(iter(self.codes.values()), [])), dtype=bool)
+        for dimension, value in filters:
+            levels = self.levels[dimension]
+            matches = np.flatnonzero(pd.isna(levels) if value is None else levels == value)
+            selected &= np.isin(self.codes[dimension], matches)
+
+        if by:
+            combined = np.ravel_multi_index([self.codes[dimension][selected] for dimension in by],
+                                            [len(self.levels[dimension]) for dimension in by])
+            combos, groups = np.unique(combined, return_inverse=True)
+            level_codes = np.unravel_index(combos, [len(self.levels[dimension]) for dimension in by])
+            index = pd.MultiIndex.from_arrays([self.levels[dimension][codes] for dimension, codes in zip(by, level_codes)],
+                                              names=list(by))
+            if len(by) == 1:
+                index = index.get_level_values(0)
+        else:
+            groups = np.zeros(int(selected.sum()), dtype=np.intp)
+            index = pd.RangeIndex(1)
+        n_groups = len(index)
+
+        columns = {}
+        for name, (stat, values) in self.stats.items():
+            values = values[selected]
+            if stat in ('count', 'sum'):
+                columns[name] = np.bincount(groups, weights=values, minlength=n_groups)
+                if stat == 'count':
+                    columns[name] = columns[name].astype(np.int64)
+            elif values.dtype.kind == 'M':
+                rolled = np.full(n_groups, np.iinfo(np.int64).min)
+                np.maximum.at(rolled, groups, values.view(np.int64))
+                columns[name] = rolled.view(values.dtype)
+            else:
+                rolled = np.full(n_groups, np.nan)
+                (np.fmin if stat == 'min' else np.fmax).at(rolled, groups, values)
+                columns[name] = rolled
+        return pd.DataFrame(columns, index=index)
+
+
+def _summary_columns(rolled: pd.DataFrame, measures) -> pd.DataFrame:
+    """Turns rolled-up count/sum/min/max columns into count/min/max/mean per measure."""
+    columns = {}
+    for measure in measures:
+        count = rolled[f"{measure}_count"]
+        columns[f"{measure}_count"] = count
+        columns[f"{measure}_min"] = rolled[f"{measure}_min"]
+        columns[f"{measure}_max"] = rolled[f"{measure}_max"]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            columns[f"{measure}_mean"] = np.where(count > 0, rolled[f"{measure}_sum"] / count, np.nan)
+    for name in rolled.columns:
+        if name.rsplit('_', 1)[0] not in measures:
+            columns[name] = rolled[name]
+    return pd.DataFrame(columns, index=rolled.index)
+
+
+class AggregateCube:
+    """
+    Counts and score, price and speed statistics of the leaderboard, pre-grouped.
+
+    Built once per loaded frame, like LeaderboardIndex. The frame is grouped
+    once by every dimension together (origin, type and creator, and benchmark
+    for the per-benchmark scores), keeping count, sum, min and max of each
+    measure per group. Any coarser breakdown, down to the grand totals the KPI
+    cards show, is rolled up from those groups, so its cost depends on the
+    number of groups rather than the number of models. Summaries are kept in
+    an LRU cache.
+    """
+
+    def __init__(self, df: pd.DataFrame, dimensions=CUBE_DIMENSIONS, measures=CUBE_MEASURES, benchmarks=(),
+                 cache_size: int = SUMMARY_CACHE_SIZE):
+        """
+        Args:
+            df (pd.DataFrame): The leaderboard rows, one per model.
+            dimensions (tuple[str]): Columns to group by.
+            measures (tuple[str]): Numeric columns to keep count, min, max and mean of.
+            benchmarks (list[str]): Per-benchmark score columns, for benchmark_summary.
+            cache_size (int): Number of summaries kept in the LRU cache.
+        """
+        self.dimensions = tuple(dimensions)
+        self.measures = tuple(measure for measure in measures if measure in df)
+        self.benchmarks = list(benchmarks)
+
+        keys = [df[dimension].astype(object).rename(dimension) for dimension in self.dimensions]
+        grouped = df.groupby(keys, dropna=False, sort=False)
+        base = grouped[list(self.measures)].agg(list(_STATS))
+        stats = {f"{measure}_{stat}": (stat, base[(measure, stat)].to_numpy(float))
+                 for measure in self.measures for stat in _STATS}
+        stats['models'] = ('count', grouped.size().to_numpy())
+        stats['updated_at'] = ('max', grouped['updated_at'].max().to_numpy())
+        self._groups = _Groups(base.index.to_frame(index=False), stats)
+
+        self._benchmark_groups = None
+        if self.benchmarks:
+            scores = grouped[self.benchmarks].agg(list(_STATS))
+            scores.columns.names = ['benchmark', 'stat']
+            # One row per (dimensions..., benchmark)
+            scores = scores.stack('benchmark', future_stack=True)
+            self._benchmark_groups = _Groups(scores.index.to_frame(index=False),
+                                             {f"score_{stat}": (stat, scores[stat].to_numpy(float)) for stat in _STATS})
+
+        self.summary = lru_cache(maxsize=cache_size)(self._summary)
+        self.benchmark_summary = lru_cache(maxsize=cache_size)(self._benchmark_summary)
+
+    def _summary(self, by: tuple = (), filters: tuple = ()) -> pd.DataFrame:
+        """
+        Statistics per group of the `by` dimensions.
+
+        Args:
+            by (tuple[str]): Dimensions to break down by; () gives one row of grand totals.
+            filters (tuple): (dimension, value) pairs the models must match; None matches missing values.
+
+        Returns:
+            pd.DataFrame: Indexed by the `by` dimensions, with '<measure>_count', '_min', '_max'
+                and '_mean' for every measure, 'models' and 'updated_at' (the latest).
+        """
+        return _summary_columns(self._groups.rollup(tuple(by), tuple(filters)), self.measures)
+
+    def _benchmark_summary(self, by: tuple = (), filters: tuple = ()) -> pd.DataFrame:
+        """
+        Score statistics per benchmark, optionally broken down further by dimensions.
+
+        Args:
+            by (tuple[str]): Dimensions to break down by, besides the benchmark.
+            filters (tuple): (dimension, value) pairs the models must match.
+
+        Returns:
+            pd.DataFrame: Indexed by the `by` dimensions and 'benchmark', with 'score_count',
+                'score_min', 'score_max' and 'score_mean'.
+        """
+        if self._benchmark_groups is None:
+            raise ValueError("The cube was built without benchmark columns")
+        return _summary_columns(self._benchmark_groups.rollup(tuple(by) + ('benchmark',), tuple(filters)), ('score',))
+
+    def totals(self) -> pd.Series:
+        """Grand totals over every model, as one row of summary()."""
+        return self.summary().iloc[0]
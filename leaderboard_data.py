@@ -0,0 +1,161 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from leaderboard_ranking import RankingEngine
+from leaderboard_table import creator_logos
+
+DATA_DIR = Path(__file__).parent
+SCORES_PATH = DATA_DIR / "scores.csv"
+MODELS_PATH = DATA_DIR / "models.csv"
+
+# Number of loaded leaderboards kept. When the data changes the new snapshot replaces the old one,
+# which then lives on only until the reruns that already hold it finish.
+LOAD_CACHE_SIZE = 1
+
+# Text columns of a snapshot are Arrow strings: a few shared buffers per column instead of a Python
+# object per cell, and immutable, so every session can read the same copy
+TEXT_COLUMNS = ['model_name', 'creator', 'origin', 'type', 'logo']
+SNAPSHOT_TEXT_DTYPE = 'string[pyarrow]'
+
+# Columns the dashboard shows that the ETL does not produce; taken from models.csv when it has them
+METADATA_COLUMNS = ['price_input_usd_per_1m', 'price_output_usd_per_1m', 'speed_tokens_s', 'context_window_k']
+# Columns read_leaderboard puts in front of the one-per-benchmark score columns
+LEADERBOARD_COLUMNS = ['model_name', 'creator', 'origin', 'performance_score', 'composite_score', 'param_B', 'type',
+                       'updated_at', *METADATA_COLUMNS, 'logo', 'blended_price']
+# Scores above this are on their own scale (e.g. MME's ~2000 points) and are left out of performance_score
+PERCENT_SCALE_MAX = 100
+
+COUNTRY_NAMES = {
+    'CN': 'China', 'US': 'USA', 'JP': 'Japan', 'KR': 'South Korea', 'FR': 'France', 'CA': 'Canada',
+    'GB': 'UK', 'DE': 'Germany', 'IN': 'India', 'SG': 'Singapore', 'AE': 'UAE', 'IL': 'Israel',
+}
+
+# Columns of scores.csv (score_store.SCORE_COLUMNS), without importing pyarrow into the dashboard
+_SCORE_DTYPES = {'model_name': 'category', 'benchmark_name': 'category', 'score': float, 'param_B': float,
+                 'country': 'category', 'updated_at': 'category'}
+
+
+def file_signature(path) -> tuple:
+    """
+    (path, mtime_ns, size) of a file, or (path, None, None) if it does not exist or path is None.
+
+    Two signatures are equal only if the file was not rewritten in between, so
+    they make cache keys that go stale as soon as the ETL writes new data.
+    """
+    if path is None:
+        return None, None, None
+    path = Path(path).resolve()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return str(path), None, None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _model_metadata(models_path) -> pd.DataFrame:
+    """models.csv indexed by model name, or an empty frame if there is none."""
+    if models_path is None:
+        return pd.DataFrame(index=pd.Index([], name='model_name'))
+    models = pd.read_csv(models_path)
+    return models.drop_duplicates('model_name', keep='last').set_index('model_name')
+
+
+def benchmark_columns(df: pd.DataFrame) -> list:
+    """The per-benchmark score columns of a leaderboard frame."""
+    return [column for column in df.columns if column not in LEADERBOARD_COLUMNS]
+
+
+def as_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """The leaderboard frame with its text columns converted to Arrow strings, for sharing between sessions."""
+    return df.astype({column: SNAPSHOT_TEXT_DTYPE for column in TEXT_COLUMNS if column in df})
+
+
+def read_leaderboard(scores_path, models_path=None) -> pd.DataFrame:
+    """
+    Builds the wide leaderboard frame from the long-format score store.
+
+    Each (model, benchmark) score becomes one cell of a model x benchmark
+    matrix, filled in a single vectorized scatter; if a pair appears twice the
+    last row wins, as in upsert_scores. performance_score is the mean of a
+    model's percentage-scale benchmarks; composite_score is the mean of its
+    z-scored benchmarks, all of them, from leaderboard_ranking. Creator, license and the
+    METADATA_COLUMNS come from models.csv where it lists the model, and
+    blended_price is derived from the two prices.
+
+    Args:
+        scores_path: scores.csv written by process_benchmarks.
+        models_path: Optional models.csv with per-model metadata.
+
+    Returns:
+        pd.DataFrame: One row per model in the schema dashboard.py renders, followed by one
+            column per benchmark, with text columns as in as_snapshot.
+    """
+    scores = pd.read_csv(scores_path, usecols=list(_SCORE_DTYPES), dtype=_SCORE_DTYPES)
+    scores = scores[scores['model_name'].notna() & scores['benchmark_name'].notna()]
+    model_names = scores['model_name'].cat.remove_unused_categories()
+    benchmark_names = scores['benchmark_name'].cat.remove_unused_categories()
+    model_codes = model_names.cat.codes.to_numpy()
+
+    matrix = np.full((len(model_names.cat.categories), len(benchmark_names.cat.categories)), np.nan)
+    matrix[model_codes, benchmark_names.cat.codes.to_numpy()] = scores['score'].to_numpy()
+    wide = pd.DataFrame(matrix, columns=benchmark_names.cat.categories.astype(str))
+
+    # ISO timestamps sort as text, so the latest per model is the largest category code
+    timestamps = scores['updated_at'].cat.as_ordered()
+    latest = pd.Series(timestamps.cat.codes.to_numpy()).groupby(model_codes).max()
+    latest_text = pd.Categorical.from_codes(latest.to_numpy(), timestamps.cat.categories)
+    per_model = scores.groupby(model_codes)[['param_B', 'country']].last()
+
+    names = model_names.cat.categories.astype(str)
+    metadata = _model_metadata(models_path).reindex(names)
+    countries = per_model['country'].astype(object).to_numpy()
+    percent_scale = wide.columns[wide.max() <= PERCENT_SCALE_MAX]
+
+    df = pd.DataFrame({
+        'model_name': names,
+        'creator': metadata['organisation'].fillna('').to_numpy() if 'organisation' in metadata else '',
+        'origin': pd.Series(countries).map(lambda code: COUNTRY_NAMES.get(code, code)).to_numpy(),
+        'performance_score': wide[percent_scale].mean(axis=1).to_numpy(),
+        'composite_score': RankingEngine(matrix, names, wide.columns).composite,
+        'param_B': per_model['param_B'].to_numpy(),
+        'type': np.where(metadata['license'].notna(), 'Open Source', 'Proprietary')
+                if 'license' in metadata else 'Proprietary',
+        'updated_at': pd.to_datetime(latest_text, format='ISO8601', utc=True).tz_convert(None),
+    })
+    for column in METADATA_COLUMNS:
+        df[column] = pd.to_numeric(metadata[column], errors='coerce').to_numpy() if column in metadata else np.nan
+
+    df['logo'] = creator_logos(df['creator'])
+    df['blended_price'] = (df['price_input_usd_per_1m'] * 0.75) + (df['price_output_usd_per_1m'] * 0.25)
+    return as_snapshot(pd.concat([df, wide.drop(columns=df.columns.intersection(wide.columns))], axis=1))
+
+
+@lru_cache(maxsize=LOAD_CACHE_SIZE)
+def _load_leaderboard(scores_signature: tuple, models_signature: tuple) -> pd.DataFrame:
+    models_path = models_signature[0] if models_signature[1] is not None else None
+    return read_leaderboard(scores_signature[0], models_path)
+
+
+def load_leaderboard(scores_path=SCORES_PATH, models_path=MODELS_PATH) -> pd.DataFrame:
+    """
+    Returns the leaderboard frame, parsing the score store only when it changed.
+
+    Loaded frames are cached on the file_signature of both files, so a call on
+    unchanged files costs two stat() calls, and new data written by the ETL is
+    picked up on the next call without a restart. The returned frame is one
+    snapshot shared by every caller: it must not be modified. Rows should be
+    taken with iloc by position, which copies only the rows taken, and any
+    column read from it under pandas copy-on-write, so a write goes to a copy.
+
+    Args:
+        scores_path: scores.csv written by process_benchmarks.
+        models_path: models.csv with per-model metadata; it may be missing or None.
+
+    Returns:
+        pd.DataFrame: As from read_leaderboard.
+    """
+    return _load_leaderboard(file_signature(scores_path), file_signature(models_path))
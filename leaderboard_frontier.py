@@ -0,0 +1,154 @@
+from functools import lru_cache
+
+import numpy as np
+
+from leaderboard_index import RESULT_CACHE_SIZE, _read_only
+
+# Columns a model has to be beaten on all at once to fall off the frontier; their direction
+# (higher or lower is better) is the one the leaderboard sorts them in
+FRONTIER_OBJECTIVES = ('performance_score', 'blended_price', 'speed_tokens_s', 'context_window_k')
+
+
+def pareto_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Marks the rows no other row dominates, where higher is better in every column.
+
+    A row dominates another if it is at least as good in every column and
+    better in one; identical rows don't dominate each other, so both stay. With
+    two columns this is a sort and a running maximum, O(n log n). With more,
+    the row with the largest sum of per-column ranks is taken as a pivot: it
+    is on the frontier, and every row it dominates is dropped in one
+    vectorized pass. Pivots are taken until no rows are left, so the cost is
+    O(n log n) for the ranks plus one pass over the remaining rows per
+    frontier row, and each pass usually drops most of what is left.
+
+    Args:
+        values (np.ndarray): (rows x objectives) array without NaN; -inf is the worst value.
+
+    Returns:
+        np.ndarray: Boolean mask of the Pareto-efficient rows.
+    """
+    n_rows, n_objectives = values.shape
+    mask = np.zeros(n_rows, dtype=bool)
+    if n_rows == 0:
+        return mask
+    if n_objectives == 1:
+        return values[:, 0] == values[:, 0].max()
+
+    if n_objectives == 2:
+        # Descending by the first column, then by the second
+        order = np.lexsort((-values[:, 1], -values[:, 0]))
+        first, second = values[order, 0], values[order, 1]
+        # Best second value among rows strictly better on the first
+        new_group = np.r_[True, first[1:] != first[:-1]]
+        starts = np.flatnonzero(new_group)
+        group = np.cumsum(new_group) - 1
+        best = np.maximum.accumulate(second)
+        best_before = np.r_[-np.inf, best[starts[1:] - 1]][group]
+        # Within a tie on the first column only the best second value can survive. Nothing beats
+        # the first group on the first column, so it is kept even if its second value is -inf.
+        mask[order] = (second == second[starts][group]) & ((group == 0) | (second > best_before))
+        return mask
+
+    # Per-column ranks keep the dominance order and make the sums below exact
+    ranks = np.column_stack([np.unique(values[:, i], return_inverse=True)[1] for i in range(n_objectives)])
+    rank_sums = ranks.sum(axis=1)
+    remaining = np.arange(n_rows)
+    while remaining.size:
+        # A dominating row always has a larger rank sum, so the largest one left is never dominated
+        pivot = remaining[np.argmax(rank_sums[remaining])]
+        mask[pivot] = True
+        left, best = ranks[remaining], ranks[pivot]
+        dominated = (left <= best).all(axis=1) & (left < best).any(axis=1)
+        remaining = remaining[~dominated & (remaining != pivot)]
+    return mask
+
+
+class FrontierIndex:
+    """
+    Pareto frontiers and budget-constrained views over a LeaderboardIndex.
+
+    The frontier is the set of models no other model in the same filtered view
+    beats on every objective at once: nothing is better, cheaper, faster and
+    longer-context together. A missing value counts as the worst possible on
+    that objective, so a model without a price can still be on the frontier on
+    the strength of its score, but never because of its price.
+
+    Frontiers are computed once per filter state and budget views once per
+    (filters, sort, frontier, budget), both kept in LRU caches like the
+    index's own selections.
+    """
+
+    def __init__(self, index, objectives=FRONTIER_OBJECTIVES, cache_size: int = RESULT_CACHE_SIZE):
+        """
+        Args:
+            index (LeaderboardIndex): Index over the leaderboard frame; its sort keys give
+                each objective's direction.
+            objectives (tuple[str]): Columns the frontier is computed over.
+            cache_size (int): Number of frontiers, and of views, kept in the LRU caches.
+        """
+        self.index = index
+        self.objectives = tuple(objectives)
+        self._columns = {column: index.df[column].to_numpy(dtype=float)
+                         for column in dict.fromkeys(self.objectives + tuple(index.sort_keys))}
+        # Oriented so higher is better everywhere, with missing values as the worst
+        self._values = np.column_stack([
+            np.nan_to_num(self._columns[column] * (-1 if index.sort_keys[column] else 1), nan=-np.inf)
+            for column in self.objectives])
+
+        self.frontier_mask = lru_cache(maxsize=cache_size)(self._frontier_mask)
+        self.rows = lru_cache(maxsize=cache_size)(self._rows)
+
+    def _frontier_mask(self, filter_values: tuple) -> np.ndarray:
+        """
+        Which rows of the frame are on the frontier of the filtered view.
+
+        Args:
+            filter_values (tuple): As for LeaderboardIndex.rows.
+
+        Returns:
+            np.ndarray: Read-only boolean mask over every row of the frame.
+        """
+        selected = self.index.rows(filter_values, self.objectives[0])
+        mask = np.zeros(len(self.index.df), dtype=bool)
+        mask[selected[pareto_mask(self._values[selected])]] = True
+        return _read_only(mask)
+
+    def _rows(self, filter_values: tuple, sort_by: str, frontier_only: bool = False, budget: tuple = ()) -> np.ndarray:
+        """
+        Row positions of a filtered, sorted view, optionally cut to the frontier and to a budget.
+
+        Args:
+            filter_values (tuple): As for LeaderboardIndex.rows.
+            sort_by (str): One of the index's sort keys.
+            frontier_only (bool): Keep only the models on the frontier of the filtered view.
+            budget (tuple): (column, bound) pairs. The bound is a maximum for columns sorted
+                ascending, like blended_price, and a minimum for the others; models
+                without a value are left out.
+
+        Returns:
+            np.ndarray: Read-only positions for df.iloc, in display order.
+        """
+        rows = self.index.rows(filter_values, sort_by)
+        if frontier_only:
+            rows = rows[self.frontier_mask(filter_values)[rows]]
+        for column, bound in budget:
+            values = self._columns[column][rows]
+            rows = rows[values <= bound if self.index.sort_keys[column] else values >= bound]
+        return _read_only(rows)
+
+    def best_under(self, filter_values: tuple, budget: tuple, sort_by: str = 'performance_score',
+                   k: int = 10) -> np.ndarray:
+        """
+        The top `k` models by `sort_by` within a budget, e.g. the best scores under $X per 1M tokens.
+
+        Args:
+            filter_values (tuple): As for LeaderboardIndex.rows.
+            budget (tuple): As for rows, e.g. (('blended_price', 1.0),).
+            sort_by (str): One of the index's sort keys.
+            k (int): Number of models.
+
+        Returns:
+            np.ndarray: Row positions for df.iloc, best first.
+        """
+        return self.rows(filter_values, sort_by, False, tuple(budget))[:k]
@@ -0,0 +1,103 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Sort keys offered by the dashboard, mapped to whether they sort ascending
+SORT_ASCENDING = {
+    'performance_score': False,
+    'composite_score': False,
+    'blended_price': True,
+    'speed_tokens_s': False,
+    'context_window_k': False,
+}
+# How each sort key is offered to viewers
+SORT_LABELS = {
+    'performance_score': 'Performance (High to Low)',
+    'composite_score': 'Composite z-score (High to Low)',
+    'blended_price': 'Price (Low to High)',
+    'speed_tokens_s': 'Speed (High to Low)',
+    'context_window_k': 'Context (High to Low)',
+}
+FILTER_COLUMNS = ('origin', 'type')
+# Number of (filters, sort_by) results kept
+RESULT_CACHE_SIZE = 256
+
+
+def _read_only(positions: np.ndarray) -> np.ndarray:
+    positions.flags.writeable = False
+    return positions
+
+
+class LeaderboardIndex:
+    """
+    Precomputed filter groups and sort orders over the leaderboard frame.
+
+    Built once per loaded frame. Every value of each filter column is mapped to
+    the row positions holding it, and every sort key to the row positions in
+    sorted order, so a (filters, sort_by) selection is answered from those
+    arrays without copying, masking or sorting the frame. Selections are kept
+    in an LRU cache, so going back to a previous view is a dictionary lookup.
+
+    Orders are stable: rows that tie on the sort key stay in frame order, and
+    missing values sort last in either direction, as with pandas.
+    """
+
+    def __init__(self, df: pd.DataFrame, filter_columns=FILTER_COLUMNS, sort_keys: dict = None,
+                 cache_size: int = RESULT_CACHE_SIZE):
+        """
+        Args:
+            df (pd.DataFrame): The leaderboard rows. It must not be modified afterwards.
+            filter_columns (tuple[str]): Categorical columns that can be filtered on.
+            sort_keys (dict): Sort column -> ascending; defaults to SORT_ASCENDING.
+            cache_size (int): Number of selections kept in the LRU cache.
+        """
+        self.df = df
+        self.filter_columns = tuple(filter_columns)
+        self.sort_keys = dict(SORT_ASCENDING if sort_keys is None else sort_keys)
+
+        # Value -> sorted row positions, with values in order of first appearance
+        self.groups = {column: {value: _read_only(positions.astype(np.intp))
+                                for value, positions in df.groupby(column, sort=False).indices.items()}
+                       for column in self.filter_columns}
+        self.orders, self._ranks = {}, {}
+        for column, ascending in self.sort_keys.items():
+            order = (df[column].reset_index(drop=True)
+                     .sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy(np.intp))
+            rank = np.empty(len(df), dtype=np.intp)
+            rank[order] = np.arange(len(df))
+            self.orders[column], self._ranks[column] = _read_only(order), rank
+
+        self.rows = lru_cache(maxsize=cache_size)(self._rows)
+
+    def values(self, column: str) -> list:
+        """Distinct values of a filter column, in order of first appearance."""
+        return list(self.groups[column])
+
+    def _rows(self, filter_values: tuple, sort_by: str) -> np.ndarray:
+        """
+        Row positions of a filtered, sorted view of the frame.
+
+        Args:
+            filter_values (tuple): One value per filter column, in filter_columns order;
+                None leaves that column unfiltered.
+            sort_by (str): One of the sort keys.
+
+        Returns:
+            np.ndarray: Read-only positions for df.iloc, in display order.
+        """
+        selected = None
+        for column, value in zip(self.filter_columns, filter_values):
+            if value is None:
+                continue
+            positions = self.groups[column].get(value, np.empty(0, dtype=np.intp))
+            selected = positions if selected is None else np.intersect1d(selected, positions, assume_unique=True)
+
+        if selected is None:
+            return self.orders[sort_by]
+        # Order the selected rows by their rank in the precomputed order: O(k log k) for k rows
+        return _read_only(selected[np.argsort(self._ranks[sort_by][selected], kind='stable')])
+
+    def select(self, filter_values: tuple, sort_by: str) -> pd.DataFrame:
+        """The filtered, sorted rows as a DataFrame."""
+        return self.df.iloc[self.rows(filter_values, sort_by)]
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+# How each benchmark's scores are put on a common scale before they are combined
+NORMALIZATIONS = ('zscore', 'minmax')
+DEFAULT_NORMALIZATION = 'zscore'
+
+
+class RankingEngine:
+    """
+    Composite scores and ranks over a model x benchmark score matrix.
+
+    Every benchmark column is normalized on its own, by z-score or min-max over
+    the models that have a score for it, so benchmarks on different scales
+    (percentages, MME's ~2000 points) weigh the same. A model's composite is
+    the weighted mean of its normalized scores over the benchmarks it has;
+    missing cells are left out rather than counted as zero. Rank 1 is the
+    highest composite, ties share the better rank, and models without any
+    scored benchmark get no rank.
+
+    Everything is computed on whole NumPy arrays. `update` writes changed cells
+    and renormalizes only the benchmark columns they fall in, adjusting each
+    composite by the difference, so a handful of new scores costs one pass over
+    those columns instead of over the whole matrix.
+    """
+
+    def __init__(self, matrix, models, benchmarks, method: str = DEFAULT_NORMALIZATION, weights: dict = None):
+        """
+        Args:
+            matrix: Scores as a (models x benchmarks) array, NaN where a model has no score.
+            models: Model names, one per row.
+            benchmarks: Benchmark names, one per column.
+            method (str): One of NORMALIZATIONS.
+            weights (dict): Benchmark name -> weight of its column in the composite. Benchmarks
+                not listed weigh 1; a weight of 0 leaves a benchmark out.
+        """
+        if method not in NORMALIZATIONS:
+            raise ValueError(f"Unknown normalization {method!r}; expected one of {NORMALIZATIONS}")
+        self.matrix = np.array(matrix, dtype=float)
+        self.models = pd.Index(models)
+        self.benchmarks = pd.Index(benchmarks)
+        self.method = method
+        self._weights = self._weight_vector(weights)
+        self._recompute()
+
+    @classmethod
+    def from_scores(cls, scores: pd.DataFrame, **kwargs):
+        """
+        Builds the engine from long-format rows with model_name, benchmark_name and score.
+
+        If a (model, benchmark) pair appears twice the last row wins, as in upsert_scores.
+        """
+        models = scores['model_name'].astype('category')
+        benchmarks = scores['benchmark_name'].astype('category')
+        matrix = np.full((len(models.cat.categories), len(benchmarks.cat.categories)), np.nan)
+        matrix[models.cat.codes.to_numpy(), benchmarks.cat.codes.to_numpy()] = scores['score'].to_numpy(float)
+        return cls(matrix, models.cat.categories, benchmarks.cat.categories, **kwargs)
+
+    def _weight_vector(self, weights: dict) -> np.ndarray:
+        vector = np.ones(len(self.benchmarks))
+        for benchmark, weight in (weights or {}).items():
+            position = self.benchmarks.get_indexer([benchmark])[0]
+            if position < 0:
+                raise KeyError(f"Unknown benchmark {benchmark!r}")
+            vector[position] = weight
+        return vector
+
+    def _normalize(self, columns) -> tuple:
+        """Normalized copy of the given matrix columns with 0 where there is no score, and the 0/1 mask of scores."""
+        scores = self.matrix[:, columns]
+        present = ~np.isnan(scores)
+        counts = np.maximum(present.sum(axis=0), 1)
+        filled = np.where(present, scores, 0.0)
+        if self.method == 'zscore':
+            filled -= filled.sum(axis=0) / counts
+            filled *= present
+            std = np.sqrt(np.einsum('ij,ij->j', filled, filled) / counts)
+            # A benchmark every model scored the same on doesn't separate them: everyone sits at the mean
+            filled /= np.where(std > 0, std, 1.0)
+        else:
+            low = np.where(present, scores, np.inf).min(axis=0)
+            high = np.where(present, scores, -np.inf).max(axis=0)
+            spread = high - low
+            filled -= low
+            filled /= np.where(spread > 0, spread, 1.0)
+            filled[:, spread <= 0] = 0.5
+            filled *= present
+        return filled, present.astype(float)
+
+    @property
+    def normalized(self) -> np.ndarray:
+        """The normalized matrix, NaN where a model has no score."""
+        return np.where(self._present > 0, self._filled, np.nan)
+
+    def _recompute(self):
+        self._filled, self._present = self._normalize(slice(None))
+        self._weighted_sum = self._filled @ self._weights
+        self._weight_total = self._present @ self._weights
+        self._rank()
+
+    def _rank(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            composite = np.where(self._weight_total > 0, self._weighted_sum / self._weight_total, np.nan)
+        self.composite = composite
+        self.ranks = pd.Series(composite).rank(ascending=False, method='min').to_numpy()
+
+    def update(self, changes: pd.DataFrame) -> int:
+        """
+        Applies changed scores and refreshes the composites and ranks.
+
+        Only the benchmark columns that hold a changed cell are renormalized. Models
+        or benchmarks the engine hasn't seen are added, which recomputes everything.
+
+        Args:
+            changes (pd.DataFrame): Rows with model_name, benchmark_name and score;
+                a NaN score removes the cell.
+
+        Returns:
+            int: Number of benchmark columns that were renormalized.
+        """
+        changes = changes.drop_duplicates(['model_name', 'benchmark_name'], keep='last')
+        new_models = pd.Index(changes['model_name'].unique()).difference(self.models)
+        new_benchmarks = pd.Index(changes['benchmark_name'].unique()).difference(self.benchmarks)
+        if len(new_models) or len(new_benchmarks):
+            self.matrix = np.pad(self.matrix, ((0, len(new_models)), (0, len(new_benchmarks))),
+                                 constant_values=np.nan)
+            self.models = self.models.append(new_models)
+            self.benchmarks = self.benchmarks.append(new_benchmarks)
+            self._weights = np.concatenate([self._weights, np.ones(len(new_benchmarks))])
+
+        rows = self.models.get_indexer(changes['model_name'])
+        columns = self.benchmarks.get_indexer(changes['benchmark_name'])
+        self.matrix[rows, columns] = changes['score'].to_numpy(float)
+        if len(new_models) or len(new_benchmarks):
+            self._recompute()
+            return len(self.benchmarks)
+
+        touched = np.unique(columns)
+        weights = self._weights[touched]
+        filled, present = self._normalize(touched)
+        self._weighted_sum += (filled - self._filled[:, touched]) @ weights
+        self._weight_total += (present - self._present[:, touched]) @ weights
+        self._filled[:, touched] = filled
+        self._present[:, touched] = present
+        self._rank()
+        return len(touched)
+
+    def set_weights(self, weights: dict):
+        """Replaces the benchmark weights; the normalized scores are reused as they are."""
+        self._weights = self._weight_vector(weights)
+        self._weighted_sum = self._filled @ self._weights
+        self._weight_total = self._present @ self._weights
+        self._rank()
+
+    def results(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: 'composite_score', 'rank' and 'benchmarks_scored' per model, indexed by model name.
+        """
+        return pd.DataFrame({
+            'composite_score': self.composite,
+            'rank': pd.array(self.ranks, dtype='Int64'),
+            'benchmarks_scored': self._present.sum(axis=1).astype(int),
+        }, index=self.models.rename('model_name'))
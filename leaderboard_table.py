@@ -0,0 +1,198 @@
+import html
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from logo_cache import LOGO_DISPLAY_SIZE, logo_data_uri
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+# Rows rendered per page of the leaderboard, and the choices offered in the dashboard
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZE_OPTIONS = (25, 50, 100, 250)
+
+# It's better to manage logos in code for this custom table
+# We'll create a mapping from creator name to logo filename.
+LOGO_MAP = {
+    "ZhipuAI": "zhipuai.png",
+    "Alibaba": "alibaba.png",
+    "DeepSeek": "deepseek.png",
+    "01.AI": "01ai.png",
+    "Google": "google.png",
+    "OpenAI": "openai.png",
+    "Meta": "meta.png",
+    "Mistral AI": "mistralai.png",
+    "Microsoft": "microsoft.png",
+    "TinyLlama":   "tinyllama.png",
+    "OpenChat":    "openchat.png",
+    "Cohere":      "cohere.png"
+}
+# Trailing words of models.csv organisation names that the LOGO_MAP keys leave out, e.g. "Alibaba Cloud"
+ORGANISATION_SUFFIXES = {'ai', 'cloud', 'inc', 'inc.', 'labs'}
+
+
+def _organisation_key(name: str) -> str:
+    words = name.lower().split()
+    while len(words) > 1 and words[-1] in ORGANISATION_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+_LOGOS_BY_KEY = {_organisation_key(creator): logo for creator, logo in LOGO_MAP.items()}
+
+
+def creator_logos(creators: pd.Series) -> pd.Series:
+    """
+    Logo filename per creator, or NaN for creators without one.
+
+    Creators are matched on their name without case or trailing corporate
+    words, so the organisation names of models.csv ("DeepSeek AI", "Alibaba
+    Cloud") find the same logos as the LOGO_MAP keys ("DeepSeek", "Alibaba").
+    """
+    logos = {creator: _LOGOS_BY_KEY.get(_organisation_key(str(creator))) for creator in creators.dropna().unique()}
+    return creators.map(logos)
+
+# Same proportions the per-row st.columns([3, 2, 2, 2, 2]) layout used
+TABLE_CSS = """
+<style>
+    .leaderboard-grid {
+        display: grid;
+        grid-template-columns: 3fr 2fr 2fr 2fr 2fr;
+        column-gap: 1rem;
+        align-items: center;
+    }
+    .leaderboard-grid > div {
+        padding: 0.5rem 0;
+    }
+    .leaderboard-grid .model-cell {
+        display: flex;
+        align-items: center;
+        gap: 0.75rem;
+    }
+    .leaderboard-grid .frontier-badge {
+        margin-left: 0.4rem;
+        color: var(--primary-color);
+    }
+    .leaderboard-grid .logo-img {
+        flex: none;
+        width: %dpx;
+        height: %dpx;
+        background: left center / contain no-repeat;
+    }
+</style>
+""" % LOGO_DISPLAY_SIZE
+
+HEADER_HTML = (
+    "<div class='table-header model-col'>MODEL</div>"
+    "<div class='table-header'>PERFORMANCE</div>"
+    "<div class='table-header'>PRICE (blended)</div>"
+    "<div class='table-header'>SPEED</div>"
+    "<div class='table-header'>CONTEXT</div>"
+)
+
+# Marks the models on the price/performance frontier of the current view
+FRONTIER_BADGE = ("<span class='frontier-badge' title='Pareto-efficient: no other model in this view is better, "
+                  "cheaper, faster and longer-context at once'>◆</span>")
+
+LOGO_PLACEHOLDER = "<div class='logo-img' style='background-color:#333;'></div>"
+# Shown for metrics the data does not have, e.g. prices the ETL did not collect
+MISSING_VALUE = "–"
+
+
+def _logo_html(logos: pd.Series, assets_dir: Path):
+    """
+    Emits each distinct logo once, as a CSS class, and points every row at its class.
+
+    Returns:
+        tuple: (<style> block with one rule per logo, Series of per-row logo elements).
+    """
+    rules, tags = [], {}
+    for logo in logos.dropna().unique():
+        uri = logo_data_uri(assets_dir / logo)
+        if uri:
+            css_class = f"logo-{len(rules)}"
+            rules.append(f".leaderboard-grid .{css_class} {{ background-image: url('{uri}'); }}")
+            tags[logo] = f"<div class='logo-img {css_class}'></div>"
+    css = "<style>" + "".join(rules) + "</style>" if rules else ""
+    return css, logos.map(tags).fillna(LOGO_PLACEHOLDER)
+
+
+def _fmt(values: pd.Series, pattern: str) -> np.ndarray:
+    """Formats a numeric column with one printf-style pattern for the whole array; missing values show as a dash."""
+    values = values.to_numpy(dtype=float)
+    missing = np.isnan(values)
+    formatted = np.char.mod(pattern, np.where(missing, 0, values)).astype(object)
+    formatted[missing] = MISSING_VALUE
+    return formatted
+
+
+def _metric(values, unit: str) -> np.ndarray:
+    return "<div class='table-row'><div class='metric-value'>" + values + \
+        f"</div><div class='metric-unit'>{unit}</div></div>"
+
+
+def leaderboard_page(df: pd.DataFrame, order, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> pd.DataFrame:
+    """
+    Returns one page of the leaderboard.
+
+    Only the rows of the requested page are taken from the frame; the rest of
+    the view is never materialized.
+
+    Args:
+        df (pd.DataFrame): The full leaderboard frame.
+        order (np.ndarray): Row positions of the filtered, sorted view, as from LeaderboardIndex.rows.
+        page (int): 1-based page number; clamped to the pages that exist.
+        page_size (int): Number of rows per page.
+
+    Returns:
+        pd.DataFrame: At most `page_size` rows.
+    """
+    page = min(max(page, 1), page_count(len(order), page_size))
+    start = (page - 1) * page_size
+    return df.iloc[order[start:start + page_size]]
+
+
+def page_count(n_rows: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """Number of pages needed for `n_rows` rows; at least one, so an empty table still has a page."""
+    return max(1, -(-n_rows // page_size))
+
+
+def render_leaderboard_html(sorted_df: pd.DataFrame, assets_dir: Path = ASSETS_DIR, frontier=None) -> str:
+    """
+    Renders the leaderboard table as one HTML block.
+
+    Every cell is built with column-wise string operations over the DataFrame, so
+    the whole table goes to Streamlit as a single markdown element instead of a
+    row of st.columns per model. Each distinct logo is embedded once as a CSS
+    class rather than once per row.
+
+    Args:
+        sorted_df (pd.DataFrame): The filtered, sorted leaderboard rows.
+        assets_dir (Path): Directory the `logo` filenames are relative to.
+        frontier (np.ndarray): Optional per-row flags; flagged models get FRONTIER_BADGE.
+
+    Returns:
+        str: The table markup, to be passed to st.markdown(..., unsafe_allow_html=True).
+    """
+    if sorted_df.empty:
+        return TABLE_CSS + "<div class='leaderboard-grid'>" + HEADER_HTML + "</div>"
+
+    names = sorted_df['model_name'].astype(str).map(html.escape).to_numpy(dtype=object)
+    if frontier is not None:
+        names = names + np.where(frontier, FRONTIER_BADGE, '').astype(object)
+    creators = sorted_df['creator'].astype(str).map(html.escape).to_numpy(dtype=object)
+    logo_css, logos = _logo_html(sorted_df['logo'], Path(assets_dir))
+    logos = logos.to_numpy(dtype=object)
+
+    model_cells = ("<div class='table-row model-cell'>" + logos +
+                   "<div><div class='model-name'>" + names + "</div><div class='creator-name'>" + creators +
+                   "</div></div></div>")
+    # '&#36;' rather than '$': Streamlit's markdown would read pairs of dollar signs as LaTeX
+    rows = (model_cells +
+            _metric(_fmt(sorted_df['performance_score'], '%.1f'), "Mean Score (%)") +
+            _metric(_fmt(sorted_df['blended_price'], '&#36;%.4f'), "USD/1M Tokens") +
+            _metric(_fmt(sorted_df['speed_tokens_s'], '%d'), "Tokens/s") +
+            _metric(_fmt(sorted_df['context_window_k'], '%dk'), "Tokens"))
+
+    return TABLE_CSS + logo_css + "<div class='leaderboard-grid'>" + HEADER_HTML + "".join(rows) + "</div>"
@@ -0,0 +1,50 @@
+import base64
+import io
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image
+
+# Box the leaderboard displays logos in (CSS pixels). Thumbnails are rendered at
+# twice that so they stay sharp on high-DPI screens.
+LOGO_DISPLAY_SIZE = (120, 32)
+LOGO_SCALE = 2
+
+
+@lru_cache(maxsize=256)
+def _encode_logo(path: str, mtime_ns: int, size: int, box: tuple) -> str:
+    """Downsizes and encodes one logo. Keyed by mtime and size so an edited file is picked up."""
+    with Image.open(path) as image:
+        image = image.convert('RGBA')
+        image.thumbnail(box, Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def logo_data_uri(path, display_size: tuple = LOGO_DISPLAY_SIZE) -> str:
+    """
+    Returns a base64 data URI of a logo, downsized to the leaderboard's thumbnail size.
+
+    Encoded thumbnails are cached for the lifetime of the process, so reruns only
+    pay for a stat() per logo.
+
+    Args:
+        path: Path of the logo image.
+        display_size (tuple): (width, height) box the logo is displayed in, in CSS pixels.
+
+    Returns:
+        str | None: The data URI, or None if the path is not a readable image file.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    box = (display_size[0] * LOGO_SCALE, display_size[1] * LOGO_SCALE)
+    try:
+        return _encode_logo(str(path.resolve()), stat.st_mtime_ns, stat.st_size, box)
+    except OSError:
+        return None
@@ -0,0 +1,59 @@
+from collections import defaultdict
+
+# Length of the character n-grams used to index result keys
+NGRAM_SIZE = 3
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class ModelKeyIndex:
+    """
+    A trigram index over the model keys of one parsed benchmark file.
+
+    Keys are lowercased and indexed once per document. Lookups keep the original
+    matching rule -- `model_name.lower() in model_key.lower()` -- and return the
+    matching keys in document order, but only the keys that share every trigram
+    of the model name are checked with the substring test.
+    """
+
+    def __init__(self, results: dict):
+        self.results = results
+        self.keys = list(results)
+        self.lowered_keys = [key.lower() for key in self.keys]
+        self.postings = defaultdict(set)
+        for position, key in enumerate(self.lowered_keys):
+            for gram in _ngrams(key):
+                self.postings[gram].add(position)
+
+    def _candidates(self, needle: str):
+        if len(needle) < NGRAM_SIZE:
+            # Too short to index; fall back to scanning the pre-lowered keys
+            return range(len(self.keys))
+        postings = []
+        for gram in _ngrams(needle):
+            positions = self.postings.get(gram)
+            if not positions:
+                return []
+            postings.append(positions)
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+
+    def find(self, model_name: str) -> list:
+        """
+        Finds the result keys that contain `model_name`, ignoring case.
+
+        Args:
+            model_name (str): The model name from models.csv.
+
+        Returns:
+            list[str]: Matching keys, in the order they appear in the document.
+        """
+        needle = model_name.lower()
+        return [self.keys[i] for i in self._candidates(needle) if needle in self.lowered_keys[i]]
+
+    def items(self, model_name: str):
+        """Yields (model_key, benchmarks) for every key that matches `model_name`."""
+        for key in self.find(model_name):
+            yield key, self.results[key]
@@ -1,32 +1,356 @@
+import argparse
 import pandas as pd
+import pyarrow as pa
 import requests
 import io
 import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 
+from fetcher import CHUNK_SIZE, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT, FetchPolicy, SpooledResponse, fetch_all
+from http_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_BYTES, ResponseCache
+from json_stream import iter_results
+from source_readers import read_csv_source, read_parquet_source
+from matching import ModelKeyIndex
+from score_history import ScoreHistory
+from score_store import SCORE_COLUMNS, upsert_scores, write_scores_parquet
+from run_report import RunReport
+
+logger = logging.getLogger(__name__)
+
+# Worker processes that decode and match the fetched files; 1 does it in the calling process.
+# The benchmark sources are small JSON documents, for which starting a pool and shipping bytes
+# to it costs more than it saves (see benchmarks/bench_parse_pool.py), so the pool is opt-in.
+DEFAULT_PARSE_WORKERS = 1
+
 # Example output row:
 # model_name,benchmark_name,score,param_B,country,updated_at
 # gpt-4,MMLU,0.864,1750,USA,2023-11-15T12:30:00Z
 
-def fetch_and_process_benchmarks(input_csv_path: str, output_csv_path: str):
+def parse_benchmark_file(response, url: str):
+    """
+    Parses a fetched benchmark file once, so every model that points at it can be matched against it.
+
+    JSON files are streamed one model block at a time, and only the 'Overall' score of
+    each benchmark is kept, so peak memory does not grow with the size of the document.
+    CSV files are parsed in chunks and Parquet files one row group at a time, both
+    reading only the columns that carry scores.
+
+    Args:
+        response (fetcher.SpooledResponse): The fetched benchmark file.
+        url (str): The URL the file was fetched from.
+
+    Returns:
+        dict | None: The model_key -> {benchmark_name: {'Overall': score}} mapping of the file,
+            or None if the file can't be used.
+    """
+    # --- Data Extraction Logic ---
+    if 'json' in response.headers.get('Content-Type', '') or url.endswith('.json'):
+        results = {}
+        try:
+            # Handle the specific structure of OpenVLM.json
+            for model_key, benchmarks in iter_results(response.iter_content(CHUNK_SIZE)):
+                if isinstance(benchmarks, dict):
+                    results[model_key] = {benchmark_name: {'Overall': scores['Overall']}
+                                          for benchmark_name, scores in benchmarks.items()
+                                          if isinstance(scores, dict) and 'Overall' in scores}
+        except json.JSONDecodeError:
+            logger.warning("Failed to decode JSON from %s. Skipping.", url)
+            return None
+        return results
+
+    elif 'csv' in response.headers.get('Content-Type', '') or url.endswith('.csv'):
+        try:
+            return read_csv_source(response.file())
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+            logger.warning("Failed to parse CSV from %s. Error: %s. Skipping.", url, e)
+            return None
+
+    elif 'parquet' in response.headers.get('Content-Type', '') or url.endswith('.parquet'):
+        try:
+            return read_parquet_source(response.file())
+        except pa.ArrowException as e:
+            logger.warning("Failed to read Parquet from %s. Error: %s. Skipping.", url, e)
+            return None
+
+    else:
+        logger.warning("Skipping unsupported file type at %s", url)
+        return None
+
+
+def match_model_rows(index: ModelKeyIndex, model_name: str, param_B, country, updated_at: str) -> list:
+    """
+    Extracts the normalized score rows for one model from a parsed benchmark file.
+
+    Rows are tuples in SCORE_COLUMNS order, which is what the parse workers send
+    back: they pickle far smaller and faster than dicts repeating every column name.
+
+    Args:
+        index (ModelKeyIndex): Index over the mapping returned by parse_benchmark_file.
+        model_name (str): Name of the model to look up in the file.
+        param_B: Parameter count (in billions) copied onto every row.
+        country: Country code copied onto every row.
+        updated_at (str): Timestamp copied onto every row.
+
+    Returns:
+        list[tuple]: Score rows in the output schema. Empty if nothing matched.
+    """
+    rows = []
+    # Checked once per model: formatting a debug line per score would dominate large runs
+    log_scores = logger.isEnabledFor(logging.DEBUG)
+    # Every key of the JSON that contains the model name from the CSV
+    for model_key, benchmarks in index.items(model_name):
+        if not isinstance(benchmarks, dict):
+            continue
+        for benchmark_name, scores in benchmarks.items():
+            if isinstance(scores, dict) and 'Overall' in scores:
+                rows.append((model_name, benchmark_name, scores['Overall'], param_B, country, updated_at))
+                if log_scores:
+                    logger.debug("  - Found score for %s: %s -> %s", model_name, benchmark_name, scores['Overall'])
+    return rows
+
+
+def _extract(url: str, decode, models: list, updated_at: str) -> dict:
+    """Decodes one source with `decode()` and matches `models` against it; see extract_source."""
+    extracted = {'results': None, 'rows': None, 'result_keys': 0, 'match_seconds': 0.0, 'errors': []}
+    start = time.perf_counter()
+    try:
+        extracted['results'] = results = decode()
+    except Exception as e:
+        extracted['errors'].append((f"decode:{type(e).__name__}", None, str(e)))
+        results = None
+    extracted['decode_seconds'] = time.perf_counter() - start
+    if not results:
+        return extracted
+
+    start = time.perf_counter()
+    index = ModelKeyIndex(results)
+    extracted['result_keys'] = len(results)
+    extracted['rows'] = rows = []
+    for model_name, param_B, country in models:
+        logger.debug("Processing %s from %s...", model_name, url)
+        try:
+            rows.append(match_model_rows(index, model_name, param_B, country, updated_at))
+        except Exception as e:
+            rows.append(None)
+            extracted['errors'].append((f"match:{type(e).__name__}", model_name, str(e)))
+    extracted['match_seconds'] = time.perf_counter() - start
+    return extracted
+
+
+def extract_source(url: str, content_type: str, body: bytes, models: list, updated_at: str,
+                   cached: bool = False, keep_payload: bool = False) -> dict:
+    """
+    Decodes one fetched benchmark file and extracts the score rows of every model that points at it.
+
+    This is the CPU-bound part of the pipeline. It takes and returns only plain,
+    picklable values, so fetch_and_process_benchmarks can run it in worker processes.
+
+    Args:
+        url (str): The URL the file was fetched from.
+        content_type (str): The Content-Type the server sent.
+        body (bytes): The raw file, or the cached JSON payload when `cached` is set.
+        models (list[tuple]): (model_name, param_B, country) of each model to match, in input order.
+        updated_at (str): Timestamp copied onto every row.
+        cached (bool): `body` is a payload from the response cache rather than a download.
+        keep_payload (bool): Also return the parsed payload JSON-encoded, for the response cache.
+
+    Returns:
+        dict: 'rows' (one list of SCORE_COLUMNS tuples per model, None for a model that
+            failed, or None for the whole source if it decoded to nothing), 'decoded'
+            (False if the file couldn't be used), 'result_keys', 'payload', 'decode_seconds',
+            'match_seconds' and 'errors' as (category, model_name, message) tuples.
+    """
+    if cached:
+        def decode():
+            return json.loads(body)
+    else:
+        def decode():
+            response = SpooledResponse(url, 200, {'Content-Type': content_type}, io.BytesIO(body))
+            return parse_benchmark_file(response, url)
+
+    extracted = _extract(url, decode, models, updated_at)
+    results = extracted.pop('results')
+    extracted['decoded'] = results is not None
+    extracted['payload'] = json.dumps(results).encode('utf-8') if keep_payload and results is not None else None
+    return extracted
+
+
+def _load_cached(url: str, cache, report: RunReport):
+    """Reads the cached payload of a source that got a 304 reply, or returns None (and reports why) if it is gone."""
+    cached = cache.load_bytes(url)
+    if cached is None:
+        logger.warning("Cached copy of %s is missing. Skipping; the next run downloads it again.", url)
+        report.fail('cache:unreadable', url)
+        return None
+    report.count('cache_hits', source=url)
+    return cached
+
+
+def _extract_in_process(url: str, response, cached: bool, models: list, updated_at: str, cache,
+                        report: RunReport):
+    """
+    Does extract_source's work in this process, streaming the response instead of reading it whole.
+
+    Returns None if the source was answered from the cache and its cached copy is gone.
+    """
+    if cached:
+        payload = _load_cached(url, cache, report)
+        if payload is None:
+            return None
+        extracted = _extract(url, lambda: json.loads(payload), models, updated_at)
+    else:
+        try:
+            extracted = _extract(url, lambda: parse_benchmark_file(response, url), models, updated_at)
+            if extracted['results'] is not None and cache is not None:
+                cache.store(url, response, extracted['results'])
+        finally:
+            response.close()
+    extracted['decoded'] = extracted.pop('results') is not None
+    return extracted
+
+
+def _extract_in_pool(work: list, models_by_url: dict, updated_at: str, cache, parse_workers: int,
+                     report: RunReport) -> dict:
+    """
+    Runs extract_source for every (url, response, cached) of `work` on a process pool.
+
+    A body, downloaded or cached, is read into memory only when its source is submitted,
+    and at most two per worker are in flight, so peak memory doesn't grow with the
+    number of sources. Sources whose cached copy is gone are left out of the result.
+    """
+    extracted = {}
+    pending = {}
+    work = iter(work)
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        while True:
+            while len(pending) < 2 * parse_workers:
+                item = next(work, None)
+                if item is None:
+                    break
+                url, response, cached = item
+                if cached:
+                    payload = _load_cached(url, cache, report)
+                    if payload is None:
+                        continue
+                    future = pool.submit(extract_source, url, 'application/json', payload, models_by_url[url],
+                                         updated_at, cached=True)
+                else:
+                    try:
+                        body = response.file().read()
+                    finally:
+                        response.close()
+                    future = pool.submit(extract_source, url, response.headers.get('Content-Type', ''), body,
+                                         models_by_url[url], updated_at,
+                                         keep_payload=cache is not None and cache.wants(response))
+                pending[future] = (url, response)
+            if not pending:
+                return extracted
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, response = pending.pop(future)
+                try:
+                    result = extracted[url] = future.result()
+                except Exception as e:
+                    # The worker itself failed, e.g. it was killed or the result didn't pickle
+                    extracted[url] = {'rows': None, 'decoded': False, 'result_keys': 0, 'decode_seconds': 0.0,
+                                      'match_seconds': 0.0, 'errors': [(f"decode:{type(e).__name__}", None, str(e))]}
+                    continue
+                payload = result.pop('payload')
+                if payload is not None:
+                    cache.store_bytes(url, response, payload)
+
+
+def _record_extraction(url: str, extracted: dict, models: list, report: RunReport):
+    """Logs and reports how decoding and matching one source went."""
+    report.record('decode', extracted['decode_seconds'], url)
+    decode_failed = False
+    for category, model_name, error in extracted['errors']:
+        if model_name is None:
+            decode_failed = True
+            # Catch other potential errors during file processing
+            logger.warning("An error occurred while processing the file at %s for %s. Error: %s. Skipping.",
+                           url, ', '.join(name for name, _, _ in models), error)
+        else:
+            logger.warning("An error occurred while processing the file for %s. Error: %s. Skipping.",
+                           model_name, error)
+        report.fail(category, url, error)
+    if not extracted['decoded'] and not decode_failed:
+        report.fail('decode', url)
+    if extracted['rows'] is not None:
+        report.record('match', extracted['match_seconds'], url)
+        report.count('result_keys', extracted['result_keys'], source=url)
+
+
+def fetch_and_process_benchmarks(input_csv_path: str, output_csv_path: str,
+                                 max_workers: int = DEFAULT_MAX_WORKERS,
+                                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                                 cache_dir: str = DEFAULT_CACHE_DIR,
+                                 cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                                 incremental: bool = True,
+                                 parquet_dir: str = None,
+                                 fetch_policy: FetchPolicy = None,
+                                 parse_workers: int = DEFAULT_PARSE_WORKERS,
+                                 history_dir: str = None,
+                                 report: RunReport = None) -> RunReport:
     """
     Reads a CSV of models, fetches benchmark data from URLs, and outputs a normalized CSV.
 
+    Models are grouped by URL, so each distinct benchmark file is downloaded and parsed
+    once no matter how many models point at it. Downloads run concurrently on a bounded
+    thread pool sharing one HTTP session. Decoding and matching are CPU-bound; with
+    `parse_workers` above 1 and more than one source they run on a pool of processes,
+    each taking a file's raw bytes and returning its rows as tuples, which pays off
+    for large documents on several cores. The rows are put back in input
+    order, so the output matches a serial run. Sources that send ETag or Last-Modified
+    are cached on disk and revalidated with conditional GETs, so unchanged files are not
+    downloaded or parsed again. In incremental mode the scores are upserted into the
+    existing output file, so unchanged scores keep their original `updated_at`.
+
+    Progress goes to the module's logger: failures as warnings, per-source and summary
+    lines as info, and per-model and per-score lines only at debug level.
+
     Args:
         input_csv_path (str): Path to the input CSV file with model information.
         output_csv_path (str): Path to write the final normalized scores CSV.
+        max_workers (int): Maximum number of downloads in flight at once.
+        per_host_limit (int): Maximum number of downloads in flight against a single host.
+        cache_dir (str): Directory of the response cache. Pass None to always download in full.
+        cache_max_bytes (int): Size limit of the cached payloads before old entries are evicted.
+        incremental (bool): Upsert into the existing output file instead of overwriting it.
+        parquet_dir (str): Optional directory of a Parquet copy of the scores, partitioned by
+            benchmark_name and country. Only the partitions that changed are rewritten.
+        fetch_policy (FetchPolicy): Retry, backoff, per-host rate limit, circuit breaker and
+            refresh deadline settings for the downloads. Defaults to FetchPolicy().
+        parse_workers (int): Processes that decode and match the fetched files. With 1, or a
+            single source, it is done in the calling process instead.
+        history_dir (str): Optional directory of a score_history.ScoreHistory. Every run's
+            scores are appended to it, and only the ones that changed are stored.
+        report (RunReport): Report to record the run in; a new one is created if omitted.
+
+    Returns:
+        RunReport: Time spent fetching, decoding and matching each source and writing the
+            output, with bytes downloaded, cache hits, retries, rows emitted and failures.
     """
+    report = report if report is not None else RunReport()
     try:
         models_df = pd.read_csv(input_csv_path)
     except FileNotFoundError:
-        print(f"Error: Input file not found at {input_csv_path}")
-        return
+        logger.error("Input file not found at %s", input_csv_path)
+        report.fail('input:missing')
+        report.finish()
+        return report
 
-    all_scores = []
     # Get the current timestamp for the 'updated_at' column
     current_timestamp = datetime.utcnow().isoformat() + "Z"
 
-    # Iterate through each model in the input CSV
+    # Collect every model with a usable URL, grouped by the URL it points at
+    jobs = []
+    models_by_url = {}
     for _, row in models_df.iterrows():
         model_name = row['model_name']
         url = row['primary_benchmark_url']
@@ -34,68 +358,145 @@ def fetch_and_process_benchmarks(input_csv_path: str, output_csv_path: str):
         country = row.get('country')
 
         if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
-            print(f"Skipping invalid URL for {model_name}: {url}")
+            logger.warning("Skipping invalid URL for %s: %s", model_name, url)
+            report.fail('input:invalid_url')
             continue
 
-        print(f"Processing {model_name} from {url}...")
+        jobs.append((model_name, url, param_B, country))
+        models_by_url.setdefault(url, []).append((model_name, param_B, country))
+    report.count('models', len(jobs))
+    report.count('sources', len(models_by_url))
 
-        try:
-            # Fetch the benchmark file from the URL
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+    # Fetch each distinct benchmark file once, concurrently
+    urls = list(models_by_url)
+    logger.info("Fetching %d benchmark files for %d models with up to %d workers...", len(urls), len(jobs), max_workers)
+    cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+    responses = fetch_all(urls, max_workers=max_workers, per_host_limit=per_host_limit, cache=cache,
+                          policy=fetch_policy, report=report)
 
-            # --- Data Extraction Logic ---
-            if 'json' in response.headers.get('Content-Type', '') or url.endswith('.json'):
-                try:
-                    data = response.json()
-                    # Handle the specific structure of OpenVLM.json
-                    if 'results' in data:
-                        for model_key, benchmarks in data['results'].items():
-                            # Check if the model from the JSON matches the one from the CSV
-                            if model_name.lower() in model_key.lower():
-                                for benchmark_name, scores in benchmarks.items():
-                                    if isinstance(scores, dict) and 'Overall' in scores:
-                                        score_data = {
-                                            'model_name': model_name,
-                                            'benchmark_name': benchmark_name,
-                                            'score': scores['Overall'],
-                                            'param_B': param_B,
-                                            'country': country,
-                                            'updated_at': current_timestamp
-                                        }
-                                        all_scores.append(score_data)
-                                        print(f"  - Found score for {model_name}: {benchmark_name} -> {scores['Overall']}")
-                except json.JSONDecodeError:
-                    print(f"Failed to decode JSON from {url} for {model_name}. Skipping.")
-
-            # Placeholder for other file types (CSV, Parquet)
-            # This section can be expanded to handle other data formats
-            elif 'csv' in response.headers.get('Content-Type', '') or url.endswith('.csv'):
-                print(f"Skipping CSV file for {model_name} at {url} (implementation pending).")
-
-            elif url.endswith('.parquet'):
-                print(f"Skipping Parquet file for {model_name} at {url} (implementation pending).")
+    # Decode each distinct benchmark file once and match its models against it
+    work = []
+    for url, response in zip(urls, responses):
+        if isinstance(response, requests.exceptions.RequestException):
+            logger.warning("Could not fetch URL %s for %s. Error: %s. Skipping.",
+                           url, ', '.join(name for name, _, _ in models_by_url[url]), response)
+            report.fail(f"fetch:{type(response).__name__}", url, response)
+            continue
+        # A 304 source's cached payload is only read when it is extracted, so they aren't all in memory at once
+        cached = response.status_code == 304 and cache is not None
+        if cached:
+            response.close()
+        elif cache is not None:
+            cache.record_miss()
+        work.append((url, response, cached))
 
-            else:
-                print(f"Skipping unsupported file type for {model_name} at {url}")
-                continue
+    if parse_workers <= 1 or len(work) <= 1:
+        extracted = {}
+        for url, response, cached in work:
+            result = _extract_in_process(url, response, cached, models_by_url[url], current_timestamp, cache, report)
+            if result is not None:
+                extracted[url] = result
+    else:
+        extracted = _extract_in_pool(work, models_by_url, current_timestamp, cache, parse_workers, report)
 
-        except requests.exceptions.RequestException as e:
-            print(f"Could not fetch URL {url} for {model_name}. Error: {e}. Skipping.")
-        except Exception as e:
-            # Catch other potential errors during file processing
-            print(f"An error occurred while processing the file for {model_name}. Error: {e}. Skipping.")
+    for url, _, cached in work:
+        if url not in extracted:
+            continue
+        _record_extraction(url, extracted[url], models_by_url[url], report)
+        if cached and not extracted[url]['decoded']:
+            # A corrupt copy would be revalidated with a 304 on every run; dropping it makes the next GET unconditional
+            logger.warning("Cached copy of %s could not be decoded. Dropped it; the next run downloads it again.", url)
+            cache.invalidate(url)
+            report.count('cache_invalidations', source=url)
+
+    # Collect the rows in input order; each source's rows are in the order of its models
+    all_scores = []
+    positions = dict.fromkeys(extracted, 0)
+    for model_name, url, param_B, country in jobs:
+        rows = extracted.get(url, {}).get('rows')
+        if rows is None:
+            continue
+        model_rows = rows[positions[url]]
+        positions[url] += 1
+        if model_rows is None:
+            continue
+        all_scores.extend(model_rows)
+        report.count('rows_emitted', len(model_rows), source=url)
+        if not model_rows:
+            report.count('models_unmatched', source=url)
+
+    if cache is not None:
+        cache.flush()
+        logger.info("Response cache: %d hits, %d misses, %d evictions",
+                    cache.stats['hits'], cache.stats['misses'], cache.stats['evictions'])
+        report.count('cache_evictions', cache.stats['evictions'])
 
     # After processing all models, create a final DataFrame and save to CSV
     if all_scores:
-        output_df = pd.DataFrame(all_scores)
-        # Ensure columns are in the desired order
-        output_df = output_df[['model_name', 'benchmark_name', 'score', 'param_B', 'country', 'updated_at']]
-        output_df.to_csv(output_csv_path, index=False)
-        print(f"\nSuccessfully wrote {len(output_df)} scores to {output_csv_path}")
+        with report.span('write'):
+            output_df = pd.DataFrame.from_records(all_scores, columns=SCORE_COLUMNS)
+            if incremental:
+                stats = upsert_scores(output_csv_path, output_df)
+                logger.info("Successfully upserted %d scores into %s: %d new, %d changed, %d unchanged",
+                            len(output_df), output_csv_path, stats['inserted'], stats['updated'], stats['unchanged'])
+                for key in ('inserted', 'updated', 'unchanged'):
+                    report.count(f"rows_{key}", stats[key])
+            else:
+                output_df.to_csv(output_csv_path, index=False)
+                logger.info("Successfully wrote %d scores to %s", len(output_df), output_csv_path)
+        if parquet_dir:
+            with report.span('write_parquet'):
+                if incremental:
+                    # A missing dataset is built from the whole store, not just this run's changes
+                    partitions = stats['changed_partitions'] if os.path.isdir(parquet_dir) else None
+                    if partitions is None or partitions:
+                        write_scores_parquet(stats['scores'], parquet_dir, partitions=partitions)
+                else:
+                    write_scores_parquet(output_df, parquet_dir)
+        if history_dir:
+            try:
+                with report.span('history'):
+                    history_stats = ScoreHistory(history_dir).append(output_df, current_timestamp)
+            except ValueError as e:
+                # E.g. a second run within the same second, or a clock that went back; the stores
+                # above are already written, so the run still succeeds without a history entry
+                logger.warning("Could not add this run to the score history in %s. Error: %s. Skipping.",
+                               history_dir, e)
+                report.fail('history:out_of_order', history_dir, e)
+            else:
+                logger.info("Score history in %s: %d of %d scores changed",
+                            history_dir, history_stats['changed'], history_stats['observed'])
+                report.count('history_changes', history_stats['changed'])
     else:
-        print("\nNo scores were extracted. Output file not created.")
+        logger.warning("No scores were extracted. Output file not created.")
+
+    report.finish()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch benchmark scores for the models in models.csv.")
+    parser.add_argument('--models', default='models.csv', help="Input CSV of models.")
+    parser.add_argument('--output', default='scores.csv', help="Scores CSV to upsert into.")
+    parser.add_argument('--parquet-dir', default='scores_parquet', help="Parquet copy of the scores.")
+    parser.add_argument('--history-dir', default='score_history', help="Append-only history of the scores.")
+    parser.add_argument('--parse-workers', type=int, default=DEFAULT_PARSE_WORKERS,
+                        help="Processes that decode and match the fetched files; 1 (the default) parses in this "
+                             "process, more only pays off for large documents on several cores.")
+    parser.add_argument('--report', help="Write the run report as JSON to this path.")
+    parser.add_argument('--metrics', help="Write the run report as Prometheus text to this path.")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="DEBUG also logs every model and score.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+    report = fetch_and_process_benchmarks(args.models, args.output, parquet_dir=args.parquet_dir,
+                                          history_dir=args.history_dir, parse_workers=args.parse_workers)
+    if args.report:
+        report.write_json(args.report)
+    if args.metrics:
+        report.write_prometheus(args.metrics)
+
 
 if __name__ == '__main__':
-    # Assuming 'models.csv' is in the same directory as the script
-    fetch_and_process_benchmarks('models.csv', 'scores.csv')
\ No newline at end of file
+    main()
@@ -0,0 +1,136 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Prefix of every metric in the Prometheus text output
+METRIC_PREFIX = 'etl'
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def _label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class RunReport:
+    """
+    Timings, counters and failures of one ETL run, overall and per source.
+
+    Stages are timed with `span`, events are counted with `count` and failures
+    are recorded under a category with `fail`. Everything is thread-safe, so the
+    fetch workers can report into the same instance. The report is written as
+    JSON with `write_json` or as Prometheus text with `write_prometheus`.
+    """
+
+    def __init__(self):
+        self.started_at = _now()
+        self.finished_at = None
+        self._start = time.perf_counter()
+        self._seconds = None
+        self._lock = threading.Lock()
+        self.stages = {}     # stage -> {'seconds', 'calls'}
+        self.counters = {}   # name -> total
+        self.failures = {}   # category -> count
+        self.sources = {}    # source -> {'stages', 'counters', 'failures'}
+
+    def _source(self, source: str) -> dict:
+        if source not in self.sources:
+            self.sources[source] = {'stages': {}, 'counters': {}, 'failures': []}
+        return self.sources[source]
+
+    @contextmanager
+    def span(self, stage: str, source: str = None):
+        """Times the enclosed block under `stage`, and under `source` too if one is given."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, source)
+
+    def record(self, stage: str, seconds: float, source: str = None):
+        """Adds time measured elsewhere, e.g. in a worker process, to `stage`."""
+        with self._lock:
+            totals = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+            totals['seconds'] += seconds
+            totals['calls'] += 1
+            if source is not None:
+                stages = self._source(source)['stages']
+                stages[stage] = stages.get(stage, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1, source: str = None):
+        """Adds `n` to the counter `name`, and to the source's own counter if one is given."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+            if source is not None:
+                counters = self._source(source)['counters']
+                counters[name] = counters.get(name, 0) + n
+
+    def fail(self, category: str, source: str = None, error=None):
+        """Records a failure, e.g. 'fetch:HTTPError' or 'decode:json', with an optional error message."""
+        with self._lock:
+            self.failures[category] = self.failures.get(category, 0) + 1
+            if source is not None:
+                entry = {'category': category}
+                if error is not None:
+                    entry['error'] = str(error)
+                self._source(source)['failures'].append(entry)
+
+    def finish(self):
+        """Stops the run clock. Called by the writers if it hasn't been already."""
+        if self._seconds is None:
+            self._seconds = time.perf_counter() - self._start
+            self.finished_at = _now()
+
+    def to_dict(self) -> dict:
+        """The report as a JSON-serializable dict."""
+        self.finish()
+        with self._lock:
+            return json.loads(json.dumps({
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'seconds': self._seconds,
+                'stages': self.stages,
+                'counters': self.counters,
+                'failures': self.failures,
+                'sources': self.sources,
+            }))
+
+    def write_json(self, path):
+        """Writes the report as an indented JSON document."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    def to_prometheus(self) -> str:
+        """The report in the Prometheus text exposition format, e.g. for the node exporter's textfile collector."""
+        report = self.to_dict()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_run_seconds Wall time of the whole run.",
+            f"# TYPE {METRIC_PREFIX}_run_seconds gauge",
+            f"{METRIC_PREFIX}_run_seconds {report['seconds']:.6f}",
+            f"# HELP {METRIC_PREFIX}_stage_seconds Wall time spent in each stage, summed over sources and threads.",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds gauge",
+        ]
+        lines += [f'{METRIC_PREFIX}_stage_seconds{{stage="{_label(stage)}"}} {totals["seconds"]:.6f}'
+                  for stage, totals in report['stages'].items()]
+        lines += [f"# TYPE {METRIC_PREFIX}_source_stage_seconds gauge"]
+        lines += [f'{METRIC_PREFIX}_source_stage_seconds{{source="{_label(source)}",stage="{_label(stage)}"}} '
+                  f'{seconds:.6f}'
+                  for source, entry in report['sources'].items() for stage, seconds in entry['stages'].items()]
+        for name, total in report['counters'].items():
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {total}"]
+        lines += [f"# TYPE {METRIC_PREFIX}_failures_total counter"]
+        lines += [f'{METRIC_PREFIX}_failures_total{{category="{_label(category)}"}} {count}'
+                  for category, count in report['failures'].items()]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Writes the report as Prometheus text, replacing the file atomically so a scraper never sees half of it."""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_text(self.to_prometheus())
+        tmp_path.replace(path)
@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from score_store import KEY_COLUMNS, VALUE_COLUMNS, _same_values
+
+# Where fetch_and_process_benchmarks keeps the score history when asked to
+DEFAULT_HISTORY_DIR = 'score_history'
+# A checkpoint of the full state is written after this many runs that changed something
+CHECKPOINT_EVERY = 30
+# Segments are sorted by model and benchmark, so small row groups let a model filter skip most of a file
+ROW_GROUP_SIZE = 16 * 1024
+
+HISTORY_COLUMNS = KEY_COLUMNS + VALUE_COLUMNS + ['observed_at']
+_SCHEMA = pa.schema([
+    ('model_name', pa.string()),
+    ('benchmark_name', pa.string()),
+    ('score', pa.float64()),
+    ('param_B', pa.float64()),
+    ('country', pa.string()),
+    ('observed_at', pa.timestamp('us', tz='UTC')),
+])
+
+
+def _timestamp(value) -> pd.Timestamp:
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+
+
+def _stamp(timestamp: pd.Timestamp) -> str:
+    return timestamp.strftime('%Y%m%dT%H%M%S%fZ')
+
+
+def _latest_per_key(frames: list) -> pd.DataFrame:
+    """The last observation of every (model_name, benchmark_name) in `frames`, sorted by key."""
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return _SCHEMA.empty_table().to_pandas()
+    history = pd.concat(frames, ignore_index=True).sort_values('observed_at', kind='stable')
+    return history.drop_duplicates(KEY_COLUMNS, keep='last').sort_values(KEY_COLUMNS, ignore_index=True)
+
+
+class ScoreHistory:
+    """
+    An append-only history of score observations, stored as Parquet segments.
+
+    Each `append` records only the scores that are new or changed since the
+    previous run, so a night where nothing moved costs nothing. Every
+    CHECKPOINT_EVERY such runs, the segments written since the last checkpoint
+    are compacted into one, and the full state (every score with the time it
+    last changed) is written next to it as a checkpoint. Rows inside a segment
+    are sorted by (model_name, benchmark_name, observed_at).
+
+    That bounds what the queries read: `as_of` reads the latest checkpoint
+    before the date plus at most one period of changes, and `trend` reads only
+    the row groups whose model range can hold the model it asks for. A
+    manifest lists the segments with their time ranges, so neither lists the
+    directory or opens a segment it doesn't need.
+    """
+
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, history_dir: str = DEFAULT_HISTORY_DIR, checkpoint_every: int = CHECKPOINT_EVERY):
+        self.history_dir = Path(history_dir)
+        self.checkpoint_every = checkpoint_every
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self._segments = self._read_manifest()
+        self._latest = None
+
+    def _read_manifest(self) -> list:
+        try:
+            with open(self.history_dir / self.MANIFEST_FILE, encoding='utf-8') as f:
+                return json.load(f)['segments']
+        except FileNotFoundError:
+            return []
+
+    def _write_manifest(self):
+        tmp_path = self.history_dir / (self.MANIFEST_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'segments': self._segments}, f, indent=1)
+        os.replace(tmp_path, self.history_dir / self.MANIFEST_FILE)
+
+    def _write_segment(self, rows: pd.DataFrame, kind: str, first: pd.Timestamp, last: pd.Timestamp) -> dict:
+        name = f"{kind}-{_stamp(first)}-{_stamp(last)}.parquet"
+        rows = rows[HISTORY_COLUMNS].sort_values(KEY_COLUMNS + ['observed_at'], kind='stable')
+        pq.write_table(pa.Table.from_pandas(rows, schema=_SCHEMA, preserve_index=False), self.history_dir / name,
+                       row_group_size=ROW_GROUP_SIZE, compression='zstd', use_dictionary=True)
+        return {'file': name, 'kind': kind, 'first': first.isoformat(), 'last': last.isoformat(), 'rows': len(rows)}
+
+    def _read(self, segments: list, filters: list = None) -> list:
+        return [pq.read_table(self.history_dir / segment['file'], filters=filters or None).to_pandas()
+                for segment in segments]
+
+    @property
+    def last_observed(self):
+        """Time of the most recent observation that changed something, or None if the history is empty."""
+        return _timestamp(self._segments[-1]['last']) if self._segments else None
+
+    def append(self, scores: pd.DataFrame, observed_at=None) -> dict:
+        """
+        Records one run's scores, keeping only those that are new or differ from the last observation.
+
+        Scores missing from `scores` are not recorded as removed; they keep their
+        last observed value, as in scores.csv.
+
+        Args:
+            scores (pd.DataFrame): Rows in the score_store.SCORE_COLUMNS schema; updated_at is ignored.
+            observed_at: Time of the run (anything pd.Timestamp accepts, UTC if naive). Defaults to now.
+                It must be later than the last observation in the history.
+
+        Returns:
+            dict: Counts of 'observed', 'changed' and 'unchanged' scores.
+        """
+        observed_at = _timestamp(observed_at if observed_at is not None else pd.Timestamp.now(tz='UTC'))
+        if self.last_observed is not None and observed_at <= self.last_observed:
+            raise ValueError(f"observed_at {observed_at} is not after the last observation {self.last_observed}")
+
+        scores = scores[KEY_COLUMNS + VALUE_COLUMNS].drop_duplicates(KEY_COLUMNS, keep='last')
+        scores = scores.astype({'score': float, 'param_B': float, 'country': object})
+        merged = scores.merge(self.as_of(), on=KEY_COLUMNS, how='left', suffixes=('', '_old'), indicator=True)
+        unchanged = (merged['_merge'] == 'both').to_numpy()
+        for column in VALUE_COLUMNS:
+            unchanged &= _same_values(merged[column], merged[f"{column}_old"]).to_numpy()
+        changes = merged.loc[~unchanged, KEY_COLUMNS + VALUE_COLUMNS].assign(observed_at=observed_at)
+        stats = {'observed': len(scores), 'changed': len(changes), 'unchanged': int(unchanged.sum())}
+        if changes.empty:
+            return stats
+
+        self._segments.append(self._write_segment(changes, 'changes', observed_at, observed_at))
+        self._write_manifest()
+        self._latest = _latest_per_key([self._latest, changes])
+        since_checkpoint = [segment for segment in self._segments_since_checkpoint() if segment['kind'] == 'changes']
+        if len(since_checkpoint) >= self.checkpoint_every:
+            self._checkpoint(since_checkpoint)
+        return stats
+
+    def _segments_since_checkpoint(self) -> list:
+        for i in range(len(self._segments) - 1, -1, -1):
+            if self._segments[i]['kind'] == 'checkpoint':
+                return self._segments[i + 1:]
+        return self._segments
+
+    def _checkpoint(self, segments: list):
+        """Compacts `segments` into one and writes the current state as a checkpoint after it."""
+        first, last = _timestamp(segments[0]['first']), _timestamp(segments[-1]['last'])
+        checkpoint = self._write_segment(self.as_of(), 'checkpoint', last, last)
+        if len(segments) == 1:
+            self._segments.append(checkpoint)
+            self._write_manifest()
+            return
+        compacted = self._write_segment(pd.concat(self._read(segments), ignore_index=True), 'changes', first, last)
+        self._segments = self._segments[:-len(segments)] + [compacted, checkpoint]
+        self._write_manifest()
+        # The compacted copy is in the manifest now, so the originals can go
+        for segment in segments:
+            (self.history_dir / segment['file']).unlink(missing_ok=True)
+
+    def as_of(self, when=None, models=None, benchmarks=None) -> pd.DataFrame:
+        """
+        The leaderboard as it stood at `when`: the last observation of every score up to then.
+
+        Args:
+            when: Point in time (anything pd.Timestamp accepts, UTC if naive). Defaults to the latest state.
+            models (str | list[str]): Only return these models.
+            benchmarks (str | list[str]): Only return these benchmarks.
+
+        Returns:
+            pd.DataFrame: HISTORY_COLUMNS, one row per (model_name, benchmark_name), with
+                observed_at the time the score last changed.
+        """
+        if when is None and models is None and benchmarks is None and self._latest is not None:
+            return self._latest.copy()
+
+        when = _timestamp(when) if when is not None else None
+        segments = [segment for segment in self._segments if when is None or _timestamp(segment['first']) <= when]
+        checkpoints = [i for i, segment in enumerate(segments) if segment['kind'] == 'checkpoint']
+        if checkpoints:
+            segments = segments[checkpoints[-1]:]
+
+        filters = []
+        if models is not None:
+            filters.append(('model_name', 'in', [models] if isinstance(models, str) else list(models)))
+        if benchmarks is not None:
+            filters.append(('benchmark_name', 'in', [benchmarks] if isinstance(benchmarks, str) else list(benchmarks)))
+        if when is not None:
+            filters.append(('observed_at', '<=', when.to_pydatetime()))
+        latest = _latest_per_key(self._read(segments, filters))
+        if when is None and not filters:
+            self._latest = latest.copy()
+        return latest
+
+    def trend(self, model_name: str, benchmarks=None) -> pd.DataFrame:
+        """
+        Every recorded change of one model's scores, oldest first within each benchmark.
+
+        Args:
+            model_name (str): The model to follow.
+            benchmarks (str | list[str]): Only return these benchmarks.
+
+        Returns:
+            pd.DataFrame: HISTORY_COLUMNS, sorted by benchmark_name and observed_at.
+        """
+        filters = [('model_name', '==', model_name)]
+        if benchmarks is not None:
+            filters.append(('benchmark_name', 'in', [benchmarks] if isinstance(benchmarks, str) else list(benchmarks)))
+        changes = [segment for segment in self._segments if segment['kind'] == 'changes']
+        frames = [frame for frame in self._read(changes, filters) if len(frame)]
+        if not frames:
+            return _latest_per_key([])
+        return pd.concat(frames, ignore_index=True).sort_values(['benchmark_name', 'observed_at'], ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill the score history from saved copies of scores.csv.")
+    parser.add_argument('snapshots', nargs='+', help="scores.csv copies, e.g. scores_backup_2025-06-30_2325.csv.")
+    parser.add_argument('--history-dir', default=DEFAULT_HISTORY_DIR)
+    args = parser.parse_args(argv)
+
+    history = ScoreHistory(args.history_dir)
+    # Each copy is dated by its newest updated_at, and they are replayed oldest first
+    snapshots = [(_timestamp(scores['updated_at'].max()), path, scores)
+                 for path, scores in ((path, pd.read_csv(path)) for path in args.snapshots)]
+    for observed_at, path, scores in sorted(snapshots, key=lambda snapshot: snapshot[0]):
+        if history.last_observed is not None and observed_at <= history.last_observed:
+            print(f"{path}: skipped, not newer than the history ({observed_at})")
+            continue
+        stats = history.append(scores, observed_at)
+        print(f"{path}: {stats['changed']} of {stats['observed']} scores changed ({observed_at})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Column order of scores.csv, and the columns that identify a score
+SCORE_COLUMNS = ['model_name', 'benchmark_name', 'score', 'param_B', 'country', 'updated_at']
+KEY_COLUMNS = ['model_name', 'benchmark_name']
+VALUE_COLUMNS = ['score', 'param_B', 'country']
+
+# Layout of the Parquet copy of the score store
+PARTITION_COLUMNS = ['benchmark_name', 'country']
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+_PARTITIONING = ds.partitioning(
+    pa.schema([('benchmark_name', pa.string()), ('country', pa.string())]),
+    flavor='hive',
+)
+# Partition values are read as plain strings: Arrow can't unify inferred partition dictionaries when
+# one of them is the null (__HIVE_DEFAULT_PARTITION__) partition, e.g. scores without a country.
+# load_scores dictionary-encodes them once the table is read, and string columns are read as
+# dictionaries, so neither materializes as Python strings.
+_READ_PARTITIONING = ds.HivePartitioning.discover()
+_READ_FORMAT = ds.ParquetFileFormat(read_options=ds.ParquetReadOptions(dictionary_columns=['model_name', 'updated_at']))
+
+
+def _same_values(a: pd.Series, b: pd.Series) -> pd.Series:
+    """Compares two columns element-wise, treating 75 and 75.0 (and NaN and NaN) as equal."""
+    a_num = pd.to_numeric(a, errors='coerce')
+    b_num = pd.to_numeric(b, errors='coerce')
+    numeric = a_num.notna() & b_num.notna()
+    both_missing = a.isna() & b.isna()
+    same_text = a.astype(str) == b.astype(str)
+    return (numeric & (a_num == b_num)) | (~numeric & (same_text | both_missing))
+
+
+def _write_atomically(df: pd.DataFrame, path: Path):
+    tmp_path = path.with_name(path.name + '.tmp')
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _append_atomically(df: pd.DataFrame, path: Path):
+    # The rows go onto a copy that replaces the file, so a reader never sees a half-written line;
+    # a file left without its final newline, e.g. by an older interrupted append, gets one first
+    tmp_path = path.with_name(path.name + '.tmp')
+    shutil.copyfile(path, tmp_path)
+    with open(tmp_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+    df.to_csv(tmp_path, mode='a', header=False, index=False)
+    os.replace(tmp_path, path)
+
+
+def _partitions_of(scores: pd.DataFrame) -> set:
+    return set(scores[PARTITION_COLUMNS].astype(object).where(scores[PARTITION_COLUMNS].notna(), None)
+               .itertuples(index=False, name=None))
+
+
+def upsert_scores(store_path: str, new_scores: pd.DataFrame) -> dict:
+    """
+    Merges freshly extracted scores into an existing scores.csv.
+
+    Rows are keyed on (model_name, benchmark_name). A score whose values did not
+    change keeps the `updated_at` it already had; changed scores take the new
+    timestamp, and scores missing from this run are kept as they are. The file is
+    only touched when something changed: new scores alone are appended to the end,
+    and the file is rewritten in order only when existing scores changed. Either
+    way the new file replaces the old one atomically.
+
+    Args:
+        store_path (str): Path of the scores CSV to update. It is created if missing.
+        new_scores (pd.DataFrame): Rows in the SCORE_COLUMNS schema from the current run.
+
+    Returns:
+        dict: Counts of 'inserted', 'updated' and 'unchanged' rows, the set of
+            (benchmark_name, country) 'changed_partitions' those rows fall into or moved out of,
+            and the whole updated store as 'scores', so callers needn't read the file back.
+    """
+    store_path = Path(store_path)
+    new_scores = new_scores[SCORE_COLUMNS].drop_duplicates(KEY_COLUMNS, keep='last')
+
+    if not store_path.is_file():
+        _write_atomically(new_scores, store_path)
+        return {'inserted': len(new_scores), 'updated': 0, 'unchanged': 0,
+                'changed_partitions': _partitions_of(new_scores), 'scores': new_scores}
+
+    existing = pd.read_csv(store_path).drop_duplicates(KEY_COLUMNS, keep='last')
+    merged = new_scores.merge(existing, on=KEY_COLUMNS, how='left', suffixes=('', '_old'), indicator=True)
+    is_new = (merged['_merge'] == 'left_only').to_numpy()
+    unchanged = ~is_new
+    for column in VALUE_COLUMNS:
+        unchanged &= _same_values(merged[column], merged[f"{column}_old"]).to_numpy()
+    is_changed = ~is_new & ~unchanged
+
+    # A score that moved to another country also leaves its old partition, which has to be rewritten without it
+    old_partitions = merged.loc[is_changed, ['benchmark_name', 'country_old']].rename(columns={'country_old': 'country'})
+    stats = {'inserted': int(is_new.sum()), 'updated': int(is_changed.sum()), 'unchanged': int(unchanged.sum()),
+             'changed_partitions': _partitions_of(merged.loc[is_new | is_changed]) | _partitions_of(old_partitions)}
+
+    if is_changed.any():
+        # Update changed rows in place and append new ones, keeping the existing order
+        store = existing[SCORE_COLUMNS].set_index(KEY_COLUMNS)
+        changed_rows = merged.loc[is_changed, SCORE_COLUMNS].set_index(KEY_COLUMNS)
+        store = store.astype({column: object for column in store.columns})
+        store.loc[changed_rows.index, changed_rows.columns] = changed_rows
+        store = pd.concat([store.reset_index(), merged.loc[is_new, SCORE_COLUMNS]], ignore_index=True)
+        stats['scores'] = store[SCORE_COLUMNS].infer_objects()
+        _write_atomically(stats['scores'], store_path)
+    elif is_new.any():
+        _append_atomically(merged.loc[is_new, SCORE_COLUMNS], store_path)
+        stats['scores'] = pd.concat([existing[SCORE_COLUMNS], merged.loc[is_new, SCORE_COLUMNS]], ignore_index=True)
+    else:
+        stats['scores'] = existing[SCORE_COLUMNS]
+
+    return stats
+
+
+def _remove_partition(dataset_dir: str, partition: tuple):
+    expression = None
+    for column, value in zip(PARTITION_COLUMNS, partition):
+        condition = ds.field(column).is_null() if value is None else ds.field(column) == value
+        expression = condition if expression is None else expression & condition
+    shutil.rmtree(Path(dataset_dir) / _PARTITIONING.format(expression)[0], ignore_errors=True)
+
+
+def write_scores_parquet(scores: pd.DataFrame, dataset_dir: str, partitions: set = None):
+    """
+    Writes scores to a Parquet dataset partitioned by benchmark_name and country.
+
+    Each partition directory (e.g. benchmark_name=CCBench/country=CN) is replaced
+    as a whole, so passing `partitions` rewrites just those and leaves the rest of
+    the dataset alone; without it the whole dataset is replaced. String columns
+    are dictionary-encoded on disk.
+
+    Args:
+        scores (pd.DataFrame): Rows in the SCORE_COLUMNS schema.
+        dataset_dir (str): Root directory of the dataset. It is created if missing.
+        partitions (set): Optional (benchmark_name, country) pairs to write; defaults to every partition in `scores`.
+    """
+    scores = scores[SCORE_COLUMNS]
+    if partitions is None:
+        shutil.rmtree(dataset_dir, ignore_errors=True)
+    else:
+        if not partitions:
+            return
+        wanted = pd.MultiIndex.from_tuples(sorted(partitions, key=str), names=PARTITION_COLUMNS)
+        scores = scores[pd.MultiIndex.from_frame(scores[PARTITION_COLUMNS].astype(object)
+                                                 .where(scores[PARTITION_COLUMNS].notna(), None)).isin(wanted)]
+        # Partitions left without rows, e.g. after their only score moved to another country,
+        # are not touched by write_dataset, so they are removed here
+        for partition in partitions - _partitions_of(scores):
+            _remove_partition(dataset_dir, partition)
+        if scores.empty:
+            return
+
+    # Strings go in as plain arrays: an Arrow dictionary would be written whole into every partition,
+    # while Parquet's own dictionary encoding only keeps the values each file uses
+    table = pa.Table.from_pandas(scores, preserve_index=False)
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format='parquet',
+        partitioning=_PARTITIONING,
+        existing_data_behavior='delete_matching',
+        max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+        min_rows_per_group=min(PARQUET_ROW_GROUP_SIZE, max(1, len(scores))),
+        file_options=ds.ParquetFileFormat().make_write_options(use_dictionary=True, compression='zstd'),
+    )
+
+
+def _as_list(values) -> list:
+    return [values] if isinstance(values, str) else list(values)
+
+
+def load_scores(dataset_dir: str, benchmarks=None, countries=None, models=None, columns: list = None) -> pd.DataFrame:
+    """
+    Loads scores from the Parquet dataset, reading only what the filters select.
+
+    Benchmark and country filters prune whole partition directories, so only the
+    row groups of the matching partitions are read; the model filter is applied
+    while scanning. String columns come back as pandas categoricals.
+
+    Args:
+        dataset_dir (str): Root directory written by write_scores_parquet.
+        benchmarks (str | list[str]): Only load these benchmarks.
+        countries (str | list[str]): Only load these countries.
+        models (str | list[str]): Only load these models.
+        columns (list[str]): Columns to load; defaults to SCORE_COLUMNS.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+    """
+    dataset = ds.dataset(dataset_dir, format=_READ_FORMAT, partitioning=_READ_PARTITIONING)
+    conditions = []
+    for column, values in (('benchmark_name', benchmarks), ('country', countries), ('model_name', models)):
+        if values is not None:
+            conditions.append(ds.field(column).isin(_as_list(values)))
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    table = dataset.to_table(columns=columns or SCORE_COLUMNS, filter=expression)
+    for column in PARTITION_COLUMNS:
+        if column in table.column_names:
+            table = table.set_column(table.column_names.index(column), column, table[column].dictionary_encode())
+    return table.to_pandas()
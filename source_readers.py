@@ -0,0 +1,144 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Column names recognised in remote CSV / Parquet leaderboards
+MODEL_COLUMNS = ('model_name', 'model', 'Model', 'model_key', 'fullname', 'eval_name')
+BENCHMARK_COLUMNS = ('benchmark_name', 'benchmark', 'Benchmark')
+SCORE_COLUMNS = ('score', 'Score', 'Overall', 'value')
+
+CSV_CHUNK_ROWS = 50_000
+CSV_SAMPLE_ROWS = 1_000
+PARQUET_BATCH_ROWS = 50_000
+
+
+def _find_column(columns, candidates):
+    for candidate in candidates:
+        if candidate in columns:
+            return candidate
+    return None
+
+
+def _is_numeric(data_type) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_decimal(data_type)
+
+
+def _has_values(row_group, columns) -> bool:
+    """Whether a Parquet row group may hold a non-null value in each of `columns`, going by its statistics."""
+    for i in range(row_group.num_columns):
+        chunk = row_group.column(i)
+        if chunk.path_in_schema in columns and chunk.is_stats_set and chunk.statistics.has_null_count \
+                and chunk.statistics.null_count == row_group.num_rows:
+            return False
+    return True
+
+
+def _layout(columns):
+    """
+    Works out how a tabular leaderboard is laid out from its header.
+
+    Returns:
+        tuple: (model_column, benchmark_column, score_column). The last two are None
+            for a wide table with one numeric column per benchmark. Everything is None
+            if there is no recognisable model column.
+    """
+    columns = list(columns)
+    model_column = _find_column(columns, MODEL_COLUMNS)
+    benchmark_column = _find_column(columns, BENCHMARK_COLUMNS)
+    score_column = _find_column(columns, SCORE_COLUMNS)
+    if model_column is None:
+        return None, None, None
+    if benchmark_column is None or score_column is None:
+        return model_column, None, None
+    return model_column, benchmark_column, score_column
+
+
+def _add_rows(results: dict, frame: pd.DataFrame, model_column, benchmark_column, score_column):
+    """Folds one chunk of rows into the model_key -> {benchmark_name: {'Overall': score}} mapping."""
+    if benchmark_column is not None:
+        long_rows = frame[[model_column, benchmark_column, score_column]]
+    else:
+        # Wide layout: every numeric column is a benchmark
+        numeric = frame.drop(columns=[model_column]).select_dtypes('number')
+        long_rows = (pd.concat([frame[[model_column]], numeric], axis=1)
+                     .melt(id_vars=model_column, var_name='benchmark_name', value_name='score'))
+        benchmark_column, score_column = 'benchmark_name', 'score'
+
+    long_rows = long_rows.assign(**{score_column: pd.to_numeric(long_rows[score_column], errors='coerce')})
+    long_rows = long_rows.dropna(subset=[model_column, benchmark_column, score_column])
+    for model_key, benchmark_name, score in long_rows.itertuples(index=False, name=None):
+        results.setdefault(str(model_key), {})[str(benchmark_name)] = {'Overall': float(score)}
+
+
+def read_csv_source(file, chunk_rows: int = CSV_CHUNK_ROWS) -> dict:
+    """
+    Reads a CSV leaderboard in chunks, loading only the columns that carry scores.
+
+    Both long tables (model, benchmark, score columns) and wide tables (a model
+    column plus one numeric column per benchmark) are understood.
+
+    Args:
+        file: A binary file object positioned at the start of the CSV.
+        chunk_rows (int): Number of rows parsed at a time.
+
+    Returns:
+        dict: The model_key -> {benchmark_name: {'Overall': score}} mapping, the same
+            shape parse_benchmark_file returns for JSON sources.
+    """
+    start = file.tell()
+    header = pd.read_csv(file, nrows=0).columns
+    file.seek(start)
+    model_column, benchmark_column, score_column = _layout(header)
+    if model_column is None:
+        return {}
+
+    if benchmark_column is not None:
+        usecols = [model_column, benchmark_column, score_column]
+    else:
+        # Wide layout: the benchmark columns are the numeric ones, which a sample of rows tells apart
+        sample = pd.read_csv(file, nrows=CSV_SAMPLE_ROWS)
+        file.seek(start)
+        usecols = [model_column] + list(sample.drop(columns=[model_column]).select_dtypes('number').columns)
+        if len(usecols) == 1:
+            return {}
+    results = {}
+    for chunk in pd.read_csv(file, usecols=usecols, chunksize=chunk_rows):
+        _add_rows(results, chunk, model_column, benchmark_column, score_column)
+    return results
+
+
+def read_parquet_source(file, batch_rows: int = PARQUET_BATCH_ROWS) -> dict:
+    """
+    Reads a Parquet leaderboard one row group at a time, decoding only the needed columns.
+
+    Row groups whose statistics show the model column, or a long table's score
+    column, to be entirely null are skipped without being read.
+
+    Args:
+        file: A seekable binary file object holding the Parquet file.
+        batch_rows (int): Maximum number of rows decoded at a time.
+
+    Returns:
+        dict: The model_key -> {benchmark_name: {'Overall': score}} mapping.
+    """
+    parquet_file = pq.ParquetFile(file)
+    schema = parquet_file.schema_arrow
+    model_column, benchmark_column, score_column = _layout(schema.names)
+    if model_column is None:
+        return {}
+
+    if benchmark_column is not None:
+        columns = [model_column, benchmark_column, score_column]
+    else:
+        columns = [model_column] + [field.name for field in schema
+                                    if field.name != model_column and _is_numeric(field.type)]
+
+    required = {model_column, score_column} - {None}
+    results = {}
+    for row_group in range(parquet_file.num_row_groups):
+        metadata = parquet_file.metadata.row_group(row_group)
+        if metadata.num_rows == 0 or not _has_values(metadata, required):
+            continue
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, row_groups=[row_group], columns=columns):
+            _add_rows(results, batch.to_pandas(), model_column, benchmark_column, score_column)
+    return results
@@ -0,0 +1,385 @@
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from leaderboard_chart import CHART_LABELS, CHART_TOP_N, chart_key, render_metric_chart
+from leaderboard_data import MODELS_PATH, SCORES_PATH, file_signature, load_leaderboard
+from leaderboard_frontier import FrontierIndex
+from leaderboard_index import SORT_ASCENDING, SORT_LABELS, LeaderboardIndex
+from leaderboard_table import ASSETS_DIR, PAGE_SIZE_OPTIONS, render_leaderboard_html
+from logo_cache import LOGO_DISPLAY_SIZE
+from run_report import RunReport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_DIR = 'static'
+# Worker processes that render pages and charts; 1 renders them in the calling process
+DEFAULT_EXPORT_WORKERS = os.cpu_count() or 1
+# Rows on each static page, like the dashboard's largest page; the CSV and JSON extracts hold the whole view
+DEFAULT_HTML_ROWS = max(PAGE_SIZE_OPTIONS)
+# Part of every fingerprint: bump it when the output changes, so the next export redoes every file
+EXPORT_VERSION = 2
+MANIFEST_FILE = 'manifest.json'
+
+# The dashboard's look, for pages served without Streamlit's theme
+PAGE_CSS = """
+<style>
+    :root {
+        --background-color: #0e1117;
+        --secondary-background-color: #262730;
+        --text-color: #fafafa;
+        --primary-color: #ff4b4b;
+        --muted: #a0a0a0;
+    }
+    body {
+        margin: 2rem 3rem;
+        background-color: var(--background-color);
+        color: var(--text-color);
+        font-family: "Source Sans Pro", sans-serif;
+    }
+    a { color: var(--primary-color); }
+    h1 { font-size: 2.8rem; font-weight: 700; text-align: center; }
+    .subtitle { text-align: center; color: var(--muted); font-size: 1.1rem; margin-bottom: 2rem; }
+    .table-header, .table-row { font-size: 0.9rem; }
+    .table-row { border-bottom: 1px solid var(--muted); }
+    .logo-img { max-width: %dpx; max-height: %dpx; }
+    .model-name { font-weight: 600; font-size: 1.1rem; }
+    .creator-name { font-size: 0.9rem; color: var(--muted); }
+    .metric-value { font-size: 1.1rem; font-weight: 500; text-align: right; }
+    .metric-unit { font-size: 0.8rem; color: var(--muted); text-align: right; }
+    .chart { max-width: 100%%; }
+</style>
+""" % LOGO_DISPLAY_SIZE
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{css}
+</head>
+<body>
+<h1>LLM Benchmark Visualizer</h1>
+<p class="subtitle">{subtitle}</p>
+{body}
+</body>
+</html>
+"""
+
+
+def _slug(*parts) -> str:
+    """File name stem for a view, e.g. ('All', 'Open Source', 'blended_price') -> 'all-open-source-blended-price'."""
+    return '-'.join(re.sub(r'[^a-z0-9]+', '-', str(part).lower()).strip('-') or 'none' for part in parts)
+
+
+def _write(path: Path, data):
+    """Writes a file atomically, so a server never reads a half-written page."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    if isinstance(data, bytes):
+        tmp_path.write_bytes(data)
+    else:
+        tmp_path.write_text(data, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _label(value) -> str:
+    return 'All' if value is None else str(value)
+
+
+def _page(title: str, subtitle: str, body: str) -> str:
+    return PAGE_TEMPLATE.format(title=html.escape(title), css=PAGE_CSS, subtitle=html.escape(subtitle), body=body)
+
+
+def render_chart(key: tuple, path: str) -> float:
+    """
+    Renders one Metric Visualiser chart to a PNG file.
+
+    Args:
+        key (tuple): chart_key of the plotted rows.
+        path (str): Where to write the PNG.
+
+    Returns:
+        float: Seconds spent.
+    """
+    start = time.perf_counter()
+    metric, names, values = key
+    _write(Path(path), render_metric_chart(pd.DataFrame({'model_name': names, metric: values}), metric))
+    return time.perf_counter() - start
+
+
+def render_view(frontier: FrontierIndex, view: dict, out_dir: str, html_rows: int = DEFAULT_HTML_ROWS) -> float:
+    """
+    Writes the HTML page and the CSV and JSON extracts of one (origin, type, sort_by) view.
+
+    The page shows the first `html_rows` models, with frontier badges as in the
+    dashboard, and the view's charts; the extracts hold every model of the view.
+
+    Args:
+        frontier (FrontierIndex): Index over the leaderboard frame.
+        view (dict): A view as planned by export_leaderboard.
+        out_dir (str): Export directory.
+        html_rows (int): Models shown on the page.
+
+    Returns:
+        float: Seconds spent.
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    filter_values = (view['origin'], view['type'])
+    rows = frontier.rows(filter_values, view['sort_by'])
+    df = frontier.index.df
+    view_df = df.iloc[rows]
+    extract = view_df.drop(columns='logo', errors='ignore')
+
+    _write(out_dir / view['csv'], extract.to_csv(index=False))
+    meta = {'origin': view['origin'], 'type': view['type'], 'sort_by': view['sort_by'], 'models': len(rows)}
+    _write(out_dir / view['json'],
+           '{"view": ' + json.dumps(meta) + ', "rows": ' + extract.to_json(orient='records', date_format='iso') + '}')
+
+    shown = rows[:html_rows]
+    table = render_leaderboard_html(df.iloc[shown], ASSETS_DIR, frontier.frontier_mask(filter_values)[shown])
+    links = (f"<p>Showing {len(shown):,} of {len(rows):,} models · "
+             f"<a href='{Path(view['csv']).name}'>CSV</a> · <a href='{Path(view['json']).name}'>JSON</a> · "
+             f"<a href='../index.html'>All views</a></p>")
+    charts = "".join(f"<h2>{html.escape(CHART_LABELS[metric])}</h2>"
+                     f"<img class='chart' src='../{chart}' alt='{html.escape(CHART_LABELS[metric])}'>"
+                     for metric, chart in view['charts'].items() if chart is not None)
+    title = f"{_label(view['origin'])} · {_label(view['type'])} · {SORT_LABELS[view['sort_by']]}"
+    _write(out_dir / view['html'], _page(title, title, links + table + charts))
+    return time.perf_counter() - start
+
+
+_worker_frontier = None
+
+
+def _init_worker(df: pd.DataFrame):
+    global _worker_frontier
+    _worker_frontier = FrontierIndex(LeaderboardIndex(df))
+
+
+def _render_view_in_worker(view: dict, out_dir: str, html_rows: int) -> float:
+    return render_view(_worker_frontier, view, out_dir, html_rows)
+
+
+def _plan(frontier: FrontierIndex, html_rows: int) -> tuple:
+    """
+    Every chart and view of the export, each with a fingerprint of what goes into it.
+
+    Charts are named by a hash of the bars they plot, so views that plot the
+    same bars share a file, whatever filters or sort produced them. A view's
+    fingerprint covers its models, in order and with every column, the charts
+    it shows and the logo files on its page.
+
+    Returns:
+        tuple: ({chart file: chart_key}, {slug: view}).
+    """
+    index = frontier.index
+    df = index.df
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    logo_signatures = {logo: file_signature(ASSETS_DIR / logo)[1:] for logo in df['logo'].dropna().unique()}
+    filters = [(origin, model_type) for origin in [None] + index.values('origin')
+               for model_type in [None] + index.values('type')]
+
+    charts, chart_files = {}, {}
+    for filter_values in filters:
+        for metric in CHART_LABELS:
+            top_df = df.iloc[frontier.rows(filter_values, metric)[:CHART_TOP_N]]
+            top_df = top_df[top_df[metric].notna()]
+            if top_df.empty:
+                chart_files[filter_values, metric] = None
+                continue
+            key = chart_key(top_df, metric)
+            name = "charts/" + hashlib.sha256(repr((EXPORT_VERSION, key)).encode()).hexdigest()[:20] + ".png"
+            charts[name] = key
+            chart_files[filter_values, metric] = name
+
+    views = {}
+    for filter_values in filters:
+        for sort_by in SORT_ASCENDING:
+            slug = _slug(*map(_label, filter_values), sort_by)
+            rows = frontier.rows(filter_values, sort_by)
+            view_charts = {metric: chart_files[filter_values, metric] for metric in CHART_LABELS}
+            logos = sorted({logo: logo_signatures[logo] for logo in df['logo'].iloc[rows[:html_rows]].dropna()}.items())
+            digest = hashlib.sha256(repr((EXPORT_VERSION, filter_values, sort_by, html_rows, view_charts,
+                                          logos)).encode())
+            digest.update(row_hashes[rows].tobytes())
+            views[slug] = {
+                'origin': None if filter_values[0] is None else str(filter_values[0]),
+                'type': None if filter_values[1] is None else str(filter_values[1]),
+                'sort_by': sort_by,
+                'html': f"views/{slug}.html", 'csv': f"views/{slug}.csv", 'json': f"views/{slug}.json",
+                'charts': view_charts,
+                'fingerprint': digest.hexdigest(),
+            }
+    return charts, views
+
+
+def _read_manifest(out_dir: Path) -> dict:
+    try:
+        with open(out_dir / MANIFEST_FILE, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'views': {}, 'charts': []}
+    return manifest if manifest.get('version') == EXPORT_VERSION else {'views': {}, 'charts': []}
+
+
+def _index_page(views: dict) -> str:
+    rows = "".join(
+        f"<tr><td>{html.escape(_label(view['origin']))}</td><td>{html.escape(_label(view['type']))}</td>"
+        f"<td><a href='{view['html']}'>{html.escape(SORT_LABELS[view['sort_by']])}</a></td>"
+        f"<td><a href='{view['csv']}'>CSV</a> · <a href='{view['json']}'>JSON</a></td></tr>"
+        for view in views.values())
+    table = ("<table><tr><th>Origin</th><th>Model Type</th><th>Sort By</th><th>Data</th></tr>" + rows + "</table>")
+    return _page("LLM Benchmark Visualizer", "Every view of the leaderboard, pre-rendered.", table)
+
+
+def export_leaderboard(df: pd.DataFrame, out_dir: str = DEFAULT_EXPORT_DIR, workers: int = DEFAULT_EXPORT_WORKERS,
+                       html_rows: int = DEFAULT_HTML_ROWS, force: bool = False, report: RunReport = None) -> RunReport:
+    """
+    Pre-renders every view of the leaderboard as static files, without a Streamlit server.
+
+    Each (origin, type, sort_by) combination the dashboard offers, with 'All'
+    for either filter, gets an HTML page, a CSV and a JSON extract under
+    `views/`, and each (origin, type, metric) chart a PNG under `charts/`,
+    filtered and sorted by the same LeaderboardIndex and FrontierIndex the
+    dashboard uses. `manifest.json` maps every combination to its files, and
+    `index.html` links them.
+
+    A view is rendered again only if its fingerprint (its models in order,
+    their values, its charts and logos) differs from the one recorded in the
+    manifest, and a chart only if its file is missing, so an export after an
+    ETL run that changed one model rewrites just the views that model is in.
+    Files of views and charts that no longer exist are removed. With more
+    than one worker and more than one file to render, rendering runs on a
+    pool of processes that each get a copy of the frame once.
+
+    Args:
+        df (pd.DataFrame): The leaderboard frame, as from load_leaderboard.
+        out_dir (str): Export directory; created if missing.
+        workers (int): Processes that render; 1 renders in this process.
+        html_rows (int): Models shown on each page.
+        force (bool): Render everything, whatever the manifest says.
+        report (RunReport): Report to record the export in; a new one is created if omitted.
+
+    Returns:
+        RunReport: Time spent planning and rendering, and counts of files rendered, skipped and removed.
+    """
+    report = report if report is not None else RunReport()
+    out_dir = Path(out_dir)
+    (out_dir / 'views').mkdir(parents=True, exist_ok=True)
+    (out_dir / 'charts').mkdir(exist_ok=True)
+
+    with report.span('plan'):
+        frontier = FrontierIndex(LeaderboardIndex(df))
+        charts, views = _plan(frontier, html_rows)
+        previous = {} if force else _read_manifest(out_dir)
+
+    chart_jobs = [(name, key) for name, key in charts.items() if force or not (out_dir / name).is_file()]
+    view_jobs = [view for slug, view in views.items()
+                 if previous.get('views', {}).get(slug, {}).get('fingerprint') != view['fingerprint']
+                 or not all((out_dir / view[kind]).is_file() for kind in ('html', 'csv', 'json'))]
+    report.count('charts_skipped', len(charts) - len(chart_jobs))
+    report.count('views_skipped', len(views) - len(view_jobs))
+    logger.info("Rendering %d of %d views and %d of %d charts into %s with up to %d workers...",
+                len(view_jobs), len(views), len(chart_jobs), len(charts), out_dir, workers)
+
+    # Charts first, so a view is only recorded once the charts it links to exist
+    failed = set()
+    with report.span('render'):
+        if workers <= 1 or len(chart_jobs) + len(view_jobs) <= 1:
+            for name, key in chart_jobs:
+                _record_render(report, 'chart', name, lambda: render_chart(key, str(out_dir / name)), failed)
+            for view in view_jobs:
+                _record_render(report, 'view', view['html'],
+                               lambda: render_view(frontier, view, str(out_dir), html_rows), failed)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(df,)) as pool:
+                futures = {pool.submit(render_chart, key, str(out_dir / name)): name for name, key in chart_jobs}
+                for future in as_completed(futures):
+                    _record_render(report, 'chart', futures[future], future.result, failed)
+                futures = {pool.submit(_render_view_in_worker, view, str(out_dir), html_rows): view['html']
+                           for view in view_jobs}
+                for future in as_completed(futures):
+                    _record_render(report, 'view', futures[future], future.result, failed)
+
+    with report.span('manifest'):
+        for view in views.values():
+            # Left without a fingerprint, so the next export tries it again
+            if view['html'] in failed or any(chart in failed for chart in view['charts'].values()):
+                view['fingerprint'] = None
+        removed = _remove_stale(out_dir, previous, views, charts)
+        report.count('files_removed', removed)
+        manifest = {'version': EXPORT_VERSION, 'views': views, 'charts': sorted(charts)}
+        _write(out_dir / MANIFEST_FILE, json.dumps(manifest, indent=1) + "\n")
+        _write(out_dir / 'index.html', _index_page(views))
+
+    report.finish()
+    logger.info("Rendered %d views and %d charts (%d and %d unchanged), removed %d stale files",
+                report.counters.get('views_rendered', 0), report.counters.get('charts_rendered', 0),
+                report.counters['views_skipped'], report.counters['charts_skipped'], removed)
+    return report
+
+
+def _record_render(report: RunReport, kind: str, name: str, render, failed: set):
+    """Runs or collects one render job and reports its time, or its failure."""
+    try:
+        report.record(f"render_{kind}", render(), name)
+    except Exception as e:
+        logger.warning("Failed to render %s. Error: %s. Skipping.", name, e)
+        report.fail(f"render:{type(e).__name__}", name, e)
+        failed.add(name)
+        return
+    report.count(f"{kind}s_rendered")
+
+
+def _remove_stale(out_dir: Path, previous: dict, views: dict, charts: dict) -> int:
+    """Deletes files the previous export wrote for views and charts this one no longer has."""
+    stale = [path for slug, view in previous.get('views', {}).items() if slug not in views
+             for path in (view['html'], view['csv'], view['json'])]
+    stale += [name for name in previous.get('charts', []) if name not in charts]
+    removed = 0
+    for path in stale:
+        try:
+            (out_dir / path).unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render every leaderboard view as static HTML, PNG, CSV and JSON.")
+    parser.add_argument('--scores', default=str(SCORES_PATH), help="Scores CSV written by process_benchmarks.py.")
+    parser.add_argument('--models', default=str(MODELS_PATH), help="Models CSV with per-model metadata.")
+    parser.add_argument('--out-dir', default=DEFAULT_EXPORT_DIR, help="Directory to write the static files to.")
+    parser.add_argument('--workers', type=int, default=DEFAULT_EXPORT_WORKERS,
+                        help="Processes that render pages and charts; 1 renders them in this process.")
+    parser.add_argument('--html-rows', type=int, default=DEFAULT_HTML_ROWS, help="Models shown on each page.")
+    parser.add_argument('--force', action='store_true', help="Render every file, even if its inputs did not change.")
+    parser.add_argument('--report', help="Write the run report as JSON to this path.")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="Logging verbosity.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+
+    if not Path(args.scores).is_file():
+        logger.error("No scores found at %s. Run process_benchmarks.py to collect them.", args.scores)
+        return 1
+    report = export_leaderboard(load_leaderboard(args.scores, args.models), args.out_dir, workers=args.workers,
+                                html_rows=args.html_rows, force=args.force)
+    if args.report:
+        report.write_json(args.report)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())